@@ -0,0 +1,65 @@
+"""
+Parallel Engine Scaling Benchmark
+
+Measures the time per generation of the `ParallelEngine` for a growing number of
+worker processes against the serial `NumpyEngine`, and checks that every run forms
+exactly the same world as the serial engine.
+
+Usage:
+------
+```
+python benchmarks/parallel_scaling.py --size 4000 --generations 20 --workers 1 2 4 8
+```
+"""
+
+import os
+import sys
+import time
+import random
+import argparse
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "game-of-life"))
+
+from engine import Engine, NumpyEngine, ParallelEngine  # noqa: E402
+
+
+def _time_per_generation(engine: Engine, generations: int) -> float:
+    engine.step()  # warm up, e.g. start the worker processes
+    start = time.perf_counter()
+    engine.advance(generations)
+    return (time.perf_counter() - start) / generations
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--size", type=int, default=4000, help="width and height")
+    parser.add_argument("--generations", type=int, default=20)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    world = [[rng.random() < 0.3 for _ in range(args.size)] for _ in range(args.size)]
+
+    serial = NumpyEngine(args.size, args.size)
+    serial.load(world)
+    baseline = _time_per_generation(serial, args.generations)
+    print(f"{'engine':>12} {'workers':>8} {'ms/gen':>10} {'speedup':>8}")
+    print(f"{'numpy':>12} {1:>8} {baseline * 1000:>10.2f} {1:>8.2f}")
+
+    for workers in args.workers:
+        engine = ParallelEngine(args.size, args.size, workers)
+        engine.load(world)
+        elapsed = _time_per_generation(engine, args.generations)
+        if engine.world != serial.world:
+            raise AssertionError(f"parallel world differs with {workers} workers")
+        engine.close()
+        print(
+            f"{'parallel':>12} {workers:>8} {elapsed * 1000:>10.2f}"
+            f" {baseline / elapsed:>8.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
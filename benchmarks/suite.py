@@ -0,0 +1,380 @@
+"""
+Benchmark Suite
+
+Measures the time of a step of every engine across world sizes and densities, of
+forming a generation of a game, of encoding and decoding every wire format, and of
+the `/life` endpoint through Flask's test client. The results are written as JSON;
+`compare` flags the benchmarks that got slower, or whose payloads got larger, than
+in a saved baseline and exits with status 1 if there are any.
+
+Every benchmark is warmed up, then timed over a number of rounds. A round calls it
+as often as it takes to run for at least `--min-time` seconds, so that fast steps
+are not dominated by the resolution of the clock, and the garbage collector is
+disabled while timing. Runs are compared by the median time of a call.
+
+Usage:
+------
+```
+python benchmarks/suite.py run --output baseline.json
+python benchmarks/suite.py run --sizes 20 100 --engines numpy --baseline baseline.json
+python benchmarks/suite.py compare baseline.json current.json --threshold 0.1
+```
+"""
+
+import gc
+import os
+import sys
+import json
+import time
+import argparse
+import platform
+import statistics
+from typing import Any, Dict, List, Callable, Optional
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "game-of-life"))
+
+import numpy as np  # noqa: E402
+import numpy.typing as npt  # noqa: E402
+
+from game import GameOfLife  # noqa: E402
+from engine import create_engine  # noqa: E402
+from protocol import FORMATS, encode_frame, decode_binary_payload  # noqa: E402
+
+VERSION = 1
+
+# The largest worlds, in cells, an engine is stepped in unless `--unlimited` is
+# given. The pure Python and sparse engines would take minutes on the largest ones.
+MAX_CELLS = {"python": 200 * 200, "sparse": 1000 * 1000, "unbounded": 1000 * 1000}
+
+Result = Dict[str, Any]
+
+
+class Suite:
+    """
+    Runs benchmarks and collects their results.
+
+    Attributes:
+    -----------
+    _rounds: int
+        The number of timed rounds of every benchmark.
+    _min_time: float
+        The shortest time of a round in seconds.
+    _results: List[Result]
+        The results of the benchmarks run so far.
+    """
+
+    def __init__(self, rounds: int, min_time: float) -> None:
+        self._rounds = rounds
+        self._min_time = min_time
+        self._results: List[Result] = []
+
+    @property
+    def results(self) -> List[Result]:
+        """
+        The results of the benchmarks run so far.
+        """
+        return self._results
+
+    def run(
+        self,
+        name: str,
+        params: Dict[str, Any],
+        function: Callable[[], Any],
+        extra: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Times a function and records its result under a name, such as
+        `"step/numpy/100x100/0.3"`, whose first part is the group.
+        """
+        function()
+        iterations = self._calibrate(function)
+        times = [self._time(function, iterations) for _ in range(self._rounds)]
+        stats = {
+            "min": min(times),
+            "median": statistics.median(times),
+            "mean": statistics.fmean(times),
+            "stdev": statistics.stdev(times) if len(times) > 1 else 0.0,
+            "rounds": len(times),
+            "iterations": iterations,
+        }
+        self._results.append(
+            {
+                "name": name,
+                "group": name.split("/")[0],
+                "params": params,
+                "stats": stats,
+                "extra": extra or {},
+            }
+        )
+        print(f"{name:<48} {stats['median'] * 1000:>12.4f} ms", file=sys.stderr)
+
+    def _calibrate(self, function: Callable[[], Any]) -> int:
+        iterations = 1
+        while True:
+            elapsed = self._time(function, iterations) * iterations
+            if elapsed >= self._min_time or iterations >= 1 << 20:
+                return iterations
+            # Aim a little above the minimum time, at most ten times more calls.
+            target = 1.2 * self._min_time / max(elapsed, 1e-9)
+            iterations = int(iterations * min(10.0, max(2.0, target)))
+
+    @staticmethod
+    def _time(function: Callable[[], Any], iterations: int) -> float:
+        enabled = gc.isenabled()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(iterations):
+                function()
+            return (time.perf_counter() - start) / iterations
+        finally:
+            if enabled:
+                gc.enable()
+
+
+def _world(size: int, density: float, seed: int) -> npt.NDArray[np.uint8]:
+    rng = np.random.default_rng(seed)
+    cells: npt.NDArray[np.uint8] = (rng.random((size, size)) < density).astype(np.uint8)
+    return cells
+
+
+def bench_steps(suite: Suite, args: argparse.Namespace) -> None:
+    """
+    Times a step of every engine in every world size and density.
+    """
+    for name in args.engines:
+        for size in args.sizes:
+            if not args.unlimited and size * size > MAX_CELLS.get(name, size * size):
+                print(
+                    f"step/{name}/{size}x{size} skipped, see --unlimited", file=sys.stderr
+                )
+                continue
+            for density in args.densities:
+                engine = create_engine(name, size, size)
+                try:
+                    engine.load_array(_world(size, density, args.seed))
+                    suite.run(
+                        f"step/{name}/{size}x{size}/{density:g}",
+                        {"engine": name, "size": size, "density": density},
+                        engine.step,
+                    )
+                finally:
+                    engine.close()
+
+
+def bench_generations(suite: Suite, args: argparse.Namespace) -> None:
+    """
+    Times `form_new_generation()` of a game, which adds the changes, history and
+    cycle detection of every generation to the step of its engine.
+    """
+    for size in args.payload_sizes:
+        for density in args.densities:
+            game = GameOfLife(size, size, 3600, cells=_world(size, density, args.seed))
+            suite.run(
+                f"generation/numpy/{size}x{size}/{density:g}",
+                {"engine": "numpy", "size": size, "density": density},
+                game.form_new_generation,
+            )
+            game.engine.close()
+
+
+def bench_payloads(suite: Suite, args: argparse.Namespace) -> None:
+    """
+    Times the encoding and decoding of the frame of a game in every wire format,
+    and records the size of the payloads.
+    """
+    for size in args.payload_sizes:
+        game = GameOfLife(size, size, 3600, cells=_world(size, 0.3, args.seed))
+        game.form_new_generation()
+        frame = game.frame
+        for wire_format in FORMATS:
+            since = frame.generation - 1 if wire_format == "delta" else None
+            body = encode_frame(frame, wire_format, since)
+            decode: Callable[[], Any] = (
+                (lambda: decode_binary_payload(body))
+                if wire_format == "binary"
+                else (lambda: json.loads(body))
+            )
+            params = {"format": wire_format, "size": size}
+            extra = {"bytes": len(body)}
+            suite.run(
+                f"encode/{wire_format}/{size}x{size}",
+                params,
+                lambda: encode_frame(frame, wire_format, since),
+                extra,
+            )
+            suite.run(f"decode/{wire_format}/{size}x{size}", params, decode, extra)
+        game.engine.close()
+
+
+def bench_endpoint(suite: Suite, args: argparse.Namespace) -> None:
+    """
+    Times `POST /life` through Flask's test client, both for a payload the frame
+    cache already holds and for one that forms a generation first (`steps=1`).
+    """
+    from main import app, games
+
+    client = app.test_client()
+    for size in args.payload_sizes:
+        game = GameOfLife(size, size, 3600, cells=_world(size, 0.3, args.seed))
+        game.form_new_generation()
+        game_id = games.add(game)
+        queries = {
+            "world": lambda: "",
+            "delta": lambda: f"&since={game.life_count}",
+            "binary": lambda: "&format=binary",
+        }
+        for wire_format, query in queries.items():
+            for mode, steps in (("cached", ""), ("fresh", "&steps=1")):
+
+                def request() -> bytes:
+                    response = client.post(f"/life?game={game_id}{query()}{steps}")
+                    if response.status_code != 200:
+                        raise RuntimeError(f"/life returned {response.status}")
+                    body: bytes = response.data
+                    return body
+
+                extra = {"bytes": len(request())} if mode == "cached" else {}
+                suite.run(
+                    f"endpoint/{wire_format}/{size}x{size}/{mode}",
+                    {"format": wire_format, "size": size, "mode": mode},
+                    request,
+                    extra,
+                )
+        games.remove(game_id)
+        game.engine.close()
+
+
+GROUPS = {
+    "step": bench_steps,
+    "generation": bench_generations,
+    "payload": bench_payloads,
+    "endpoint": bench_endpoint,
+}
+
+
+def compare(baseline: Result, current: Result, threshold: float) -> List[str]:
+    """
+    Prints the change of every benchmark of a run against a baseline and returns
+    the names of the benchmarks whose median time or payload size grew by more
+    than the threshold, a fraction.
+    """
+    if baseline.get("machine") != current.get("machine"):
+        print("warning: the runs were made on different machines or versions")
+
+    before = {result["name"]: result for result in baseline["benchmarks"]}
+    regressions = []
+    print(f"{'benchmark':<48} {'baseline ms':>12} {'current ms':>12} {'change':>8}")
+    for result in current["benchmarks"]:
+        name = result["name"]
+        old = before.pop(name, None)
+        if old is None:
+            print(f"{name:<48} {'new':>12}")
+            continue
+
+        old_time, new_time = old["stats"]["median"], result["stats"]["median"]
+        change = new_time / old_time - 1
+        flags = []
+        if change > threshold:
+            flags.append("SLOWER")
+        old_bytes, new_bytes = old["extra"].get("bytes"), result["extra"].get("bytes")
+        if old_bytes and new_bytes and new_bytes / old_bytes - 1 > threshold:
+            flags.append(f"LARGER ({old_bytes} -> {new_bytes} bytes)")
+        if flags:
+            regressions.append(name)
+        print(
+            f"{name:<48} {old_time * 1000:>12.4f} {new_time * 1000:>12.4f}"
+            f" {change:>+8.1%} {' '.join(flags)}"
+        )
+    for name in before:
+        print(f"{name:<48} {'missing':>12}")
+    print(f"{len(regressions)} regressions above {threshold:.0%}")
+    return regressions
+
+
+def _run(args: argparse.Namespace) -> int:
+    suite = Suite(args.rounds, args.min_time)
+    for group in args.groups:
+        GROUPS[group](suite, args)
+
+    current = {
+        "version": VERSION,
+        "created": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "machine": {
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "processor": platform.processor() or platform.machine(),
+            "cpus": os.cpu_count(),
+        },
+        "config": {
+            key: value
+            for key, value in vars(args).items()
+            if key not in ("command", "handler", "output", "baseline")
+        },
+        "benchmarks": suite.results,
+    }
+    text = json.dumps(current, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(text + "\n")
+    else:
+        print(text)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as file:
+            return 1 if compare(json.load(file), current, args.threshold) else 0
+    return 0
+
+
+def _compare(args: argparse.Namespace) -> int:
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+    return 1 if compare(baseline, current, args.threshold) else 0
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("--groups", nargs="+", choices=list(GROUPS), default=list(GROUPS))
+    run.add_argument(
+        "--engines",
+        nargs="+",
+        default=["python", "numpy", "bitpacked", "hashlife", "tiled", "sparse"],
+    )
+    run.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 1000, 10000])
+    run.add_argument("--densities", type=float, nargs="+", default=[0.1, 0.3, 0.5])
+    run.add_argument(
+        "--payload-sizes",
+        type=int,
+        nargs="+",
+        default=[100, 1000],
+        help="world sizes of the generation, payload and endpoint benchmarks",
+    )
+    run.add_argument("--rounds", type=int, default=5)
+    run.add_argument("--min-time", type=float, default=0.05, help="seconds per round")
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--unlimited", action="store_true", help="ignore MAX_CELLS")
+    run.add_argument("--output", help="JSON file of the results, stdout by default")
+    run.add_argument("--baseline", help="JSON file of a run to compare against")
+    run.add_argument("--threshold", type=float, default=0.1)
+    run.set_defaults(handler=_run)
+
+    check = commands.add_parser("compare", help="compare two runs")
+    check.add_argument("baseline", help="JSON file of the baseline run")
+    check.add_argument("current", help="JSON file of the current run")
+    check.add_argument("--threshold", type=float, default=0.1)
+    check.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    handler: Callable[[argparse.Namespace], int] = args.handler
+    return handler(args)
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
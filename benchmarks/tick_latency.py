@@ -0,0 +1,78 @@
+"""
+Tick Latency Benchmark
+
+Measures the latency of a single `step()` of an engine, the peak memory a step
+allocates on top of the engine's own buffers and the number of garbage collections
+the steps trigger.
+
+Usage:
+------
+```
+python benchmarks/tick_latency.py --size 200 --generations 50 --engines python numpy
+```
+"""
+
+import gc
+import os
+import sys
+import time
+import random
+import argparse
+import statistics
+import tracemalloc
+from typing import List
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "game-of-life"))
+
+from engine import create_engine  # noqa: E402
+
+
+def _collections() -> int:
+    return sum(generation["collections"] for generation in gc.get_stats())
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--size", type=int, default=200, help="width and height")
+    parser.add_argument("--generations", type=int, default=50)
+    parser.add_argument("--engines", nargs="+", default=["python", "numpy"])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    rng = random.Random(args.seed)
+    world = [[rng.random() < 0.3 for _ in range(args.size)] for _ in range(args.size)]
+
+    print(f"{'engine':>10} {'mean ms':>9} {'p99 ms':>9}" f" {'peak KiB':>9} {'GCs':>5}")
+    for name in args.engines:
+        engine = create_engine(name, args.size, args.size)
+        engine.load(world)
+        engine.step()
+
+        latencies = []
+        collections = _collections()
+        for _ in range(args.generations):
+            start = time.perf_counter()
+            engine.step()
+            latencies.append(time.perf_counter() - start)
+        collections = _collections() - collections
+
+        # Allocations are traced in a separate run, tracing slows every step down.
+        tracemalloc.start()
+        peak = 0
+        for _ in range(args.generations):
+            current = tracemalloc.get_traced_memory()[0]
+            tracemalloc.reset_peak()
+            engine.step()
+            peak = max(peak, tracemalloc.get_traced_memory()[1] - current)
+        tracemalloc.stop()
+
+        latencies.sort()
+        print(
+            f"{name:>10} {statistics.fmean(latencies) * 1000:>9.3f}"
+            f" {latencies[int(len(latencies) * 0.99)] * 1000:>9.3f}"
+            f" {peak / 1024:>9.1f} {collections:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
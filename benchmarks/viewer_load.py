@@ -0,0 +1,93 @@
+"""
+Viewer Load Benchmark
+
+Measures how many `/life` payloads concurrent viewer threads read per second while
+a writer thread keeps forming generations of the same game. Viewers either build
+the payload from the last published frame without locking (`frame`), or hold the
+game's lock while reading the engine's worlds, as the handlers did before frames
+were published (`locked`).
+
+Usage:
+------
+```
+python benchmarks/viewer_load.py --size 100 --viewers 1 2 4 8 16 --duration 2
+```
+"""
+
+import os
+import sys
+import time
+import argparse
+import threading
+from typing import Any, Dict, List, Callable
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "game-of-life"))
+
+from game import GameOfLife  # noqa: E402
+from protocol import world_payload  # noqa: E402
+
+
+def _read_frame(game: GameOfLife) -> Dict[str, Any]:
+    return world_payload(game.frame)
+
+
+def _read_locked(game: GameOfLife) -> Dict[str, Any]:
+    with game.lock:
+        return {
+            "life_count": game.life_count,
+            "world": game.engine.world,
+            "previous_world": game.engine.previous_world,
+        }
+
+
+def _run(
+    game: GameOfLife,
+    read: Callable[[GameOfLife], Dict[str, Any]],
+    viewers: int,
+    duration: float,
+) -> int:
+    stop = threading.Event()
+    reads = [0] * viewers
+
+    def writer() -> None:
+        while not stop.is_set():
+            game.form_new_generation()
+
+    def viewer(index: int) -> None:
+        while not stop.is_set():
+            read(game)
+            reads[index] += 1
+
+    threads = [threading.Thread(target=writer)] + [
+        threading.Thread(target=viewer, args=(i,)) for i in range(viewers)
+    ]
+    for thread in threads:
+        thread.start()
+    time.sleep(duration)
+    stop.set()
+    for thread in threads:
+        thread.join()
+    return sum(reads)
+
+
+def main(argv: List[str]) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--size", type=int, default=100, help="width and height")
+    parser.add_argument("--viewers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--duration", type=float, default=2.0, help="seconds per run")
+    parser.add_argument("--engine", default="numpy")
+    args = parser.parse_args(argv)
+
+    readers = {"frame": _read_frame, "locked": _read_locked}
+    print(f"{'viewers':>8}" + "".join(f" {name + ' reads/s':>16}" for name in readers))
+    for viewers in args.viewers:
+        row = f"{viewers:>8}"
+        for read in readers.values():
+            game = GameOfLife(args.size, args.size, engine=args.engine)
+            reads = _run(game, read, viewers, args.duration)
+            row += f" {reads / args.duration:>16.0f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,88 @@
+"""
+Batch Simulations for Game of Life Application
+
+This module runs many games without the web server, for offline experiments such as
+how long random worlds of a density take to stabilize. Every run starts from a
+random world drawn from the seed of the batch and the index of the run, so batches
+are reproducible, and forms its generations with `GameOfLife.simulate()`, stopping
+once the world entered a cycle. Runs are spread over a pool of worker processes and
+their statistics are streamed to CSV or JSON Lines as each run finishes, so a batch
+of any size runs in constant memory.
+
+Modules:
+--------
+- `batch/runner.py`: Defines the parameters and statistics of runs and runs them
+    in a pool of worker processes.
+
+- `batch/output.py`: Defines the writers of the statistics.
+
+Classes:
+--------
+Simulation(NamedTuple):
+    The parameters shared by all runs of a batch: the `width` and `height` of the
+    worlds, the `density` of their initial alive cells, the number of
+    `generations`, the `engine`, the `rule`, the `cycle_window` and whether runs
+    stop `until_stable`.
+
+RunResult(NamedTuple):
+    The statistics of a finished run: its `run` index and `seed`, the
+    `initial_population` and final `population`, the generation it
+    `stabilized_at` and the `period` of its cycle if one was detected, the number
+    of `generations` formed and the `seconds` it took.
+
+Attributes:
+-----------
+FORMATS: Tuple[str, ...]
+    The output formats, `"csv"` and `"jsonl"`.
+
+Functions:
+----------
+simulate(simulation: Simulation, seed: int, run: int) -> RunResult:
+    Runs a single game of a batch from a random world and returns its statistics.
+
+run_batch(
+    simulation: Simulation, runs: int, seed: int = 0, workers: Optional[int] = 1
+) -> Iterator[RunResult]:
+    Runs many games of the same parameters in a pool of worker processes and yields
+    the statistics of every run as soon as it finished.
+
+output_format(path: str) -> str:
+    Returns the output format of a file by its extension.
+
+write_results(results: Iterable[RunResult], file: TextIO, file_format: str) -> int:
+    Writes the statistics of runs to a file as they arrive, flushing every one, and
+    returns the number of runs written.
+
+Command Line:
+-------------
+`python game-of-life/cli.py batch` runs a batch, for example:
+
+```
+python game-of-life/cli.py batch --size 500x500 --density 0.3 --runs 1000 \\
+    --generations 5000 --output runs.csv
+```
+
+Usage:
+------
+```python
+import sys
+
+from batch import Simulation, run_batch, write_results
+
+simulation = Simulation(100, 100, density=0.3, generations=1000)
+write_results(run_batch(simulation, runs=100, workers=4), sys.stdout, "jsonl")
+```
+"""
+
+from .output import FORMATS, output_format, write_results
+from .runner import RunResult, Simulation, simulate, run_batch
+
+__all__ = [
+    "FORMATS",
+    "RunResult",
+    "Simulation",
+    "output_format",
+    "run_batch",
+    "simulate",
+    "write_results",
+]
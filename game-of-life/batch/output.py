@@ -0,0 +1,54 @@
+import csv
+import json
+from typing import TextIO, Iterable
+
+from .runner import RunResult
+
+FORMATS = ("csv", "jsonl")
+
+
+def output_format(path: str) -> str:
+    """
+    Returns the output format of a file by its extension, `"jsonl"` for `.jsonl`
+    and `.ndjson` files and `"csv"` otherwise.
+
+    Parameters:
+    -----------
+        path: str
+            The path of the file.
+    """
+    return "jsonl" if path.lower().endswith((".jsonl", ".ndjson")) else "csv"
+
+
+def write_results(results: Iterable[RunResult], file: TextIO, file_format: str) -> int:
+    """
+    Writes the statistics of runs to a file as they arrive, a CSV row or a JSON line
+    per run, flushing every one so that the file can be followed while the batch
+    runs. Returns the number of runs written.
+
+    Parameters:
+    -----------
+        results: Iterable[RunResult]
+            The statistics of the runs.
+        file: TextIO
+            The file to write to.
+        file_format: str
+            One of `"csv"` and `"jsonl"`.
+    """
+    if file_format not in FORMATS:
+        raise ValueError(f"unknown output format: {file_format}")
+
+    writer = csv.writer(file, lineterminator="\n")
+    if file_format == "csv":
+        writer.writerow(RunResult._fields)
+        file.flush()
+
+    written = 0
+    for result in results:
+        if file_format == "csv":
+            writer.writerow("" if value is None else value for value in result)
+        else:
+            file.write(json.dumps(result._asdict()) + "\n")
+        file.flush()
+        written += 1
+    return written
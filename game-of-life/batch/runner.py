@@ -0,0 +1,160 @@
+import time
+from typing import Tuple, Iterator, Optional, NamedTuple
+from functools import partial
+from multiprocessing import get_context
+
+import numpy as np
+
+from game import GameOfLife
+
+
+class Simulation(NamedTuple):
+    """
+    The parameters shared by all runs of a batch.
+
+    Attributes:
+    -----------
+    width: int
+        The width of the worlds.
+    height: int
+        The height of the worlds.
+    density: float
+        The share of cells alive in the random initial worlds, from 0 to 1.
+    generations: int
+        The number of generations every run forms at most.
+    engine: str
+        The name of the engine that forms the generations.
+    rule: str
+        The Life-like rule in B/S notation.
+    cycle_window: int
+        The number of recent generations a repeat of the world is looked for in.
+    until_stable: bool
+        Whether a run stops once its world entered a cycle.
+    """
+
+    width: int
+    height: int
+    density: float
+    generations: int
+    engine: str = "numpy"
+    rule: str = "B3/S23"
+    cycle_window: int = 64
+    until_stable: bool = True
+
+
+class RunResult(NamedTuple):
+    """
+    The statistics of a finished run.
+
+    Attributes:
+    -----------
+    run: int
+        The index of the run in its batch.
+    seed: int
+        The seed of the batch; the initial world of a run is drawn from the seed
+        and the index of the run.
+    initial_population: int
+        The number of alive cells of the initial world.
+    population: int
+        The number of alive cells after all generations.
+    stabilized_at: Optional[int]
+        The first generation of the cycle the world entered, if one was detected.
+    period: Optional[int]
+        The period of the cycle, `1` for a still life, if one was detected.
+    generations: int
+        The number of generations formed, fewer than requested if the run stopped
+        once it was stable.
+    seconds: float
+        The time the run took.
+    """
+
+    run: int
+    seed: int
+    initial_population: int
+    population: int
+    stabilized_at: Optional[int]
+    period: Optional[int]
+    generations: int
+    seconds: float
+
+
+def simulate(simulation: Simulation, seed: int, run: int) -> RunResult:
+    """
+    Runs a single game of a batch from a random world and returns its statistics.
+    Runs of the same seed and index draw the same world.
+
+    Parameters:
+    -----------
+        simulation: Simulation
+            The parameters of the batch.
+        seed: int
+            The seed of the batch.
+        run: int
+            The index of the run in the batch.
+    """
+    started = time.perf_counter()
+    rng = np.random.default_rng((seed, run))
+    shape = (simulation.height, simulation.width)
+    cells = (rng.random(shape) < simulation.density).astype(np.uint8)
+    game = GameOfLife(
+        simulation.width,
+        simulation.height,
+        engine=simulation.engine,
+        cells=cells,
+        cycle_window=simulation.cycle_window,
+        rule=simulation.rule,
+    )
+    try:
+        formed = game.simulate(simulation.generations, simulation.until_stable)
+        frame = game.frame
+        return RunResult(
+            run,
+            seed,
+            int(np.count_nonzero(cells)),
+            game.engine.population,
+            frame.stabilized_at,
+            frame.period,
+            formed,
+            time.perf_counter() - started,
+        )
+    finally:
+        game.engine.close()
+
+
+def _simulate(simulation: Simulation, task: Tuple[int, int]) -> RunResult:
+    return simulate(simulation, *task)
+
+
+def run_batch(
+    simulation: Simulation, runs: int, seed: int = 0, workers: Optional[int] = 1
+) -> Iterator[RunResult]:
+    """
+    Runs many games of the same parameters and yields the statistics of every run as
+    soon as it finished, in the order they finish. Runs are spread over a pool of
+    worker processes; the results are not kept, so a batch of any size runs in
+    constant memory.
+
+    Parameters:
+    -----------
+        simulation: Simulation
+            The parameters of the runs.
+        runs: int
+            The number of runs.
+        seed: int
+            The seed the initial worlds are drawn from (Default: 0).
+        workers: Optional[int]
+            The number of worker processes, `1` to run in this process (Default: 1,
+            `None` for the number of CPUs).
+    """
+    if runs < 0:
+        raise ValueError(f"cannot run {runs} simulations")
+    if workers == 1 or runs <= 1:
+        for run in range(runs):
+            yield simulate(simulation, seed, run)
+        return
+
+    if simulation.engine == "parallel":
+        raise ValueError("the parallel engine cannot run in a pool of workers")
+    tasks = ((seed, run) for run in range(runs))
+    with get_context().Pool(workers) as pool:
+        yield from pool.imap_unordered(partial(_simulate, simulation), tasks)
@@ -0,0 +1,98 @@
+"""
+Command Line of Game of Life Application
+
+Runs the engines without the web server. `batch` runs many games from random worlds
+in a pool of worker processes and streams the statistics of every run, its final
+population, the generation it stabilized at and its period, to CSV or JSON Lines as
+it finishes.
+
+Usage:
+------
+```
+python game-of-life/cli.py batch --size 500x500 --density 0.3 --runs 1000 \\
+    --generations 5000 --output runs.csv
+```
+"""
+
+import sys
+import time
+import argparse
+from typing import List, Tuple
+
+from core import config
+from batch import FORMATS, Simulation, run_batch, output_format, write_results
+from engine import ENGINES
+
+
+def _size(value: str) -> Tuple[int, int]:
+    width, _, height = value.lower().partition("x")
+    try:
+        size = int(width), int(height or width)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"size must be WIDTHxHEIGHT: {value!r}")
+    if min(size) <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive: {value!r}")
+    return size
+
+
+def _batch(args: argparse.Namespace) -> int:
+    width, height = args.size
+    simulation = Simulation(
+        width,
+        height,
+        args.density,
+        args.generations,
+        args.engine,
+        args.rule,
+        args.cycle_window,
+        not args.full,
+    )
+    file_format = args.format or output_format(args.output or "")
+    results = run_batch(simulation, args.runs, args.seed, args.workers)
+
+    started = time.perf_counter()
+    if args.output is None:
+        written = write_results(results, sys.stdout, file_format)
+    else:
+        with open(args.output, "w", encoding="utf-8", newline="") as file:
+            written = write_results(results, file, file_format)
+    elapsed = time.perf_counter() - started
+    print(f"{written} runs in {elapsed:.1f} seconds", file=sys.stderr)
+    return 0
+
+
+def main(argv: List[str]) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1].strip())
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    batch = commands.add_parser("batch", help="run many games without the server")
+    batch.add_argument("--size", type=_size, default=(100, 100), help="e.g. 500x500")
+    batch.add_argument("--density", type=float, default=0.3)
+    batch.add_argument("--runs", type=int, default=100)
+    batch.add_argument("--generations", type=int, default=1000)
+    batch.add_argument("--engine", choices=list(ENGINES), default="numpy")
+    batch.add_argument("--rule", default="B3/S23", help="in B/S notation")
+    batch.add_argument("--cycle-window", type=int, default=config.cycle_window)
+    batch.add_argument(
+        "--full",
+        action="store_true",
+        help="form all generations instead of stopping once stable",
+    )
+    batch.add_argument("--seed", type=int, default=0)
+    batch.add_argument("--workers", type=int, default=config.workers)
+    batch.add_argument("--output", help="CSV or JSONL file, stdout by default")
+    batch.add_argument("--format", choices=FORMATS, help="by the output extension")
+    batch.set_defaults(handler=_batch)
+
+    args = parser.parse_args(argv)
+    if args.command == "batch" and not 0 <= args.density <= 1:
+        parser.error("--density must be from 0 to 1")
+    try:
+        return int(args.handler(args))
+    except ValueError as error:
+        parser.error(str(error))
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
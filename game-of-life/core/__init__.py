@@ -2,23 +2,28 @@
 Core Module for Game of Life Application
 ----------------------------------------
 
-This module is responsible for configuration the essential settings and logging
-functionality required by the Game of Life application. It consists of components
-that handle configuration management, logging setup, and environmental variable
-handling, providing a unified interface for application-wide settings.
+This module is responsible for configuration the essential settings, logging and
+metrics functionality required by the Game of Life application. It consists of
+components that handle configuration management, logging setup, metrics collection
+and environmental variable handling, providing a unified interface for
+application-wide settings.
 
 Usage:
 ------
-Import the `config` and `logger` from the `core` module to utilize logging and
-configuration in other parts of the application:
+Import the `config`, `logger` and `metrics` from the `core` module to utilize
+logging, configuration and metrics in other parts of the application:
 
 ```python
-from core import config, logger
+from core import config, logger, metrics
 
 logger.info("Starting the Game of Life application...")
+logger.debug("world updated: %s", game)  # Formatted only if debug logs are shown
+ticks = metrics.histogram("life_tick_seconds", "Time of a tick of the scheduler")
 address = config.addr
 port = config.port
 secret = config.secret
+workers = config.workers
+max_games = config.max_games
 ```
 
 Modules:
@@ -34,8 +39,14 @@ Modules:
     from environment variables, command-line arguments, and default values using
     Pydantic's `BaseSettings`.
 
-- `core/__init__.py`: Initializes and exposes the `config` and `logger` for use
-    throughout the application.
+- `core/metrics.py`: Collects counters, gauges and histograms of the application
+    and renders them in the Prometheus text format.
+
+- `core/profiler.py`: Profiles a number of calls of the hot paths with `cProfile`
+    and writes the profile to the `logs` directory.
+
+- `core/__init__.py`: Initializes and exposes the `config`, `logger` and `metrics`
+    for use throughout the application.
 
 Modules Details:
 ----------------
@@ -54,13 +65,36 @@ Modules Details:
 
 3. `core/cfg.py`:
     - Manages configuration using Pydantic's `BaseSettings`.
-    - Reads configuration values `addr`, `port` and `secret` from environment variables
-        (`GAME_OF_LIFE_ADDR`, `GAME_OF_LIFE_PORT` and `GAME_OF_LIFE_SECRET`).
+    - Reads configuration values `addr`, `port`, `secret`, `workers`, `max_games`,
+        `game_ttl`, `memory_budget`, `frame_cache`, `patterns`, `checkpoints`,
+        `checkpoint_interval`, `cycle_window`, `max_steps`, `hashlife_timeout` and
+        `profile` from environment variables (`GAME_OF_LIFE_ADDR`, `GAME_OF_LIFE_PORT`,
+        `GAME_OF_LIFE_SECRET`, `GAME_OF_LIFE_WORKERS`, `GAME_OF_LIFE_MAX_GAMES`,
+        `GAME_OF_LIFE_GAME_TTL`, `GAME_OF_LIFE_MEMORY_BUDGET`,
+        `GAME_OF_LIFE_FRAME_CACHE`, `GAME_OF_LIFE_PATTERNS`,
+        `GAME_OF_LIFE_CHECKPOINTS`, `GAME_OF_LIFE_CHECKPOINT_INTERVAL`,
+        `GAME_OF_LIFE_CYCLE_WINDOW`, `GAME_OF_LIFE_MAX_STEPS`,
+        `GAME_OF_LIFE_HASHLIFE_TIMEOUT` and `GAME_OF_LIFE_PROFILE`).
     - Falls back to default values if environment variables are not set or are invalid.
     - Logs warnings or errors if there are issues loading the configuration.
 
-4. `core/__init__.py`:
-    - Imports and exposes `config` and `logger` for external usage.
+4. `core/metrics.py`:
+    - Defines the `Counter`, `Gauge` and `Histogram` metrics and the `Metrics`
+        registry that creates every metric once by name and labels.
+    - Counters and gauges may read their value from a function when they are
+        rendered, so values the application already keeps cost nothing until scraped.
+    - Renders all metrics in the Prometheus text exposition format, served by the
+        application on `/metrics`.
+
+5. `core/profiler.py`:
+    - Defines the `Profiler` that profiles a number of calls with `cProfile`, one
+        profiled call at a time, and costs a single check per call afterwards.
+    - Writes the profile as `.pstats` statistics and as `.collapsed` call stacks for
+        flame graphs to the `logs` directory.
+
+6. `core/__init__.py`:
+    - Imports and exposes `config`, `logger`, `metrics` and `Profiler` for external
+        usage.
     - Ensures that other modules can easily access centralized configuration and
         logging functionality.
 
@@ -68,19 +102,50 @@ Logging:
 --------
 The logging setup is configurable to handle different levels of verbosity. Console
 logs are primarily used for debugging, while file logs capture errors. Adjustments
-can be made to the logging behavior by modifying `core/logger_config.py`.
+can be made to the logging behavior by modifying `core/logger_config.py`. Messages
+logged on hot paths, such as every generation, use `%`-style arguments, so they
+are only formatted when debug logging is enabled.
 
 Configuration:
 --------------
 The configuration can be customized via environment variables:
 - Command-line arguments `-d` or `--debug` can be used to enable debug logging.
+- Command-line argument `--profile` can be used to profile the first 1000
+    generations and `/life` requests.
 - `GAME_OF_LIFE_ADDR`: Sets the address for the application (default: "0.0.0.0").
 - `GAME_OF_LIFE_PORT`: Sets the port number for the application (default: 3000).
 - `GAME_OF_LIFE_SECRET`: Sets the secret key application will be using
     (default: auto generated string)
+- `GAME_OF_LIFE_WORKERS`: Sets the number of worker processes of the parallel engine
+    (default: the number of CPUs).
+- `GAME_OF_LIFE_MAX_GAMES`: Sets the maximum number of games hosted at once
+    (default: 256).
+- `GAME_OF_LIFE_GAME_TTL`: Sets the number of seconds a game is kept without being
+    viewed (default: 3600).
+- `GAME_OF_LIFE_MEMORY_BUDGET`: Sets the memory all hosted games may use, in
+    megabytes (default: 1024).
+- `GAME_OF_LIFE_FRAME_CACHE`: Sets the number of serialized payloads kept for
+    all viewers (default: 256).
+- `GAME_OF_LIFE_PATTERNS`: Sets the directory of the pattern library
+    (default: the bundled `game-of-life/patterns/files`).
+- `GAME_OF_LIFE_CHECKPOINTS`: Sets the directory games are checkpointed to and
+    restored from at startup (default: none, checkpoints are disabled).
+- `GAME_OF_LIFE_CHECKPOINT_INTERVAL`: Sets the number of seconds between two
+    checkpoints (default: 60).
+- `GAME_OF_LIFE_CYCLE_WINDOW`: Sets the number of recent generations a repeat of
+    the world is looked for in, the longest period detected (default: 64).
+- `GAME_OF_LIFE_MAX_STEPS`: Sets the most generations a `/life` request may skip a
+    game ahead by, except with the `"hashlife"` engine (default: 1024).
+- `GAME_OF_LIFE_HASHLIFE_TIMEOUT`: Sets the longest time in seconds the
+    `"hashlife"` engine may take to skip a game ahead (default: 2).
+- `GAME_OF_LIFE_PROFILE`: Sets the number of generations and `/life` requests
+    profiled, whose profiles are written to the `logs` directory (default: 1000 with
+    `--profile`, 0 otherwise).
 """
 
 from .logger_setup import logger
 from .cfg import config
+from .metrics import metrics
+from .profiler import Profiler
 
-__all__ = ["config", "logger"]
+__all__ = ["Profiler", "config", "logger", "metrics"]
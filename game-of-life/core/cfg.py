@@ -23,6 +23,12 @@ _load_secret() -> str:
     Attempts to load the secret key from the `GAME_OF_LIFE_SECRET` environment variable.
     If the variable is not set, an error is logged, and auto generated string returned.
 
+_load_positive(name: str, parse: Callable[[str], T]) -> Optional[T]:
+    Attempts to load a positive number from the `name` environment variable, such
+    as `GAME_OF_LIFE_WORKERS`. If the variable is not set, `None` is returned. If
+    the variable is set but is not a positive number, an error is logged, and
+    `None` is returned.
+
 Classes:
 --------
 Config(BaseSettings):
@@ -41,6 +47,42 @@ Config(BaseSettings):
         `GAME_OF_LIFE_PORT` is not set or cannot be parsed.
     - `secret` (str): The secret key the application will be using. Defaults to auto
         generated string if `GAME_OF_LIFE_SECRET` is not set.
+    - `workers` (int): The number of worker processes of the parallel engine.
+        Defaults to the number of CPUs if `GAME_OF_LIFE_WORKERS` is not set or
+        cannot be parsed.
+    - `max_games` (int): The maximum number of games hosted at once. Defaults to
+        `256` if `GAME_OF_LIFE_MAX_GAMES` is not set or cannot be parsed.
+    - `game_ttl` (float): The number of seconds a game is kept without being
+        viewed. Defaults to `3600` if `GAME_OF_LIFE_GAME_TTL` is not set or cannot
+        be parsed.
+    - `memory_budget` (int): The memory all hosted games may use, in megabytes.
+        Defaults to `1024` if `GAME_OF_LIFE_MEMORY_BUDGET` is not set or cannot be
+        parsed.
+    - `frame_cache` (int): The number of serialized payloads kept for all viewers.
+        Defaults to `256` if `GAME_OF_LIFE_FRAME_CACHE` is not set or cannot be
+        parsed.
+    - `patterns` (str): The directory of the pattern library. Defaults to the
+        bundled `game-of-life/patterns/files` if `GAME_OF_LIFE_PATTERNS` is not set.
+    - `checkpoints` (Optional[str]): The directory games are checkpointed to and
+        restored from at startup. Checkpoints are disabled if
+        `GAME_OF_LIFE_CHECKPOINTS` is not set.
+    - `checkpoint_interval` (float): The number of seconds between two checkpoints.
+        Defaults to `60` if `GAME_OF_LIFE_CHECKPOINT_INTERVAL` is not set or cannot
+        be parsed.
+    - `cycle_window` (int): The number of recent generations a repeat of the world
+        is looked for in, the longest period detected. Defaults to `64` if
+        `GAME_OF_LIFE_CYCLE_WINDOW` is not set or cannot be parsed.
+    - `max_steps` (int): The most generations a `/life` request may skip a game
+        ahead by, except with the `"hashlife"` engine. Defaults to `1024` if
+        `GAME_OF_LIFE_MAX_STEPS` is not set or cannot be parsed.
+    - `hashlife_timeout` (float): The longest time the `"hashlife"` engine may
+        take to skip a game ahead, in seconds. Defaults to `2` if
+        `GAME_OF_LIFE_HASHLIFE_TIMEOUT` is not set or cannot be parsed.
+    - `profile` (int): The number of generations and `/life` requests profiled
+        with `cProfile`, whose profiles are written to the `logs` directory.
+        Defaults to `GAME_OF_LIFE_PROFILE`, or to `1000` with the `--profile`
+        command-line argument if it is not set, and to `0`, profiling disabled,
+        otherwise.
 
 Attributes:
 -----------
@@ -64,23 +106,31 @@ if config.debug:
 
 Notes:
 ------
-- Ensure that environment variable `GAME_OF_LIFE_ADDRESS`, `GAME_OF_LIFE_PORT`
-    and `GAME_OF_LIFE_SECRET` are set correctly if you want to override the default
-    values.
+- Ensure that environment variable `GAME_OF_LIFE_ADDRESS`, `GAME_OF_LIFE_PORT`,
+    `GAME_OF_LIFE_SECRET`, `GAME_OF_LIFE_WORKERS`, `GAME_OF_LIFE_MAX_GAMES`,
+    `GAME_OF_LIFE_GAME_TTL`, `GAME_OF_LIFE_MEMORY_BUDGET`, `GAME_OF_LIFE_FRAME_CACHE`,
+    `GAME_OF_LIFE_PATTERNS`, `GAME_OF_LIFE_CHECKPOINTS`,
+    `GAME_OF_LIFE_CHECKPOINT_INTERVAL`, `GAME_OF_LIFE_CYCLE_WINDOW` and
+    `GAME_OF_LIFE_PROFILE` are set correctly if you want to override the
+    default values.
 - Command-line arguments `-d` or `--debug` will enable debug mode, which can be
     useful for development and troubleshooting.
+- Command-line argument `--profile` will profile the first generations and `/life`
+    requests, which can be useful to diagnose slow worlds.
 """
 
 import os
 import sys
 import string
 import secrets
-from typing import Optional
+from typing import TypeVar, Callable, Optional
 
 from pydantic_settings import BaseSettings
 
 from core import logger
 
+T = TypeVar("T", int, float)
+
 
 def _load_port() -> Optional[int]:
     port = os.getenv("GAME_OF_LIFE_PORT")
@@ -110,6 +160,20 @@ def _load_secret_key() -> str:
     return secret
 
 
+def _load_positive(name: str, parse: Callable[[str], T]) -> Optional[T]:
+    value = os.getenv(name)
+    if value is None:
+        return value
+    try:
+        number = parse(value)
+    except ValueError:
+        number = None
+    if number is None or number <= 0:
+        logger.error(f"could not parse '{name}': {value}")
+        return None
+    return number
+
+
 class Config(BaseSettings):
     """
     A Pydantic settings class that manages the application's configuration. It reads
@@ -127,12 +191,68 @@ class Config(BaseSettings):
         `GAME_OF_LIFE_PORT` is not set or cannot be parsed.
     - `secret` (str): The secret key the application will be using. Defaults to auto
         generated string if `GAME_OF_LIFE_SECRET` is not set.
+    - `workers` (int): The number of worker processes of the parallel engine.
+        Defaults to the number of CPUs if `GAME_OF_LIFE_WORKERS` is not set or
+        cannot be parsed.
+    - `max_games` (int): The maximum number of games hosted at once. Defaults to
+        `256` if `GAME_OF_LIFE_MAX_GAMES` is not set or cannot be parsed.
+    - `game_ttl` (float): The number of seconds a game is kept without being
+        viewed. Defaults to `3600` if `GAME_OF_LIFE_GAME_TTL` is not set or cannot
+        be parsed.
+    - `memory_budget` (int): The memory all hosted games may use, in megabytes.
+        Defaults to `1024` if `GAME_OF_LIFE_MEMORY_BUDGET` is not set or cannot be
+        parsed.
+    - `frame_cache` (int): The number of serialized payloads kept for all viewers.
+        Defaults to `256` if `GAME_OF_LIFE_FRAME_CACHE` is not set or cannot be
+        parsed.
+    - `patterns` (str): The directory of the pattern library. Defaults to the
+        bundled `game-of-life/patterns/files` if `GAME_OF_LIFE_PATTERNS` is not set.
+    - `checkpoints` (Optional[str]): The directory games are checkpointed to and
+        restored from at startup. Checkpoints are disabled if
+        `GAME_OF_LIFE_CHECKPOINTS` is not set.
+    - `checkpoint_interval` (float): The number of seconds between two checkpoints.
+        Defaults to `60` if `GAME_OF_LIFE_CHECKPOINT_INTERVAL` is not set or cannot
+        be parsed.
+    - `cycle_window` (int): The number of recent generations a repeat of the world
+        is looked for in, the longest period detected. Defaults to `64` if
+        `GAME_OF_LIFE_CYCLE_WINDOW` is not set or cannot be parsed.
+    - `max_steps` (int): The most generations a `/life` request may skip a game
+        ahead by, except with the `"hashlife"` engine. Defaults to `1024` if
+        `GAME_OF_LIFE_MAX_STEPS` is not set or cannot be parsed.
+    - `hashlife_timeout` (float): The longest time the `"hashlife"` engine may
+        take to skip a game ahead, in seconds. Defaults to `2` if
+        `GAME_OF_LIFE_HASHLIFE_TIMEOUT` is not set or cannot be parsed.
+    - `profile` (int): The number of generations and `/life` requests profiled
+        with `cProfile`, whose profiles are written to the `logs` directory.
+        Defaults to `GAME_OF_LIFE_PROFILE`, or to `1000` with the `--profile`
+        command-line argument if it is not set, and to `0`, profiling disabled,
+        otherwise.
     """
 
     debug: bool = "-d" in sys.argv or "--debug" in sys.argv
     addr: str = _load_addr() or "0.0.0.0"
     port: int = _load_port() or 3000
     secret: str = _load_secret_key()
+    workers: int = _load_positive("GAME_OF_LIFE_WORKERS", int) or os.cpu_count() or 1
+    max_games: int = _load_positive("GAME_OF_LIFE_MAX_GAMES", int) or 256
+    game_ttl: float = _load_positive("GAME_OF_LIFE_GAME_TTL", float) or 3600.0
+    memory_budget: int = _load_positive("GAME_OF_LIFE_MEMORY_BUDGET", int) or 1024
+    frame_cache: int = _load_positive("GAME_OF_LIFE_FRAME_CACHE", int) or 256
+    patterns: str = os.getenv("GAME_OF_LIFE_PATTERNS") or os.path.join(
+        os.path.dirname(os.path.dirname(__file__)), "patterns", "files"
+    )
+    checkpoints: Optional[str] = os.getenv("GAME_OF_LIFE_CHECKPOINTS")
+    checkpoint_interval: float = (
+        _load_positive("GAME_OF_LIFE_CHECKPOINT_INTERVAL", float) or 60.0
+    )
+    cycle_window: int = _load_positive("GAME_OF_LIFE_CYCLE_WINDOW", int) or 64
+    max_steps: int = _load_positive("GAME_OF_LIFE_MAX_STEPS", int) or 1024
+    hashlife_timeout: float = (
+        _load_positive("GAME_OF_LIFE_HASHLIFE_TIMEOUT", float) or 2.0
+    )
+    profile: int = _load_positive("GAME_OF_LIFE_PROFILE", int) or (
+        1000 if "--profile" in sys.argv else 0
+    )
 
 
 config = Config()
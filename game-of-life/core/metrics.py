@@ -0,0 +1,355 @@
+"""
+Metrics for Game of Life Application
+
+This module collects the metrics of the Game of Life application and renders them in
+the Prometheus text exposition format, served on the `/metrics` endpoint. It has no
+dependencies besides the standard library.
+
+Functionality:
+--------------
+1. Metrics:
+    - `Counter`: A total that only grows, such as the number of cached payloads.
+    - `Gauge`: A value that goes up and down, such as the number of hosted games.
+    - `Histogram`: The distribution of observed values over fixed buckets, such as
+        the time to form a generation.
+    - Counters and gauges may read their value from a function when they are
+        rendered instead, so that values the application already keeps cost nothing
+        until they are scraped.
+
+2. Registry:
+    - `Metrics` creates every metric once by name and labels; asking for the same
+        metric again returns the existing one.
+    - `Metrics.render()` renders all metrics, grouped by name.
+
+Attributes:
+-----------
+metrics: Metrics
+    The registry of the application's metrics.
+
+Usage:
+------
+```python
+from core import metrics
+
+generations = metrics.histogram("life_generation_seconds", "Time to form a generation")
+generations.observe(0.002)
+print(metrics.render())
+```
+"""
+
+import math
+from bisect import bisect_left
+from typing import Any, Dict, List, Tuple, Union, Callable, Optional, Sequence
+from threading import Lock
+
+Labels = Tuple[Tuple[str, str], ...]
+
+# The default buckets of a histogram, from a tenth of a millisecond to ten seconds.
+SECONDS = (0.0001, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1, 10)
+# Buckets of sizes and counts, from one to a billion.
+MAGNITUDES = tuple(float(10**power) for power in range(10))
+
+
+def _format(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if value != int(value) else str(int(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(labels: Labels, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in labels]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """
+    A metric whose value only grows.
+
+    Attributes:
+    -----------
+    _value: float
+        The value added so far.
+    _function: Optional[Callable[[], float]]
+        Returns the value instead, if given.
+    _lock: Lock
+        The lock held while the value grows.
+
+    Properties:
+    -----------
+        value: float
+            The current value.
+    """
+
+    kind = "counter"
+
+    def __init__(self, function: Optional[Callable[[], float]] = None) -> None:
+        """
+        Initializes a counter at zero.
+
+        Parameters:
+        -----------
+            function: Optional[Callable[[], float]]
+                Returns the value of the counter when it is read (Default: None, the
+                value added with `inc()`).
+        """
+        self._value = 0.0
+        self._function = function
+        self._lock = Lock()
+
+    @property
+    def value(self) -> float:
+        """
+        The current value.
+        """
+        return self._function() if self._function is not None else self._value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Adds a non-negative amount to the counter.
+        """
+        if amount < 0:
+            raise ValueError(f"counters only grow, got {amount}")
+        with self._lock:
+            self._value += amount
+
+    def samples(self, name: str, labels: Labels) -> List[str]:
+        """
+        Returns the lines of the counter in the Prometheus text format.
+        """
+        return [f"{name}{_labels(labels)} {_format(self.value)}"]
+
+
+class Gauge(Counter):
+    """
+    A metric whose value goes up and down.
+    """
+
+    kind = "gauge"
+
+    def set(self, value: float) -> None:
+        """
+        Sets the value of the gauge.
+        """
+        self._value = value
+
+    def inc(self, amount: float = 1.0) -> None:
+        """
+        Adds an amount, negative or not, to the gauge.
+        """
+        with self._lock:
+            self._value += amount
+
+
+class Histogram:
+    """
+    A metric that counts observed values in buckets by their upper bounds and keeps
+    their sum.
+
+    Attributes:
+    -----------
+    _bounds: Tuple[float, ...]
+        The upper bounds of the buckets, in increasing order.
+    _counts: List[int]
+        The number of values observed in each bucket, the last one above all bounds.
+    _sum: float
+        The sum of the observed values.
+    _lock: Lock
+        The lock held while a value is observed.
+
+    Properties:
+    -----------
+        count: int
+            The number of observed values.
+        sum: float
+            The sum of the observed values.
+    """
+
+    kind = "histogram"
+
+    def __init__(self, buckets: Sequence[float] = SECONDS) -> None:
+        """
+        Initializes an empty histogram.
+
+        Parameters:
+        -----------
+            buckets: Sequence[float]
+                The upper bounds of the buckets (Default: `SECONDS`).
+        """
+        if not buckets:
+            raise ValueError("histograms need at least one bucket")
+        self._bounds = tuple(sorted(float(bound) for bound in buckets))
+        self._counts = [0] * (len(self._bounds) + 1)
+        self._sum = 0.0
+        self._lock = Lock()
+
+    @property
+    def count(self) -> int:
+        """
+        The number of observed values.
+        """
+        return sum(self._counts)
+
+    @property
+    def sum(self) -> float:
+        """
+        The sum of the observed values.
+        """
+        return self._sum
+
+    def observe(self, value: float) -> None:
+        """
+        Counts a value in the first bucket whose bound is not below it.
+        """
+        index = bisect_left(self._bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def samples(self, name: str, labels: Labels) -> List[str]:
+        """
+        Returns the lines of the histogram in the Prometheus text format, with the
+        cumulative count of every bucket.
+        """
+        with self._lock:
+            counts, total = list(self._counts), self._sum
+        lines = []
+        cumulative = 0
+        for bound, count in zip((*self._bounds, math.inf), counts):
+            cumulative += count
+            le = f'le="{_format(bound)}"'
+            lines.append(f"{name}_bucket{_labels(labels, le)} {cumulative}")
+        lines.append(f"{name}_sum{_labels(labels)} {_format(total)}")
+        lines.append(f"{name}_count{_labels(labels)} {cumulative}")
+        return lines
+
+
+Metric = Union[Counter, Gauge, Histogram]
+
+
+class Metrics:
+    """
+    A registry of metrics by name and labels.
+
+    Attributes:
+    -----------
+    _metrics: Dict[str, Tuple[str, str, Dict[Labels, Metric]]]
+        The help text, the kind and the metrics of every name, by their labels.
+    _lock: Lock
+        The lock held while a metric is created.
+    """
+
+    def __init__(self) -> None:
+        """
+        Initializes an empty registry.
+        """
+        self._metrics: Dict[str, Tuple[str, str, Dict[Labels, Metric]]] = {}
+        self._lock = Lock()
+
+    def counter(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[Dict[str, str]] = None,
+        function: Optional[Callable[[], float]] = None,
+    ) -> Counter:
+        """
+        Returns the counter of a name and labels, creating it first if needed.
+        Raises `ValueError` if the name belongs to another kind of metric.
+
+        Parameters:
+        -----------
+            name: str
+                The name of the metric, such as `"life_frame_cache_hits_total"`.
+            description: str
+                The help text of the metric, used when it is created.
+            labels: Optional[Dict[str, str]]
+                The labels of the metric (Default: None, no labels).
+            function: Optional[Callable[[], float]]
+                Returns the value of the metric when it is rendered (Default: None,
+                the value added with `inc()`).
+        """
+        counter = self._metric(name, description, labels, Counter.kind, Counter, function)
+        assert isinstance(counter, Counter)
+        return counter
+
+    def gauge(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[Dict[str, str]] = None,
+        function: Optional[Callable[[], float]] = None,
+    ) -> Gauge:
+        """
+        Returns the gauge of a name and labels, creating it first if needed. Takes
+        the parameters of `counter()`.
+        """
+        gauge = self._metric(name, description, labels, Gauge.kind, Gauge, function)
+        assert isinstance(gauge, Gauge)
+        return gauge
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[Dict[str, str]] = None,
+        buckets: Sequence[float] = SECONDS,
+    ) -> Histogram:
+        """
+        Returns the histogram of a name and labels, creating it first if needed.
+        Takes the parameters of `counter()`, with the upper bounds of its buckets
+        (Default: `SECONDS`) instead of a function.
+        """
+        histogram = self._metric(
+            name, description, labels, Histogram.kind, Histogram, buckets
+        )
+        assert isinstance(histogram, Histogram)
+        return histogram
+
+    def render(self) -> str:
+        """
+        Returns all metrics in the Prometheus text exposition format.
+        """
+        with self._lock:
+            families = [
+                (name, description, kind, list(metrics.items()))
+                for name, (description, kind, metrics) in sorted(self._metrics.items())
+            ]
+        lines = []
+        for name, description, kind, metrics in families:
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} {kind}")
+            for labels, metric in metrics:
+                lines.extend(metric.samples(name, labels))
+        return "\n".join(lines) + "\n"
+
+    def _metric(
+        self,
+        name: str,
+        description: str,
+        labels: Optional[Dict[str, str]],
+        kind: str,
+        create: Callable[[Any], Metric],
+        argument: Any,
+    ) -> Metric:
+        # Existing metrics are looked up without locking.
+        key: Labels = tuple(sorted((labels or {}).items()))
+        family = self._metrics.get(name)
+        metric = family[2].get(key) if family is not None else None
+        if metric is None:
+            with self._lock:
+                family = self._metrics.setdefault(name, (description, kind, {}))
+                if family[1] == kind and key not in family[2]:
+                    family[2][key] = create(argument)
+                metric = family[2].get(key)
+        if family is None or family[1] != kind or metric is None:
+            raise ValueError(f"metric {name} is not a {kind}")
+        return metric
+
+
+metrics = Metrics()
@@ -0,0 +1,200 @@
+"""
+Profiler for Game of Life Application
+
+This module profiles a number of calls of the application's hot paths, such as
+forming generations and serving `/life` requests, with `cProfile` when profiling is
+enabled with the `--profile` command-line argument or `GAME_OF_LIFE_PROFILE`. The
+profile is written to the `logs` directory once the calls were profiled, so hot spots
+of a running server can be diagnosed without redeploying it.
+
+Functionality:
+--------------
+1. Profiling:
+    - `Profiler.run()` calls a function, profiled until the given number of calls
+        were profiled, unprofiled afterwards or while another call is profiled.
+    - Once the calls were profiled, or if profiling is disabled, a call costs a
+        single check.
+
+2. Output:
+    - `<name>-<pid>-<time>.pstats`: The statistics of `cProfile`, to be read with
+        `pstats` or viewers such as `snakeviz`.
+    - `<name>-<pid>-<time>.collapsed`: The call stacks in the collapsed format of
+        `flamegraph.pl` and `speedscope`, one `caller;callee <microseconds>` line per
+        stack. `cProfile` only records callers and callees, so the stacks are
+        rebuilt from the call graph and the time of a function called from several
+        places is split by the time spent under each caller.
+
+Usage:
+------
+```python
+from core import Profiler, config
+
+profiler = Profiler("generation", config.profile)
+profiler.run(game.form_new_generation)
+```
+"""
+
+import os
+import time
+import pstats
+import cProfile
+from typing import Any, Dict, List, Tuple, TypeVar, Callable
+from threading import Lock
+
+from .logger_setup import logger
+from .logger_config import logs_directory
+
+T = TypeVar("T")
+
+Function = Tuple[str, int, str]
+
+# Held while any call is profiled. A thread has a single profile function, so a call
+# profiled inside another, like a generation formed by a profiled request, is
+# only recorded by the outer profile.
+_profiling = Lock()
+
+
+def collapsed_stacks(stats: pstats.Stats) -> List[str]:
+    """
+    Returns the call stacks of profile statistics in the collapsed format, one
+    `caller;callee <microseconds>` line per stack with the time spent in the last
+    function of the stack itself. Stacks are rebuilt from the callers of every
+    function; recursive calls are folded into the first call.
+
+    Parameters:
+    -----------
+        stats: pstats.Stats
+            The statistics of a profile.
+    """
+    entries: Dict[Function, Any] = stats.stats  # type: ignore[attr-defined]
+    callees: Dict[Function, Dict[Function, float]] = {}
+    for function, (_, _, _, _, callers) in entries.items():
+        for caller, (_, _, _, cumulative) in callers.items():
+            callees.setdefault(caller, {})[function] = cumulative
+
+    def label(function: Function) -> str:
+        filename, line, name = function
+        if filename == "~":
+            return name
+        return f"{name} ({os.path.basename(filename)}:{line})"
+
+    lines: List[str] = []
+
+    def walk(function: Function, stack: List[Function], share: float) -> None:
+        own = entries[function][2]
+        stack.append(function)
+        if own * share >= 1e-6:
+            frames = ";".join(map(label, stack))
+            lines.append(f"{frames} {round(own * share * 1e6)}")
+        for callee, time_under in callees.get(function, {}).items():
+            # Stacks under a microsecond are dropped, which also bounds the walk.
+            total = entries[callee][3] if callee in entries else 0.0
+            if callee not in stack and total > 0 and share * time_under >= 1e-6:
+                walk(callee, stack, share * min(1.0, time_under / total))
+        stack.pop()
+
+    for function, (_, _, _, _, callers) in entries.items():
+        if not callers:
+            walk(function, [], 1.0)
+    return lines
+
+
+class Profiler:
+    """
+    Profiles a number of calls with `cProfile` and writes the profile to the `logs`
+    directory once they were profiled.
+
+    Attributes:
+    -----------
+    _name: str
+        The name of the profile, the prefix of its files.
+    _remaining: int
+        The number of calls still to profile.
+    _directory: str
+        The directory the profile is written to.
+    _profile: Optional[cProfile.Profile]
+        The profile, until it is written.
+
+    Properties:
+    -----------
+        active: bool
+            Whether calls are still profiled.
+        remaining: int
+            The number of calls still to profile.
+    """
+
+    def __init__(self, name: str, calls: int, directory: str = logs_directory) -> None:
+        """
+        Initializes a profiler.
+
+        Parameters:
+        -----------
+            name: str
+                The name of the profile, such as `"generation"`.
+            calls: int
+                The number of calls to profile, none to disable profiling.
+            directory: str
+                The directory to write the profile to (Default: `logs`).
+        """
+        self._name = name
+        self._remaining = max(0, calls)
+        self._directory = directory
+        self._profile = cProfile.Profile() if calls > 0 else None
+
+    @property
+    def active(self) -> bool:
+        """
+        Whether calls are still profiled.
+        """
+        return self._remaining > 0
+
+    @property
+    def remaining(self) -> int:
+        """
+        The number of calls still to profile.
+        """
+        return self._remaining
+
+    def run(self, function: Callable[..., T], *args: Any) -> T:
+        """
+        Calls a function with the given arguments and returns its result. The call is
+        profiled while the profiler is active, unless another call is profiled.
+
+        Parameters:
+        -----------
+            function: Callable[..., T]
+                The function to call.
+            args: Any
+                The arguments of the function.
+        """
+        if self._remaining <= 0 or not _profiling.acquire(blocking=False):
+            return function(*args)
+        try:
+            profile = self._profile
+            if profile is None or self._remaining <= 0:
+                return function(*args)
+            profile.enable()
+            try:
+                return function(*args)
+            finally:
+                profile.disable()
+                self._remaining -= 1
+                if self._remaining == 0:
+                    self._profile = None
+                    self._dump(profile)
+        finally:
+            _profiling.release()
+
+    def _dump(self, profile: cProfile.Profile) -> None:
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        path = os.path.join(self._directory, f"{self._name}-{os.getpid()}-{stamp}")
+        try:
+            os.makedirs(self._directory, exist_ok=True)
+            stats = pstats.Stats(profile)
+            stats.dump_stats(path + ".pstats")
+            with open(path + ".collapsed", "w", encoding="utf-8") as file:
+                file.writelines(line + "\n" for line in collapsed_stacks(stats))
+        except OSError:
+            logger.exception("could not write the %s profile to '%s'", self._name, path)
+            return
+        logger.info("%s profile written to '%s.pstats'", self._name, path)
@@ -0,0 +1,172 @@
+"""
+Stepping Engines for Game of Life Application
+
+This module contains the engines that store the cells of the game world and advance
+it from one generation to the next. `GameOfLife` owns exactly one engine and
+delegates all of the per-cell work to it, so the representation of the world can
+be chosen without changing the game or its callers. Every engine but the
+`"unbounded"` one uses toroidal (wrap-around) boundary conditions, and all of them
+produce exactly the same generations. Engines follow any Life-like rule in B/S
+notation, compiled once into a lookup table that all of them share.
+
+Modules:
+--------
+- `engine/base.py`: Defines the abstract `Engine` class every engine implements.
+
+- `engine/rule.py`: Defines the `Rule` class, a Life-like rule in B/S notation
+    compiled into a lookup table indexed by the state of a cell and its number of
+    alive neighbors, and the `parse_rule()` function.
+
+- `engine/python.py`: Defines the `PythonEngine`, a pure Python reference
+    implementation that visits every cell in a double loop.
+
+- `engine/vectorized.py`: Defines the `NumpyEngine`, which keeps the world in a
+    NumPy `uint8` array and counts neighbors with sliced array sums.
+
+- `engine/bitpacked.py`: Defines the `BitPackedEngine`, which packs every row into
+    a single integer and counts neighbors of a whole row with bitwise full-adder
+    logic.
+
+- `engine/hashlife.py`: Defines the `HashLifeEngine`, which fast-forwards the world
+    by powers of two generations through a quadtree of canonicalised, memoised
+    nodes.
+
+- `engine/tiled.py`: Defines the `TiledEngine`, which only recomputes the tiles of
+    the world whose neighborhood changed in the last generations.
+
+- `engine/sparse.py`: Defines the `SparseEngine` and `UnboundedSparseEngine`, which
+    store only the alive cells of the world.
+
+- `engine/parallel.py`: Defines the `ParallelEngine`, which forms horizontal
+    stripes of the world in a pool of worker processes over shared memory.
+
+- `engine/registry.py`: Defines the `ENGINES` registry and the `create_engine()`
+    factory used by `GameOfLife` to select an engine by name.
+
+Classes:
+--------
+Engine(ABC):
+    The base class of every engine. Defines the `world`, `previous_world` and
+    `population` properties and the `load()`, `step()`, `advance()` and
+    `changes()` methods. `changes()` returns the flat indices of the cells born
+    and died in the last step. `load_array()` loads a world from a NumPy array
+    without iterating over its cells, unless the engine stores Python objects.
+    `cells` exposes the world as a read-only NumPy array, `nbytes` estimates the
+    memory of the world and `close()` releases resources such as worker
+    processes. `rule` is the compiled rule the engine was created with. Engines
+    that are not `bounded` keep cells outside the world grid, which `cell_keys`
+    and `key_changes()` identify as well.
+
+Rule:
+    A Life-like rule: the neighbor counts a dead cell is born with (`birth`) and
+    an alive cell survives with (`survival`), over a neighborhood given as a 3x3
+    `mask` (Moore, von Neumann, hexagonal or custom). Compiled into a read-only
+    `table` indexed by state and neighbor count, which engines read with one
+    lookup per cell; `lookup` and `bits` hold the same table as nested tuples and
+    as the bits of an integer. Rules that give birth without alive neighbors
+    (`B0`) are not supported.
+
+PythonEngine(Engine):
+    Registered as `"python"`. Keeps the world as `List[List[bool]]`.
+
+NumpyEngine(Engine):
+    Registered as `"numpy"`. Keeps the world in two preallocated NumPy `uint8`
+    arrays that are swapped on every step, and exposes them as the read-only
+    `cells` and `previous_cells` views. `neighbors()` returns the neighbor count of
+    every cell. It is the default engine of `GameOfLife`.
+
+BitPackedEngine(Engine):
+    Registered as `"bitpacked"`. Keeps every row as a packed integer, one bit per
+    cell, which needs about 64 times less memory than a list of booleans.
+
+HashLifeEngine(NumpyEngine):
+    Registered as `"hashlife"`. Forms single generations like the `NumpyEngine`,
+    but `advance()` skips `2^k` generations at once with the HashLife algorithm.
+    The node cache is bounded, also while jumping: a jump that does not fit is
+    split, and the oldest nodes are evicted between jumps. `advance()` raises
+    `TimeoutError` and leaves the world unchanged once it took longer than the
+    given timeout.
+
+TiledEngine(NumpyEngine):
+    Registered as `"tiled"`. Splits the world into tiles and skips the tiles whose
+    neighborhood holds still lifes or period-2 oscillators only. Reports the share
+    of recomputed tiles as `active_ratio`.
+
+SparseEngine(Engine):
+    Registered as `"sparse"`. Keeps a sorted array of the alive cells only, so the
+    cost of a step grows with the number of alive cells rather than the area.
+    Random worlds are seeded in a centered soup of at most 128x128 cells, which
+    keeps huge worlds such as 100,000 x 100,000 cheap.
+
+UnboundedSparseEngine(SparseEngine):
+    Registered as `"unbounded"`. A `SparseEngine` on an unbounded plane instead
+    of a torus; the world grid is only a window onto the plane. It is not
+    `bounded`: its `cell_keys` and `key_changes()` cover the whole plane.
+
+ParallelEngine(NumpyEngine):
+    Registered as `"parallel"`. Forms horizontal stripes of the world in
+    `config.workers` processes (`GAME_OF_LIFE_WORKERS`), which read and write two
+    `multiprocessing.shared_memory` buffers instead of pickling the world. Its
+    workers are stopped by `close()` or when the engine is garbage collected.
+
+Attributes:
+-----------
+ENGINES: Dict[str, Type[Engine]]
+    The registry of all engines, keyed by their `name`.
+NEIGHBORHOODS: Dict[str, str]
+    The 3x3 masks of the named neighborhoods: `"moore"`, `"vonneumann"` and
+    `"hexagonal"`.
+CONWAY: Rule
+    Conway's Game of Life, `B3/S23`, the default rule of every engine.
+
+Functions:
+----------
+create_engine(name: str, width: int, height: int, rule: Optional[Rule] = None) -> Engine:
+    Creates an engine registered under the given name that follows the given
+    rule. Raises `ValueError` if there is no such engine.
+parse_rule(notation: str, neighborhood: Optional[str] = None) -> Rule:
+    Compiles a rule in B/S notation such as `"B36/S23"`, once per notation. A `V`
+    or `H` suffix selects the von Neumann or hexagonal neighborhood, `/N` and a
+    3x3 mask a custom one, and `neighborhood` replaces the one of the notation.
+    Raises `ValueError` if the notation is not a supported rule.
+
+Usage:
+------
+```python
+from engine import parse_rule, create_engine
+
+engine = create_engine("numpy", 300, 300, parse_rule("B36/S23"))
+engine.load(world)
+engine.step()
+print(engine.world)
+```
+"""
+
+from .base import Engine
+from .rule import CONWAY, NEIGHBORHOODS, Rule, parse_rule
+from .bitpacked import BitPackedEngine
+from .python import PythonEngine
+from .hashlife import HashLifeEngine
+from .tiled import TiledEngine
+from .parallel import ParallelEngine
+from .sparse import SparseEngine, UnboundedSparseEngine
+from .registry import ENGINES, create_engine
+from .vectorized import NumpyEngine
+
+__all__ = [
+    "CONWAY",
+    "ENGINES",
+    "NEIGHBORHOODS",
+    "BitPackedEngine",
+    "Engine",
+    "HashLifeEngine",
+    "NumpyEngine",
+    "ParallelEngine",
+    "PythonEngine",
+    "Rule",
+    "SparseEngine",
+    "TiledEngine",
+    "UnboundedSparseEngine",
+    "create_engine",
+    "parse_rule",
+]
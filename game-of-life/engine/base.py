@@ -0,0 +1,287 @@
+import random
+from abc import ABC, abstractmethod
+from typing import List, Tuple, ClassVar, Iterable, Optional, Sequence, cast
+
+import numpy as np
+import numpy.typing as npt
+
+from .rule import CONWAY, Rule
+
+
+class Engine(ABC):
+    """
+    Base class of every stepping engine. An engine owns the cells of a world of a
+    fixed size, toroidal (wrap-around) unless stated otherwise, and knows how to
+    advance it by one or more generations. `GameOfLife` delegates all of the
+    per-cell work to an engine, so the representation of the world can be chosen
+    independently of the game.
+
+    Attributes:
+    -----------
+    name: str
+        The name the engine is registered under in `ENGINES`.
+    bounded: bool
+        Whether every alive cell is inside the world grid, so that `live_indices`
+        and `changes()` describe the whole world.
+    _width: int
+        The width of the world grid.
+    _height: int
+        The height of the world grid.
+    _rule: Rule
+        The compiled rule the engine forms new generations with.
+
+    Properties:
+    -----------
+        width: int
+            The width of the world grid.
+        height: int
+            The height of the world grid.
+        rule: Rule
+            The compiled rule the engine forms new generations with.
+        world: List[List[bool]]
+            The current world grid.
+        previous_world: List[List[bool]]
+            The world grid before the last step.
+        population: int
+            The number of alive cells in the current world grid.
+        live_cells: List[Tuple[int, int]]
+            The `(row, column)` positions of the alive cells in the current world.
+        live_indices: npt.NDArray[np.int64]
+            The sorted flat indices `row * width + column` of the alive cells.
+        cell_keys: npt.NDArray[np.int64]
+            Unique keys of all alive cells, also of those outside the world grid.
+        cells: npt.NDArray[np.uint8]
+            The current world grid as a read-only `height x width` array.
+        nbytes: int
+            An estimate of the memory the engine uses for the world, in bytes.
+    """
+
+    name: ClassVar[str]
+    bounded: ClassVar[bool] = True
+
+    def __init__(self, width: int, height: int, rule: Optional[Rule] = None) -> None:
+        """
+        Initializes an empty engine of the given size.
+
+        Parameters:
+        -----------
+            width: int
+                The width of the world grid.
+            height: int
+                The height of the world grid.
+            rule: Optional[Rule]
+                The compiled rule to form new generations with (Default: None,
+                Conway's B3/S23).
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError(f"world size must be positive, got {width}x{height}")
+        self._width = width
+        self._height = height
+        self._rule = rule or CONWAY
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the engine, including its size.
+        """
+        return f"{type(self).__name__}[width:{self._width}, height:{self._height}]"
+
+    @property
+    def width(self) -> int:
+        """
+        The width of the world grid.
+        """
+        return self._width
+
+    @property
+    def height(self) -> int:
+        """
+        The height of the world grid.
+        """
+        return self._height
+
+    @property
+    def rule(self) -> Rule:
+        """
+        The compiled rule the engine forms new generations with.
+        """
+        return self._rule
+
+    @property
+    @abstractmethod
+    def world(self) -> List[List[bool]]:
+        """
+        The current world grid.
+        """
+
+    @property
+    @abstractmethod
+    def previous_world(self) -> List[List[bool]]:
+        """
+        The world grid before the last step.
+        """
+
+    @property
+    def population(self) -> int:
+        """
+        The number of alive cells in the current world grid.
+        """
+        return sum(map(sum, self.world))
+
+    @property
+    def live_cells(self) -> List[Tuple[int, int]]:
+        """
+        The `(row, column)` positions of the alive cells in the current world.
+        """
+        return [
+            (i, j)
+            for i, row in enumerate(self.world)
+            for j, cell in enumerate(row)
+            if cell
+        ]
+
+    @property
+    def live_indices(self) -> npt.NDArray[np.int64]:
+        """
+        The sorted flat indices `row * width + column` of the alive cells in the
+        current world.
+        """
+        return np.flatnonzero(self.cells).astype(np.int64)
+
+    @property
+    def cell_keys(self) -> npt.NDArray[np.int64]:
+        """
+        Unique integer keys of all alive cells of the world, also of those outside
+        the world grid if the engine is not `bounded`. The `live_indices` by
+        default.
+        """
+        return self.live_indices
+
+    @property
+    def cells(self) -> npt.NDArray[np.uint8]:
+        """
+        The current world grid as a read-only `height x width` array, `1` for alive
+        and `0` for dead cells.
+        """
+        cells = np.array(self.world, dtype=np.uint8).reshape(self._height, self._width)
+        cells.flags.writeable = False
+        return cells
+
+    @property
+    def nbytes(self) -> int:
+        """
+        An estimate of the memory the engine uses for the world, in bytes. Defaults
+        to one byte per cell for both the current and the previous world.
+        """
+        return 2 * self._width * self._height
+
+    @abstractmethod
+    def load(self, world: Sequence[Sequence[bool]]) -> None:
+        """
+        Replaces the current world grid. The previous world grid becomes equal to
+        the loaded one.
+
+        Parameters:
+        -----------
+            world: Sequence[Sequence[bool]]
+                The world grid of `height` rows by `width` cells.
+        """
+
+    def load_array(self, cells: npt.NDArray[np.uint8]) -> None:
+        """
+        Replaces the current world grid with a `height x width` array, nonzero for
+        alive cells. The previous world grid becomes equal to the loaded one. Engines
+        that keep the world in arrays copy it at once instead of cell by cell.
+
+        Parameters:
+        -----------
+            cells: npt.NDArray[np.uint8]
+                The world grid as a `height x width` array.
+        """
+        if cells.shape != (self._height, self._width):
+            raise ValueError(
+                f"world size does not match engine size {self._width}x{self._height}"
+            )
+        # An array is a sequence of rows, which the array-based engines convert
+        # without iterating over its cells.
+        self.load(cast(Sequence[Sequence[bool]], cells.astype(np.bool_, copy=False)))
+
+    def load_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Replaces the current world grid with one where only the given cells are
+        alive. The previous world grid becomes equal to the loaded one.
+
+        Parameters:
+        -----------
+            cells: Iterable[Tuple[int, int]]
+                The `(row, column)` positions of the alive cells.
+        """
+        world = [[False] * self._width for _ in range(self._height)]
+        for i, j in cells:
+            world[i % self._height][j % self._width] = True
+        self.load(world)
+
+    def randomize(self) -> None:
+        """
+        Replaces the current world grid with randomly assigned alive and dead cells.
+        """
+        self.load(
+            [
+                [bool(random.randint(0, 1)) for _ in range(self._width)]
+                for _ in range(self._height)
+            ]
+        )
+
+    @abstractmethod
+    def step(self) -> None:
+        """
+        Advances the world by one generation.
+        """
+
+    def changes(self) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """
+        Returns the cells that were born and the cells that died in the last step,
+        as sorted flat indices `row * width + column` of the world grid.
+        """
+        world = np.array(self.world, dtype=np.bool_).ravel()
+        previous_world = np.array(self.previous_world, dtype=np.bool_).ravel()
+        born = np.flatnonzero(world & ~previous_world).astype(np.int64)
+        died = np.flatnonzero(previous_world & ~world).astype(np.int64)
+        return born, died
+
+    def key_changes(self) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        """
+        Returns the cells that were born and the cells that died in the last step
+        as `cell_keys`, also those outside the world grid if the engine is not
+        `bounded`. The `changes()` by default.
+        """
+        return self.changes()
+
+    def advance(self, generations: int, timeout: Optional[float] = None) -> None:
+        """
+        Advances the world by the given number of generations. Engines that jump
+        ahead, whose cost does not follow from the number of generations, raise
+        `TimeoutError` and leave the world unchanged once they took longer than the
+        timeout; forming every generation ignores it.
+
+        Parameters:
+        -----------
+            generations: int
+                The number of generations to advance by.
+            timeout: Optional[float]
+                The longest time a jump may take, in seconds (Default: None, no
+                limit).
+        """
+        for _ in range(generations):
+            self.step()
+
+    def close(self) -> None:
+        """
+        Releases the resources held by the engine, such as worker processes. The
+        engine must not be used afterwards.
+        """
+
+    def _check_size(self, world: Sequence[Sequence[bool]]) -> None:
+        if len(world) != self._height or any(len(row) != self._width for row in world):
+            raise ValueError(
+                f"world size does not match engine size {self._width}x{self._height}"
+            )
@@ -0,0 +1,312 @@
+import time
+from typing import Dict, List, Tuple, Optional
+from itertools import islice
+
+import numpy as np
+import numpy.typing as npt
+
+from .rule import Rule
+from .vectorized import NumpyEngine
+
+
+class _Node:
+    """
+    An immutable quadtree node. A node of level `k` covers `2^k x 2^k` cells; leaves
+    (level 0) are single cells and have no children.
+    """
+
+    __slots__ = ("level", "nw", "ne", "sw", "se", "population", "results")
+
+    def __init__(
+        self,
+        level: int,
+        population: int,
+        children: Optional[Tuple["_Node", "_Node", "_Node", "_Node"]] = None,
+    ) -> None:
+        self.level = level
+        self.population = population
+        self.nw, self.ne, self.sw, self.se = children or (self, self, self, self)
+        self.results: Dict[int, "_Node"] = {}
+
+
+_DEAD = _Node(0, 0)
+_ALIVE = _Node(0, 1)
+
+
+class _CacheFull(Exception):
+    """
+    Raised when a jump would grow the node cache past its bound.
+    """
+
+
+class HashLifeEngine(NumpyEngine):
+    """
+    An engine that fast-forwards the world with the HashLife algorithm. The world is
+    split into a quadtree of canonicalised nodes, so identical regions are shared,
+    and the centre of every node after `2^j` generations is memoised on the node.
+    Advancing by `2^j` generations then costs about as much as the number of
+    distinct regions, no matter how large `j` is.
+
+    The toroidal world is turned into a quadtree by tiling the plane with copies of
+    it, which evolves exactly like the torus. Single steps are formed by the
+    inherited `NumpyEngine`, only `advance()` goes through the quadtree.
+
+    Chaotic worlds share few regions, so their jumps are expensive however short.
+    A jump that would outgrow the node cache is split into smaller ones, and
+    `advance()` gives up with a `TimeoutError`, leaving the world unchanged, once it
+    took longer than the given timeout.
+
+    Attributes:
+    -----------
+    STEP_THRESHOLD: int
+        Advancing by at most this many generations steps one generation at a time.
+    _max_nodes: int
+        The maximum number of canonical nodes in the node cache, also while jumping.
+    _deadline: float
+        The `time.monotonic()` time the current `advance()` gives up at.
+    _created: int
+        The number of nodes created, counted to check the deadline now and then.
+    _nodes: Dict[Tuple[_Node, _Node, _Node, _Node], _Node]
+        The node cache, mapping the children of a node to the canonical node.
+    _empty: List[_Node]
+        The canonical empty node of every level.
+    _evictions: int
+        The number of times the node cache has been evicted.
+    """
+
+    name = "hashlife"
+    STEP_THRESHOLD = 64
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        max_nodes: int = 1_000_000,
+        rule: Optional[Rule] = None,
+    ) -> None:
+        super().__init__(width, height, rule)
+        self._max_nodes = max_nodes
+        self._deadline = float("inf")
+        self._created = 0
+        self._nodes: Dict[Tuple[_Node, _Node, _Node, _Node], _Node] = {}
+        self._empty: List[_Node] = [_DEAD]
+        self._evictions = 0
+
+        # The smallest root whose centre half covers the whole world.
+        self._base_level = max(3, (max(width, height) - 1).bit_length() + 1)
+
+    @property
+    def cached_nodes(self) -> int:
+        """
+        The number of canonical nodes in the node cache.
+        """
+        return len(self._nodes)
+
+    @property
+    def evictions(self) -> int:
+        """
+        The number of times the node cache has been evicted.
+        """
+        return self._evictions
+
+    @property
+    def nbytes(self) -> int:
+        # A node takes about 200 bytes including its entry in the node cache.
+        return super().nbytes + 200 * len(self._nodes)
+
+    def advance(self, generations: int, timeout: Optional[float] = None) -> None:
+        if generations <= self.STEP_THRESHOLD:
+            super().advance(generations)
+            return
+
+        # Form the generations below the threshold directly, then jump through the
+        # quadtree by the remaining powers of two. The last generation is formed
+        # directly as well, so that the previous world is kept.
+        jumps = generations - 1
+        low = self.STEP_THRESHOLD.bit_length() - 1
+        world, previous = self._cells.copy(), self._prev_cells.copy()
+        if timeout is not None:
+            self._deadline = time.monotonic() + timeout
+        try:
+            super().advance(jumps & ((1 << low) - 1))
+            cells = self._cells
+            for j in range(low, jumps.bit_length()):
+                if jumps >> j & 1:
+                    cells = self._jump(cells, j)
+        except TimeoutError:
+            self._cells[...], self._prev_cells[...] = world, previous
+            raise
+        finally:
+            self._deadline = float("inf")
+        self._cells[...] = cells
+        self.step()
+
+    def _jump(self, cells: npt.NDArray[np.uint8], j: int) -> npt.NDArray[np.uint8]:
+        self._check_deadline()
+        try:
+            level = max(self._base_level, j + 2)
+            result = self._successor(self._tile(cells, level), j)
+        except _CacheFull:
+            # A jump that does not fit into the node cache is split in two halves,
+            # down to forming its generations directly.
+            self._evict()
+            if j > self.STEP_THRESHOLD.bit_length() - 1:
+                return self._jump(self._jump(cells, j - 1), j - 1)
+            self._cells[...] = cells
+            super().advance(1 << j)
+            return self._cells.copy()
+
+        jumped = np.zeros_like(cells)
+        self._fill(result, jumped, 0, 0)
+        return jumped
+
+    def _check_deadline(self) -> None:
+        if time.monotonic() > self._deadline:
+            raise TimeoutError("advancing took too long, skip fewer generations")
+
+    def _join(self, nw: _Node, ne: _Node, sw: _Node, se: _Node) -> _Node:
+        key = (nw, ne, sw, se)
+        node = self._nodes.get(key)
+        if node is None:
+            if len(self._nodes) >= self._max_nodes:
+                raise _CacheFull()
+            self._created += 1
+            if not self._created & 1023:
+                self._check_deadline()
+            population = nw.population + ne.population + sw.population + se.population
+            node = _Node(nw.level + 1, population, key)
+            self._nodes[key] = node
+        return node
+
+    def _evict(self) -> None:
+        # Drop the oldest nodes until the cache is half full. Nodes are immutable, so
+        # evicted nodes stay valid for everyone still holding them, but their
+        # memoised results are dropped, as they would keep evicted subtrees alive.
+        # Evicting only between jumps keeps the nodes of a jump canonical, otherwise
+        # the recursion would stop sharing work.
+        excess = len(self._nodes) - self._max_nodes // 2
+        for key in list(islice(self._nodes, excess)):
+            self._nodes.pop(key).results.clear()
+        self._evictions += 1
+
+    def _empty_node(self, level: int) -> _Node:
+        while len(self._empty) <= level:
+            empty = self._empty[-1]
+            self._empty.append(self._join(empty, empty, empty, empty))
+        return self._empty[level]
+
+    def _tile(self, cells: npt.NDArray[np.uint8], level: int) -> _Node:
+        """
+        Builds a node of the given level covering the plane tiled with copies of the
+        world, positioned so that the world starts at the top left corner of the
+        node's centre.
+        """
+        height, width = self._height, self._width
+        grid = cells.tolist()
+        built: Dict[Tuple[int, int, int], _Node] = {}
+
+        def build(k: int, y: int, x: int) -> _Node:
+            if k == 0:
+                return _ALIVE if grid[y % height][x % width] else _DEAD
+            key = (k, y % height, x % width)
+            node = built.get(key)
+            if node is None:
+                half = 1 << (k - 1)
+                node = self._join(
+                    build(k - 1, y, x),
+                    build(k - 1, y, x + half),
+                    build(k - 1, y + half, x),
+                    build(k - 1, y + half, x + half),
+                )
+                built[key] = node
+            return node
+
+        offset = -(1 << (level - 2))
+        return build(level, offset, offset)
+
+    def _fill(self, node: _Node, out: npt.NDArray[np.uint8], y: int, x: int) -> None:
+        """
+        Writes the alive cells of a node positioned at `(y, x)` into the world grid,
+        skipping everything outside of it.
+        """
+        if node.population == 0 or y >= self._height or x >= self._width:
+            return
+        if node.level == 0:
+            out[y, x] = 1
+            return
+        half = 1 << (node.level - 1)
+        self._fill(node.nw, out, y, x)
+        self._fill(node.ne, out, y, x + half)
+        self._fill(node.sw, out, y + half, x)
+        self._fill(node.se, out, y + half, x + half)
+
+    def _successor(self, node: _Node, j: int) -> _Node:
+        """
+        Returns the centre of a node (one level lower) after `2^j` generations, where
+        `j` is at most `node.level - 2`.
+        """
+        if node.population == 0:
+            return self._empty_node(node.level - 1)
+        result = node.results.get(j)
+        if result is not None:
+            return result
+
+        if node.level == 2:
+            result = self._life_4x4(node)
+        else:
+            nw, ne, sw, se = node.nw, node.ne, node.sw, node.se
+            level = node.level - 1
+            step = min(j, level - 2)
+            c1 = self._successor(nw, step)
+            c2 = self._successor(self._join(nw.ne, ne.nw, nw.se, ne.sw), step)
+            c3 = self._successor(ne, step)
+            c4 = self._successor(self._join(nw.sw, nw.se, sw.nw, sw.ne), step)
+            c5 = self._successor(self._join(nw.se, ne.sw, sw.ne, se.nw), step)
+            c6 = self._successor(self._join(ne.sw, ne.se, se.nw, se.ne), step)
+            c7 = self._successor(sw, step)
+            c8 = self._successor(self._join(sw.ne, se.nw, sw.se, se.sw), step)
+            c9 = self._successor(se, step)
+
+            if j < node.level - 2:
+                # The first half already advanced by 2^j, only re-centre.
+                result = self._join(
+                    self._join(c1.se, c2.sw, c4.ne, c5.nw),
+                    self._join(c2.se, c3.sw, c5.ne, c6.nw),
+                    self._join(c4.se, c5.sw, c7.ne, c8.nw),
+                    self._join(c5.se, c6.sw, c8.ne, c9.nw),
+                )
+            else:
+                result = self._join(
+                    self._successor(self._join(c1, c2, c4, c5), step),
+                    self._successor(self._join(c2, c3, c5, c6), step),
+                    self._successor(self._join(c4, c5, c7, c8), step),
+                    self._successor(self._join(c5, c6, c8, c9), step),
+                )
+
+        node.results[j] = result
+        return result
+
+    def _life_4x4(self, node: _Node) -> _Node:
+        """
+        Returns the centre 2x2 cells of a 4x4 node after one generation.
+        """
+        cells = [
+            [
+                quadrant.population
+                for parent in parents
+                for quadrant in (
+                    (parent.nw, parent.ne) if top else (parent.sw, parent.se)
+                )
+            ]
+            for parents in ((node.nw, node.ne), (node.sw, node.se))
+            for top in (True, False)
+        ]
+
+        lookup = self._rule.lookup
+        offsets = self._rule.offsets
+        centre = []
+        for i in (1, 2):
+            for j in (1, 2):
+                near = sum(cells[i + di][j + dj] for di, dj in offsets)
+                centre.append(_ALIVE if lookup[cells[i][j]][near] else _DEAD)
+        return self._join(*centre)
@@ -0,0 +1,157 @@
+import weakref
+from typing import Any, List, Tuple, Optional, Sequence
+from multiprocessing import pool, get_context
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+import numpy.typing as npt
+
+from core import config
+
+from .rule import Rule
+from .vectorized import NumpyEngine, _apply_rule
+
+# The world buffers and the rule of a worker process, attached once by `_attach()`.
+_buffers: List[npt.NDArray[np.uint8]] = []
+_segments: List[SharedMemory] = []
+_rules: List[Rule] = []
+
+
+def _attach(names: Tuple[str, str], shape: Tuple[int, int], rule: Rule) -> None:
+    for name in names:
+        segment = SharedMemory(name)
+        _segments.append(segment)
+        _buffers.append(np.ndarray(shape, dtype=np.uint8, buffer=segment.buf))
+    _rules.append(rule)
+
+
+def _step_stripe(task: Tuple[int, int, int]) -> None:
+    """
+    Forms the rows `[top, bottom)` of the next generation from the buffer `source`
+    into the other buffer. The rows just above and below the stripe are read as
+    halo rows, wrapping around the edges.
+    """
+    source, top, bottom = task
+    cells, new_cells = _buffers[source], _buffers[1 - source]
+    height, width = cells.shape
+
+    padded = np.empty((bottom - top + 2, width + 2), dtype=np.uint8)
+    padded[1:-1, 1:-1] = cells[top:bottom]
+    padded[0, 1:-1] = cells[top - 1]
+    padded[-1, 1:-1] = cells[bottom % height]
+    padded[:, 0] = padded[:, -2]
+    padded[:, -1] = padded[:, 1]
+
+    rule = _rules[0]
+    rows = bottom - top
+    near = cells[top:bottom] * np.uint8(rule.table.shape[1])
+    for dy, dx in np.add(rule.offsets, 1).tolist():
+        near += padded[dy : dy + rows, dx : dx + width]  # noqa: E203
+    _apply_rule(rule, near, new_cells[top:bottom])
+
+
+def _release(workers: List[pool.Pool], segments: List[SharedMemory]) -> None:
+    for worker_pool in workers:
+        worker_pool.terminate()
+    for segment in segments:
+        segment.close()
+        segment.unlink()
+
+
+class ParallelEngine(NumpyEngine):
+    """
+    An engine that splits the world into horizontal stripes and forms them in a pool
+    of worker processes. Both generations live in `multiprocessing.shared_memory`
+    buffers that every worker attaches to once, so the world is never pickled; a
+    task only carries the buffer index and the rows of its stripe. Each worker reads
+    one halo row above and below its stripe, which keeps the toroidal (wrap-around)
+    boundary conditions, and the result is identical to the `NumpyEngine`.
+
+    Process pools only pay off on large worlds: below a few million cells the cost
+    of dispatching the stripes outweighs the work.
+
+    Attributes:
+    -----------
+    _workers: int
+        The number of worker processes, and stripes.
+    _segments: List[SharedMemory]
+        The shared memory segments of the two world buffers.
+    _buffers: List[npt.NDArray[np.uint8]]
+        The two world buffers; one holds the current generation and the other the
+        previous one.
+    _source: int
+        The index of the buffer holding the current generation.
+    _pool: List[pool.Pool]
+        The worker pool, created on the first step.
+    """
+
+    name = "parallel"
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        workers: Optional[int] = None,
+        rule: Optional[Rule] = None,
+    ) -> None:
+        super().__init__(width, height, rule)
+        self._workers = max(1, min(workers or config.workers, height))
+        self._segments = [SharedMemory(create=True, size=width * height) for _ in "ab"]
+        self._buffers = [
+            np.ndarray((height, width), dtype=np.uint8, buffer=segment.buf)
+            for segment in self._segments
+        ]
+        for buffer in self._buffers:
+            buffer[...] = 0
+        self._source = 0
+        self._pool: List[pool.Pool] = []
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._segments)
+        self._sync()
+
+        bounds = np.linspace(0, height, self._workers + 1).astype(int).tolist()
+        self._stripes = list(zip(bounds[:-1], bounds[1:]))
+
+    @property
+    def workers(self) -> int:
+        """
+        The number of worker processes.
+        """
+        return self._workers
+
+    def load(self, world: Sequence[Sequence[bool]]) -> None:
+        self._check_size(world)
+        self._buffers[0][...] = np.array(world, dtype=np.bool_)
+        self._buffers[1][...] = self._buffers[0]
+        self._source = 0
+        self._sync()
+
+    def step(self) -> None:
+        if not self._pool:
+            self._pool.append(
+                get_context().Pool(
+                    self._workers,
+                    initializer=_attach,
+                    initargs=(
+                        tuple(segment.name for segment in self._segments),
+                        (self._height, self._width),
+                        self._rule,
+                    ),
+                )
+            )
+        tasks = [(self._source, top, bottom) for top, bottom in self._stripes]
+        self._pool[0].map(_step_stripe, tasks)
+        self._source = 1 - self._source
+        self._sync()
+
+    def close(self) -> None:
+        """
+        Stops the worker processes and releases the shared memory.
+        """
+        self._finalizer()
+
+    def __getstate__(self) -> Any:
+        raise TypeError(f"{type(self).__name__} cannot be pickled")
+
+    def _sync(self) -> None:
+        self._cells = self._buffers[self._source]
+        self._prev_cells = self._buffers[1 - self._source]
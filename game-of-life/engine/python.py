@@ -0,0 +1,103 @@
+from typing import List, Tuple, Optional, Sequence
+
+from .base import Engine
+from .rule import Rule
+
+
+class PythonEngine(Engine):
+    """
+    A pure Python engine that keeps the world as nested lists of booleans and visits
+    every cell on each step. It is the reference implementation the other engines
+    are checked against. A cell is formed by looking up its state and its number of
+    alive neighbors in the table of the rule.
+
+    The engine double buffers the world: every new generation is written into the
+    lists of the previous one and the two grids are swapped, so stepping does not
+    allocate any lists. `world` and `previous_world` return the buffers themselves,
+    which must not be modified and are overwritten by the following steps.
+
+    Attributes:
+    -----------
+    __world: List[List[bool]]
+        The current state of the world grid.
+    __prev_world: List[List[bool]]
+        The previous state of the world grid, overwritten by the next step.
+    """
+
+    name = "python"
+
+    def __init__(self, width: int, height: int, rule: Optional[Rule] = None) -> None:
+        super().__init__(width, height, rule)
+        self.__world = [[False] * width for _ in range(height)]
+        self.__prev_world = [[False] * width for _ in range(height)]
+
+    @property
+    def world(self) -> List[List[bool]]:
+        return self.__world
+
+    @property
+    def previous_world(self) -> List[List[bool]]:
+        return self.__prev_world
+
+    @property
+    def nbytes(self) -> int:
+        # One pointer per cell and a list object per row, for both worlds.
+        return 2 * self._height * (8 * self._width + 56)
+
+    def load(self, world: Sequence[Sequence[bool]]) -> None:
+        self._check_size(world)
+        for row, prev_row, cells in zip(self.__world, self.__prev_world, world):
+            row[:] = map(bool, cells)
+            prev_row[:] = row
+
+    def step(self) -> None:
+        new_world = self.__prev_world
+        lookup = self._rule.lookup
+        system = self._rule.offsets
+
+        for i in range(len(self.__world)):
+            for j in range(len(self.__world[0])):
+                near = self.get_near(self.__world, (i, j), system)
+                new_world[i][j] = lookup[self.__world[i][j]][near]
+
+        self.__prev_world = self.__world
+        self.__world = new_world
+
+    @staticmethod
+    def get_near(
+        world: Sequence[Sequence[bool]],
+        pos: Tuple[int, int],
+        system: Optional[Tuple[Tuple[int, int], ...]] = None,
+    ) -> int:
+        """
+        A static method that counts the number of alive neighbors around a specific
+        cell position in the game world. Uses toroidal (wrap-around) boundary
+        conditions.
+
+        Parameters:
+        -----------
+            world: Sequence[Sequence[bool]]
+                The game world grid.
+            pos: Tuple[int, int]
+                A specific cell position to check around.
+            system: Optional[Tuple[Tuple[int, int], ...]] = None
+                The `(row, column)` offsets of the neighbors, such as the `offsets`
+                of a rule (Default: None, the Moore neighborhood).
+        """
+        if system is None:
+            system = (
+                (-1, -1),
+                (-1, 0),
+                (-1, 1),
+                (0, -1),
+                (0, 1),
+                (1, -1),
+                (1, 0),
+                (1, 1),
+            )
+
+        count = 0
+        for i in system:
+            if world[(pos[0] + i[0]) % len(world)][(pos[1] + i[1]) % len(world[0])]:
+                count += 1
+        return count
@@ -0,0 +1,50 @@
+from typing import Dict, Type, Optional
+
+from .base import Engine
+from .rule import Rule
+from .tiled import TiledEngine
+from .python import PythonEngine
+from .sparse import SparseEngine, UnboundedSparseEngine
+from .hashlife import HashLifeEngine
+from .parallel import ParallelEngine
+from .bitpacked import BitPackedEngine
+from .vectorized import NumpyEngine
+
+ENGINES: Dict[str, Type[Engine]] = {
+    engine.name: engine
+    for engine in (
+        PythonEngine,
+        NumpyEngine,
+        BitPackedEngine,
+        HashLifeEngine,
+        TiledEngine,
+        SparseEngine,
+        UnboundedSparseEngine,
+        ParallelEngine,
+    )
+}
+
+
+def create_engine(
+    name: str, width: int, height: int, rule: Optional[Rule] = None
+) -> Engine:
+    """
+    Creates an engine registered under the given name.
+
+    Parameters:
+    -----------
+        name: str
+            The name of the engine in `ENGINES`.
+        width: int
+            The width of the world grid.
+        height: int
+            The height of the world grid.
+        rule: Optional[Rule]
+            The compiled rule the engine forms new generations with (Default: None,
+            Conway's B3/S23).
+    """
+    try:
+        engine = ENGINES[name]
+    except KeyError:
+        raise ValueError(f"unknown engine: {name!r}") from None
+    return engine(width, height, rule=rule)
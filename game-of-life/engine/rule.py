@@ -0,0 +1,249 @@
+import re
+from typing import Dict, Tuple, Iterable, Optional, FrozenSet
+from functools import lru_cache
+
+import numpy as np
+import numpy.typing as npt
+
+NEIGHBORHOODS: Dict[str, str] = {
+    "moore": "111101111",
+    "vonneumann": "010101010",
+    "hexagonal": "110101011",
+}
+
+# The suffix of a neighborhood in B/S notation, as in Golly. Custom neighborhoods
+# are written as `/N` followed by their mask.
+_SUFFIXES = {"moore": "", "vonneumann": "V", "hexagonal": "H"}
+
+_NOTATION = re.compile(r"B([0-8]*)/S([0-8]*)(?:([VH])|/N([01]{9}))?", re.IGNORECASE)
+
+
+class Rule:
+    """
+    A Life-like rule in B/S notation, compiled into a lookup table. A dead cell is
+    born when its number of alive neighbors is one of the `birth` counts, and an
+    alive cell survives when it is one of the `survival` counts. The neighbors of a
+    cell are the cells of its 3x3 block selected by a mask, so every engine keeps
+    reading the same halo of one cell around it.
+
+    The table is indexed by the state of a cell and its number of alive neighbors,
+    so engines form a cell with a single lookup instead of branching on the rule.
+    Rules are immutable; `parse_rule()` compiles every notation once and all engines
+    of the rule share it.
+
+    Attributes:
+    -----------
+    _birth: FrozenSet[int]
+        The neighbor counts a dead cell is born with.
+    _survival: FrozenSet[int]
+        The neighbor counts an alive cell survives with.
+    _mask: str
+        The neighborhood as nine `0` and `1` characters, the rows of the 3x3 block
+        top to bottom. The centre is always `0`.
+    _offsets: Tuple[Tuple[int, int], ...]
+        The `(row, column)` offsets of the neighbors, from `-1` to `1`.
+    _table: npt.NDArray[np.uint8]
+        The read-only `2 x (neighbors + 1)` lookup table, `1` where a cell of the
+        state (row) with the neighbor count (column) is alive in the next
+        generation.
+    _lookup: Tuple[Tuple[bool, ...], ...]
+        The lookup table as nested tuples of booleans.
+    _bits: int
+        The lookup table as the bits of an integer, bit `state * (neighbors + 1) +
+        count` being the entry of the state and count.
+
+    Properties:
+    -----------
+        birth: FrozenSet[int]
+            The neighbor counts a dead cell is born with.
+        survival: FrozenSet[int]
+            The neighbor counts an alive cell survives with.
+        mask: str
+            The neighborhood as a 3x3 mask of nine `0` and `1` characters.
+        neighborhood: str
+            The name of the neighborhood in `NEIGHBORHOODS`, or `"custom"`.
+        offsets: Tuple[Tuple[int, int], ...]
+            The `(row, column)` offsets of the neighbors.
+        table: npt.NDArray[np.uint8]
+            The read-only lookup table indexed by state and neighbor count.
+        lookup: Tuple[Tuple[bool, ...], ...]
+            The lookup table as nested tuples, for engines that keep Python objects.
+        bits: int
+            The lookup table as the bits of an integer.
+        notation: str
+            The rule in B/S notation, such as `"B36/S23"`.
+    """
+
+    def __init__(
+        self, birth: Iterable[int], survival: Iterable[int], mask: str = "111101111"
+    ) -> None:
+        """
+        Compiles a rule. Raises `ValueError` for neighbor counts the neighborhood
+        cannot reach, for masks that are not 3x3 and for rules that give birth to
+        cells without alive neighbors (`B0`), which no engine can follow on an
+        unbounded plane.
+
+        Parameters:
+        -----------
+            birth: Iterable[int]
+                The neighbor counts a dead cell is born with.
+            survival: Iterable[int]
+                The neighbor counts an alive cell survives with.
+            mask: str
+                The neighborhood as nine `0` and `1` characters, the rows of the
+                3x3 block top to bottom, with a `0` centre (Default: Moore).
+        """
+        if len(mask) != 9 or set(mask) - {"0", "1"} or mask[4] != "0":
+            raise ValueError(
+                f"neighborhood must be a 3x3 mask with a dead centre: {mask!r}"
+            )
+        offsets = tuple(
+            (i // 3 - 1, i % 3 - 1) for i, cell in enumerate(mask) if cell == "1"
+        )
+        if not offsets:
+            raise ValueError("neighborhood must have at least one neighbor")
+        self._birth = frozenset(birth)
+        self._survival = frozenset(survival)
+        counts = self._birth | self._survival
+        if counts and not 0 <= min(counts) <= max(counts) <= len(offsets):
+            raise ValueError(
+                f"neighbor counts must be from 0 to {len(offsets)}: {sorted(counts)}"
+            )
+        if 0 in self._birth:
+            raise ValueError("rules with B0 are not supported")
+        self._mask = mask
+        self._offsets = offsets
+
+        table = np.zeros((2, len(offsets) + 1), dtype=np.uint8)
+        table[0, sorted(self._birth)] = 1
+        table[1, sorted(self._survival)] = 1
+        table.flags.writeable = False
+        self._table = table
+        self._lookup = tuple(tuple(row) for row in table.astype(np.bool_).tolist())
+        self._bits = sum(1 << int(index) for index in np.flatnonzero(table))
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the rule, including its notation.
+        """
+        return f"Rule[{self.notation}]"
+
+    def __str__(self) -> str:
+        """
+        Returns the rule in B/S notation.
+        """
+        return self.notation
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, Rule) and self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
+
+    @property
+    def birth(self) -> FrozenSet[int]:
+        """
+        The neighbor counts a dead cell is born with.
+        """
+        return self._birth
+
+    @property
+    def survival(self) -> FrozenSet[int]:
+        """
+        The neighbor counts an alive cell survives with.
+        """
+        return self._survival
+
+    @property
+    def mask(self) -> str:
+        """
+        The neighborhood as a 3x3 mask of nine `0` and `1` characters.
+        """
+        return self._mask
+
+    @property
+    def neighborhood(self) -> str:
+        """
+        The name of the neighborhood in `NEIGHBORHOODS`, or `"custom"`.
+        """
+        for name, mask in NEIGHBORHOODS.items():
+            if mask == self._mask:
+                return name
+        return "custom"
+
+    @property
+    def offsets(self) -> Tuple[Tuple[int, int], ...]:
+        """
+        The `(row, column)` offsets of the neighbors, from `-1` to `1`.
+        """
+        return self._offsets
+
+    @property
+    def table(self) -> npt.NDArray[np.uint8]:
+        """
+        The read-only `2 x (neighbors + 1)` lookup table, indexed by the state of a
+        cell and its number of alive neighbors.
+        """
+        return self._table
+
+    @property
+    def lookup(self) -> Tuple[Tuple[bool, ...], ...]:
+        """
+        The lookup table as nested tuples of booleans, indexed by the state of a cell
+        and its number of alive neighbors.
+        """
+        return self._lookup
+
+    @property
+    def bits(self) -> int:
+        """
+        The lookup table as the bits of an integer, bit `state * (neighbors + 1) +
+        count` being the entry of the state and count.
+        """
+        return self._bits
+
+    @property
+    def notation(self) -> str:
+        """
+        The rule in B/S notation, such as `"B36/S23"`. The von Neumann and hexagonal
+        neighborhoods add a `V` or `H` suffix, custom ones `/N` and their mask.
+        """
+        birth = "".join(map(str, sorted(self._birth)))
+        survival = "".join(map(str, sorted(self._survival)))
+        neighborhood = self.neighborhood
+        suffix = _SUFFIXES.get(neighborhood, f"/N{self._mask}")
+        return f"B{birth}/S{survival}{suffix}"
+
+    def _key(self) -> Tuple[FrozenSet[int], FrozenSet[int], str]:
+        return self._birth, self._survival, self._mask
+
+
+@lru_cache(maxsize=None)
+def parse_rule(notation: str, neighborhood: Optional[str] = None) -> Rule:
+    """
+    Compiles a rule in B/S notation, such as `"B3/S23"` (Conway's Game of Life),
+    `"B36/S23"` (HighLife) or `"B2/S3V"` (von Neumann neighborhood). Every notation
+    is compiled once and the same `Rule` is returned for it afterwards. Raises
+    `ValueError` if the notation is not a supported rule.
+
+    Parameters:
+    -----------
+        notation: str
+            The rule in B/S notation.
+        neighborhood: Optional[str]
+            The neighborhood, a name in `NEIGHBORHOODS` or a 3x3 mask of nine `0`
+            and `1` characters, that replaces the one of the notation (Default:
+            None, the neighborhood of the notation).
+    """
+    match = _NOTATION.fullmatch(notation.strip())
+    if match is None:
+        raise ValueError(f"rule must be in B/S notation, e.g. 'B3/S23': {notation!r}")
+    birth, survival, suffix, mask = match.groups()
+    if neighborhood is not None:
+        mask = NEIGHBORHOODS.get(neighborhood.lower(), neighborhood)
+    elif suffix is not None:
+        mask = NEIGHBORHOODS["vonneumann" if suffix.upper() == "V" else "hexagonal"]
+    return Rule(map(int, birth), map(int, survival), mask or NEIGHBORHOODS["moore"])
+
+
+CONWAY = parse_rule("B3/S23")
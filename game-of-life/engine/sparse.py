@@ -0,0 +1,198 @@
+import random
+from typing import List, Tuple, Iterable, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from .base import Engine
+from .rule import Rule
+
+
+class SparseEngine(Engine):
+    """
+    An engine that stores only the alive cells of the world, as a sorted array of
+    integer keys `row * stride + column`. Candidates for the next generation are
+    generated from the neighborhoods of the alive cells only, so memory and the cost
+    of a step grow with the number of alive cells instead of the area of the world.
+    The world uses toroidal (wrap-around) boundary conditions.
+
+    Attributes:
+    -----------
+    SOUP_SIZE: int
+        `randomize()` fills a centered square of at most this size, so that huge
+        worlds start with a few thousand alive cells.
+    _stride: int
+        The multiplier of the row in a cell key.
+    _keys: npt.NDArray[np.int64]
+        The sorted keys of the alive cells of the current world.
+    _prev_keys: npt.NDArray[np.int64]
+        The sorted keys of the alive cells of the previous world.
+    _offsets: npt.NDArray[np.int64]
+        The `(row, column)` offsets of the cells an alive cell is a neighbor of, and
+        of the cell itself, as an `n x 2` array.
+    """
+
+    name = "sparse"
+    SOUP_SIZE = 128
+
+    def __init__(self, width: int, height: int, rule: Optional[Rule] = None) -> None:
+        super().__init__(width, height, rule)
+        self._stride = width
+        self._keys: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+        self._prev_keys = self._keys
+        # A cell is a neighbor of the cells at the opposite offsets of the rule.
+        self._offsets = -np.array([(0, 0), *self._rule.offsets], dtype=np.int64)
+
+    @property
+    def world(self) -> List[List[bool]]:
+        return self._grid(self._keys)
+
+    @property
+    def previous_world(self) -> List[List[bool]]:
+        return self._grid(self._prev_keys)
+
+    @property
+    def population(self) -> int:
+        return len(self._keys)
+
+    @property
+    def nbytes(self) -> int:
+        return int(self._keys.nbytes + self._prev_keys.nbytes)
+
+    @property
+    def live_cells(self) -> List[Tuple[int, int]]:
+        rows, cols = self._decode(self._keys)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    @property
+    def live_indices(self) -> npt.NDArray[np.int64]:
+        return np.sort(self._flat(self._keys))
+
+    def load(self, world: Sequence[Sequence[bool]]) -> None:
+        self._check_size(world)
+        rows, cols = np.nonzero(np.array(world, dtype=np.bool_))
+        self._keys = self._encode(rows, cols)
+        self._prev_keys = self._keys
+
+    def load_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        positions = np.array(list(cells), dtype=np.int64).reshape(-1, 2)
+        self._keys = np.unique(
+            self._encode(*self._wrap(positions[:, 0], positions[:, 1]))
+        )
+        self._prev_keys = self._keys
+
+    def randomize(self) -> None:
+        height, width = min(self._height, self.SOUP_SIZE), min(
+            self._width, self.SOUP_SIZE
+        )
+        top, left = (self._height - height) // 2, (self._width - width) // 2
+        self.load_cells(
+            (top + i, left + j)
+            for i in range(height)
+            for j in range(width)
+            if random.randint(0, 1)
+        )
+
+    def changes(self) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        return (
+            self._flat(np.setdiff1d(self._keys, self._prev_keys, assume_unique=True)),
+            self._flat(np.setdiff1d(self._prev_keys, self._keys, assume_unique=True)),
+        )
+
+    def step(self) -> None:
+        # Every alive cell is a candidate of its own as well, so that cells without
+        # alive neighbors are looked up too; it is taken off its count below.
+        rows, cols = self._decode(self._keys)
+        near_rows, near_cols = self._wrap(
+            (rows[:, None] + self._offsets[:, 0]).ravel(),
+            (cols[:, None] + self._offsets[:, 1]).ravel(),
+        )
+        candidates, counts = np.unique(
+            self._encode(near_rows, near_cols), return_counts=True
+        )
+
+        index = np.searchsorted(self._keys, candidates).clip(max=len(self._keys) - 1)
+        alive = self._keys[index] == candidates
+
+        table = self._rule.table
+        self._prev_keys = self._keys
+        self._keys = candidates[table.ravel()[alive * (table.shape[1] - 1) + counts] == 1]
+
+    def _wrap(
+        self, rows: npt.NDArray[np.int64], cols: npt.NDArray[np.int64]
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        return rows % self._height, cols % self._width
+
+    def _encode(
+        self, rows: npt.NDArray[np.int64], cols: npt.NDArray[np.int64]
+    ) -> npt.NDArray[np.int64]:
+        keys: npt.NDArray[np.int64] = rows.astype(np.int64) * self._stride + cols
+        return keys
+
+    def _decode(
+        self, keys: npt.NDArray[np.int64]
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        rows, cols = np.divmod(keys, self._stride)
+        return rows, cols
+
+    def _grid(self, keys: npt.NDArray[np.int64]) -> List[List[bool]]:
+        grid = np.zeros(self._height * self._width, dtype=np.bool_)
+        grid[self._flat(keys)] = True
+        world: List[List[bool]] = grid.reshape(self._height, self._width).tolist()
+        return world
+
+    def _flat(self, keys: npt.NDArray[np.int64]) -> npt.NDArray[np.int64]:
+        """
+        Returns the flat indices `row * width + column` of the keys inside the world
+        grid, in the order of the keys.
+        """
+        rows, cols = self._decode(keys)
+        inside = (rows >= 0) & (rows < self._height) & (cols >= 0) & (cols < self._width)
+        flat: npt.NDArray[np.int64] = rows[inside] * self._width + cols[inside]
+        return flat
+
+
+class UnboundedSparseEngine(SparseEngine):
+    """
+    A `SparseEngine` on an unbounded plane instead of a torus. Cells may leave the
+    `width x height` window, which is only used to show the world and to seed it;
+    they keep evolving outside of it. `population` counts all alive cells.
+
+    Attributes:
+    -----------
+    LIMIT: int
+        Cells may not move further than this from the origin on either axis.
+    """
+
+    name = "unbounded"
+    bounded = False
+    LIMIT = 1 << 30
+
+    def __init__(self, width: int, height: int, rule: Optional[Rule] = None) -> None:
+        super().__init__(width, height, rule)
+        self._stride = 4 * self.LIMIT
+
+    @property
+    def cell_keys(self) -> npt.NDArray[np.int64]:
+        return self._keys
+
+    def key_changes(self) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        return (
+            np.setdiff1d(self._keys, self._prev_keys, assume_unique=True),
+            np.setdiff1d(self._prev_keys, self._keys, assume_unique=True),
+        )
+
+    def _wrap(
+        self, rows: npt.NDArray[np.int64], cols: npt.NDArray[np.int64]
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        if len(rows) and max(np.abs(rows).max(), np.abs(cols).max()) >= self.LIMIT:
+            raise OverflowError(f"cells moved further than {self.LIMIT} from the origin")
+        return rows, cols
+
+    def _decode(
+        self, keys: npt.NDArray[np.int64]
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        # Columns may be negative, so they are decoded around the middle of a row.
+        half = self._stride // 2
+        rows, cols = np.divmod(keys + half, self._stride)
+        return rows, cols - half
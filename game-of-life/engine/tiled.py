@@ -0,0 +1,153 @@
+from typing import Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from .rule import Rule
+from .vectorized import NumpyEngine, _apply_rule
+
+
+class TiledEngine(NumpyEngine):
+    """
+    An engine that splits the world into square tiles and only recomputes the tiles
+    whose neighborhood changed in the last generation. The engine writes every new
+    generation into the buffer of the generation before the current one and swaps
+    the buffers. A tile is tracked as changed when its new state differs from the
+    one it overwrites, i.e. from its state two generations ago. If the whole
+    neighborhood of a tile matches its state two generations ago, the tile repeats
+    that state as well, which is already in the buffer, so both still lifes and
+    period-2 oscillators (blinkers, beacons, toads) cost no work.
+
+    All active tiles are gathered into one array and stepped together, which keeps
+    the per-tile overhead out of Python. When most tiles are active, the whole world
+    is stepped at once and the changed tiles are found afterwards.
+
+    Attributes:
+    -----------
+    FULL_STEP_RATIO: float
+        Above this fraction of active tiles the whole world is stepped at once.
+    _tile_size: Tuple[int, int]
+        The height and width of a tile.
+    _tile_rows: npt.NDArray[np.intp]
+        The wrapped row indices of every row of tiles, including one halo row on
+        each side. The last tile is shifted back so that all tiles are full-size.
+    _tile_cols: npt.NDArray[np.intp]
+        The wrapped column indices of every column of tiles, including the halo.
+    _row_starts: npt.NDArray[np.intp]
+        The first row of every row of tiles without the shift of the last tile.
+    _col_starts: npt.NDArray[np.intp]
+        The first column of every column of tiles without the shift of the last tile.
+    _active: npt.NDArray[np.bool_]
+        The tiles that have to be recomputed on the next step.
+    _spare_cells: npt.NDArray[np.uint8]
+        A third world buffer the whole world is stepped into.
+
+    Properties:
+    -----------
+        tile_count: int
+            The total number of tiles.
+        active_tiles: int
+            The number of tiles recomputed on the next step.
+        active_ratio: float
+            The fraction of tiles recomputed on the next step.
+    """
+
+    name = "tiled"
+    FULL_STEP_RATIO = 0.25
+
+    def __init__(
+        self, width: int, height: int, tile_size: int = 16, rule: Optional[Rule] = None
+    ) -> None:
+        super().__init__(width, height, rule)
+        tile_height, tile_width = min(tile_size, height), min(tile_size, width)
+        self._tile_size = (tile_height, tile_width)
+        self._tile_rows = self._halo_indices(height, tile_height)
+        self._tile_cols = self._halo_indices(width, tile_width)
+        self._row_starts = np.arange(0, height, tile_height)
+        self._col_starts = np.arange(0, width, tile_width)
+        self._active = np.ones((len(self._tile_rows), len(self._tile_cols)), np.bool_)
+        self._spare_cells = np.zeros_like(self._cells)
+
+    @property
+    def tile_count(self) -> int:
+        """
+        The total number of tiles.
+        """
+        return int(self._active.size)
+
+    @property
+    def active_tiles(self) -> int:
+        """
+        The number of tiles recomputed on the next step.
+        """
+        return int(np.count_nonzero(self._active))
+
+    @property
+    def active_ratio(self) -> float:
+        """
+        The fraction of tiles recomputed on the next step.
+        """
+        return self.active_tiles / self.tile_count
+
+    @property
+    def nbytes(self) -> int:
+        return super().nbytes + self._spare_cells.nbytes + self._active.nbytes
+
+    def load(self, world: Sequence[Sequence[bool]]) -> None:
+        super().load(world)
+        self._active[...] = True
+
+    def step(self) -> None:
+        cells = self._cells
+        new_cells = self._prev_cells
+        tile_ys, tile_xs = np.nonzero(self._active)
+
+        if len(tile_ys) > self.FULL_STEP_RATIO * self.tile_count:
+            # Form the generation into the spare buffer, which then replaces the
+            # overwritten one, so that the changes can be found without a copy.
+            alive = self._spare_cells
+            self._next_generation(alive)
+            changed = np.logical_or.reduceat(
+                np.logical_or.reduceat(alive != new_cells, self._row_starts, axis=0),
+                self._col_starts,
+                axis=1,
+            )
+            self._spare_cells, new_cells = new_cells, alive
+            self._active = self._dilate(changed)
+        elif len(tile_ys):
+            rows = self._tile_rows[tile_ys][:, :, None]
+            cols = self._tile_cols[tile_xs][:, None, :]
+            blocks = cells[rows, cols]
+
+            tile_height, tile_width = self._tile_size
+            near = blocks[:, 1:-1, 1:-1] * np.uint8(self._rule.table.shape[1])
+            for dy, dx in np.add(self._rule.offsets, 1).tolist():
+                near += blocks[
+                    :, dy : dy + tile_height, dx : dx + tile_width  # noqa: E203
+                ]
+
+            alive = np.empty_like(near)
+            _apply_rule(self._rule, near, alive)
+            changed = np.zeros_like(self._active)
+            changed[tile_ys, tile_xs] = (
+                alive != new_cells[rows[:, 1:-1], cols[:, :, 1:-1]]
+            ).any(axis=(1, 2))
+            new_cells[rows[:, 1:-1], cols[:, :, 1:-1]] = alive
+            self._active = self._dilate(changed)
+
+        self._prev_cells = cells
+        self._cells = new_cells
+
+    @staticmethod
+    def _halo_indices(size: int, tile: int) -> npt.NDArray[np.intp]:
+        starts = [min(start, size - tile) for start in range(0, size, tile)]
+        return np.array(
+            [np.arange(start - 1, start + tile + 1) % size for start in starts],
+            dtype=np.intp,
+        )
+
+    @staticmethod
+    def _dilate(tiles: npt.NDArray[np.bool_]) -> npt.NDArray[np.bool_]:
+        # Mark the neighbors of every changed tile, wrapping around the edges.
+        rows = tiles | np.roll(tiles, 1, axis=0) | np.roll(tiles, -1, axis=0)
+        return rows | np.roll(rows, 1, axis=1) | np.roll(rows, -1, axis=1)
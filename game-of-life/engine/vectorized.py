@@ -0,0 +1,192 @@
+from typing import List, Tuple, Optional, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from .base import Engine
+from .rule import Rule
+
+# The number of cells the lookup table is applied to at once.
+_CHUNK = 1 << 16
+
+
+def _chunk_rows(row: int) -> int:
+    # The number of rows of `row` cells each applied at once.
+    return max(1, _CHUNK // max(1, row))
+
+
+def _apply_rule(
+    rule: Rule,
+    index: npt.NDArray[np.uint8],
+    out: npt.NDArray[np.uint8],
+    scratch: Optional[npt.NDArray[np.uint32]] = None,
+) -> None:
+    """
+    Writes the entries of the lookup table of a rule into `out`, for the indices
+    `state * (neighbors + 1) + count` of all cells. The table is read as the bits of
+    an integer, since shifting them out is several times faster than indexing an
+    array. The rows of the first axis are shifted a chunk at a time into a `uint32`
+    scratch buffer of `_chunk_rows()` rows, so that it stays small however large
+    the world is.
+    """
+    rows = _chunk_rows(index[:1].size)
+    if scratch is None:
+        shape = (min(rows, len(index)),) + index.shape[1:]
+        scratch = np.empty(shape, dtype=np.uint32)
+    bits = np.uint32(rule.bits)
+    for top in range(0, len(index), rows):
+        chunk = index[top : top + rows]  # noqa: E203
+        shifted = np.right_shift(bits, chunk, out=scratch[: len(chunk)])
+        np.bitwise_and(
+            shifted, 1, out=out[top : top + rows], casting="unsafe"  # noqa: E203
+        )
+
+
+class NumpyEngine(Engine):
+    """
+    An engine that keeps the world in a NumPy `uint8` array and counts the neighbors
+    of all cells at once by summing shifted slices of a padded copy of the world,
+    one per neighbor of the rule. The padding border is filled from the opposite
+    edges, which keeps the toroidal (wrap-around) boundary conditions of the
+    reference engine. The sum starts from the state of every cell weighted by the
+    row length of the lookup table of the rule, so that a single lookup forms every
+    cell.
+
+    The engine double buffers the world: every new generation is written into the
+    buffer of the previous one and the buffers are swapped, so stepping does not
+    allocate any arrays.
+
+    Attributes:
+    -----------
+    _cells: npt.NDArray[np.uint8]
+        The current state of the world grid, `1` for alive and `0` for dead cells.
+    _prev_cells: npt.NDArray[np.uint8]
+        The previous state of the world grid, overwritten by the next step.
+    _padded: npt.NDArray[np.uint8]
+        A `(height + 2) x (width + 2)` scratch buffer holding the wrapped world.
+    _shifted: List[npt.NDArray[np.uint8]]
+        Views of `_padded` shifted towards each of the neighbors of the rule.
+    _near: npt.NDArray[np.uint8]
+        A `height x width` scratch buffer holding the lookup table index of every
+        cell, made of its state and its neighbor count.
+    _lookup: npt.NDArray[np.uint32]
+        A scratch buffer holding the shifted lookup table for a chunk of rows.
+    _changed: npt.NDArray[np.bool_]
+        A `height x width` scratch buffer holding the cells changed in the last step.
+
+    Properties:
+    -----------
+        cells: npt.NDArray[np.uint8]
+            A read-only view of the current world grid.
+        previous_cells: npt.NDArray[np.uint8]
+            A read-only view of the world grid before the last step.
+    """
+
+    name = "numpy"
+
+    def __init__(self, width: int, height: int, rule: Optional[Rule] = None) -> None:
+        super().__init__(width, height, rule)
+        self._cells: npt.NDArray[np.uint8] = np.zeros((height, width), dtype=np.uint8)
+        self._prev_cells = self._cells.copy()
+        self._padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        # The offsets of the neighbors are moved past the border of the padding.
+        self._shifted = [
+            self._padded[dy : height + dy, dx : width + dx]  # noqa: E203
+            for dy, dx in np.add(self._rule.offsets, 1).tolist()
+        ]
+        self._near = np.zeros((height, width), dtype=np.uint8)
+        self._lookup = np.zeros((min(_chunk_rows(width), height), width), dtype=np.uint32)
+        self._changed = np.zeros((height, width), dtype=np.bool_)
+
+    @property
+    def world(self) -> List[List[bool]]:
+        return self._cells.view(np.bool_).tolist()  # type: ignore[no-any-return]
+
+    @property
+    def previous_world(self) -> List[List[bool]]:
+        return self._prev_cells.view(np.bool_).tolist()  # type: ignore[no-any-return]
+
+    @property
+    def population(self) -> int:
+        return int(np.count_nonzero(self._cells))
+
+    @property
+    def nbytes(self) -> int:
+        buffers = (self._cells, self._prev_cells, self._padded, self._near)
+        scratch = self._lookup.nbytes + self._changed.nbytes
+        return sum(buffer.nbytes for buffer in buffers) + scratch
+
+    @property
+    def live_cells(self) -> List[Tuple[int, int]]:
+        rows, cols = np.nonzero(self._cells)
+        return list(zip(rows.tolist(), cols.tolist()))
+
+    @property
+    def cells(self) -> npt.NDArray[np.uint8]:
+        """
+        A read-only view of the current world grid.
+        """
+        return self._read_only(self._cells)
+
+    @property
+    def previous_cells(self) -> npt.NDArray[np.uint8]:
+        """
+        A read-only view of the world grid before the last step. The view is
+        overwritten by the next step.
+        """
+        return self._read_only(self._prev_cells)
+
+    def changes(self) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        changed = np.not_equal(self._cells, self._prev_cells, out=self._changed).ravel()
+        indices = np.flatnonzero(changed).astype(np.int64)
+        alive = self._cells.ravel()[indices] == 1
+        return indices[alive], indices[~alive]
+
+    def load(self, world: Sequence[Sequence[bool]]) -> None:
+        self._check_size(world)
+        self._cells[...] = np.array(world, dtype=np.bool_)
+        self._prev_cells[...] = self._cells
+
+    def step(self) -> None:
+        self._next_generation(self._prev_cells)
+        self._cells, self._prev_cells = self._prev_cells, self._cells
+
+    def neighbors(self) -> npt.NDArray[np.uint8]:
+        """
+        Returns the number of alive neighbors of every cell of the current world as
+        a new `height x width` array, counted the way a step counts them.
+        """
+        self._wrap()
+        neighbors: npt.NDArray[np.uint8] = np.sum(self._shifted, axis=0, dtype=np.uint8)
+        return neighbors
+
+    def _wrap(self) -> None:
+        """
+        Copies the current world into the middle of the padded buffer and fills its
+        border from the opposite edges.
+        """
+        cells = self._cells
+        padded = self._padded
+        padded[1:-1, 1:-1] = cells
+        padded[0, 1:-1] = cells[-1]
+        padded[-1, 1:-1] = cells[0]
+        padded[:, 0] = padded[:, -2]
+        padded[:, -1] = padded[:, 1]
+
+    def _next_generation(self, out: npt.NDArray[np.uint8]) -> None:
+        """
+        Writes which cells of the world are alive in the next generation into `out`,
+        which must not be the current world grid.
+        """
+        self._wrap()
+        near = self._near
+        np.multiply(self._cells, self._rule.table.shape[1], out=near)
+        for shifted in self._shifted:
+            near += shifted
+        _apply_rule(self._rule, near, out, self._lookup)
+
+    @staticmethod
+    def _read_only(cells: npt.NDArray[np.uint8]) -> npt.NDArray[np.uint8]:
+        view = cells.view()
+        view.flags.writeable = False
+        return view
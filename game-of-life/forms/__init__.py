@@ -26,10 +26,48 @@ WorldForm(FlaskForm):
         in seconds.
         It accepts values between 0.01 and 1.0 (inclusive) and defaults to 0.01.
 
+    engine: SelectField
+        A select field for choosing the engine that forms new generations, one of
+        the `engine.ENGINES` names but "parallel", which would fork a pool of
+        worker processes from the threaded server for every game. Defaults to
+        "numpy"; "sparse" and "unbounded" keep only the alive cells, the latter on
+        an unbounded plane.
+
+    pattern: SelectField
+        A select field for choosing a pattern of the pattern library to seed the
+        world with, centered. Its choices are set by the application from the
+        library. Defaults to "", a random world.
+
+    upload: FileField
+        A file field for uploading an `.rle` or `.cells` pattern to seed the world
+        with instead, centered.
+    auto_stop: BooleanField
+        A checkbox for stopping the game once it became a still life or an
+        oscillator. Defaults to unchecked.
+
+    rule: StringField
+        A text field for the Life-like rule in B/S notation, such as "B36/S23".
+        Defaults to "B3/S23", Conway's Game of Life.
+
+    neighborhood: SelectField
+        A select field for choosing the neighborhood of the rule: "moore",
+        "vonneumann", "hexagonal" or "custom". Defaults to "moore".
+
+    mask: StringField
+        A text field for the custom neighborhood, nine `0` and `1` characters
+        for the rows of the 3x3 block around a cell, with a `0` centre. Only used
+        with the "custom" neighborhood.
+
     submit: SubmitField
         A button to submit the form and create the game world based on the provided
         dimensions.
 
+    Methods:
+    --------
+    compiled_rule() -> Rule:
+        Compiles the rule of the form with its neighborhood. The `rule` field
+        fails validation if this raises `ValueError`.
+
     Usage:
     ------
     The `WorldSizeForm` can be used in a Flask application to gather user input for
@@ -46,6 +84,7 @@ WorldForm(FlaskForm):
             width = form.width.data
             height = form.height.data
             velocity = form.velocity.data
+            engine = form.engine.data
             # Proceed to create the game with specified dimensions
         return render_template("index.html", form=form)
 ```
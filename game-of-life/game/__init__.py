@@ -5,17 +5,46 @@ This module contains the `GameOfLife` class that implements Conway's Game of Lif
 a cellular automation devised by mathematician John Horton Conway. The game is played
 on a grid where each cell can be either alive (True) or dead (False). The next state
 of the gird is determined by the current state and the number of alive neighbors each
-cell has.
+cell has. The `GameRegistry` hosts many independent games at once,
+and the `Scheduler` advances them in the background and publishes their frames.
+
+Modules:
+--------
+- `game/game.py`: Defines the `GameOfLife` class.
+
+- `game/frame.py`: Defines the `Frame` class and `compose_changes()`.
+
+- `game/history.py`: Defines the `History` class.
+
+- `game/cycles.py`: Defines the `CycleDetector` class and `zobrist_hash()`.
+
+- `game/registry.py`: Defines the `GameRegistry` class.
+
+- `game/scheduler.py`: Defines the `Scheduler` class.
+
+- `game/checkpoint.py`: Defines the checkpoint file format and its functions.
 
 Classes:
 --------
-GameOfLife(metaclass=SingletonMeta):
-    A singleton class that manages the state and behavior of the Game of Life.
-    It initializes the game world, generates new generations, and maintains
-    the current and previous states of the grid.
+GameOfLife:
+    A class that manages the state and behavior of the Game of Life. It initializes
+    the game world, generates new generations, and maintains the current and
+    previous states of the grid. Every instance is an independent game; the
+    application keeps them in a `GameRegistry`.
+
+    Writers hold the game's lock and publish an immutable `Frame` when they are
+    done. Readers only dereference the last published frame, so they never lock
+    and never see a half-formed generation.
 
     Attributes:
     -----------
+    CHANGES_LIMIT: int
+        The number of generations whose changes are kept for `changes_since()`.
+    HISTORY_LIMIT: int
+        The number of generations kept in the history for `snapshot()` and
+        `rewind()`.
+    HISTORY_BUDGET: int
+        The memory the history of a game may use, in bytes.
     __width: int
         The width of the game world grid.
     __height: int
@@ -24,27 +53,83 @@ GameOfLife(metaclass=SingletonMeta):
         The velocity of the world generation in seconds.
     __life_count: int
         The number of generations that have been created.
-    __world: List[List[bool]]
-        The current state of the game world (grid).
-    __prev_world: List[List[bool]]
-        A deep copy of the previous sate of the game world.
+    __engine: Engine
+        The engine that stores the game world (grid) and forms new generations.
+    __changes: Deque[Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]]
+        The cells born and died in each of the last generations, oldest first.
+    __lock: RLock
+        The lock held while the game changes.
+    __clock: Optional[Tuple[float, int]]
+        The time and the life count `catch_up()` counts due generations from.
+    __version: int
+        The number of frames published so far.
+    __frame: Frame
+        The last published frame.
+    __history: History
+        The last generations of the game.
+    __cycles: CycleDetector
+        The detector of the cycle the game enters.
+    __auto_stop: bool
+        Whether the game stops forming generations once it entered a cycle.
 
     Properties:
     -----------
         velocity: float
             The velocity of the world generation in seconds.
+        engine: Engine
+            The engine that stores the game world and forms new generations.
+        rule: Rule
+            The compiled rule the game forms new generations with.
+        lock: RLock
+            The lock held while the game changes. Readers do not need it, they
+            read the last published `frame`.
         world: List[List[bool]]
-            The current game world grid.
+            The current game world grid. Assigning a grid replaces the world.
         previous_world: List[List[bool]]
             The previous game world grid.
         life_count: int
             The number of generations that have occurred.
+        frame: Frame
+            The last published snapshot of the game. Reading it never locks.
+        history: History
+            The last generations of the game, as keyframes and XOR deltas.
+        nbytes: int
+            An estimate of the memory the game uses: its engine, history and frame.
+        period: Optional[int]
+            The number of generations after which the world repeats, `1` for a
+            still life, or `None` if no cycle was detected.
+        stabilized_at: Optional[int]
+            The first generation of the cycle, or `None` if no cycle was detected.
+        auto_stop: bool
+            Whether the game stops forming generations once it entered a cycle.
+        stopped: bool
+            Whether the game stopped forming generations, because it entered a
+            cycle and `auto_stop` is set.
+        next_due: Optional[float]
+            The `time.monotonic()` time the next generation is due at the game's
+            velocity, or `None` before the first `catch_up()`.
 
     Methods:
     --------
-        __init__(width: int = 20, height: int = 20) -> None:
+        __init__(
+            width: int = 20,
+            height: int = 20,
+            velocity: float = 1.0,
+            engine: str = "numpy",
+            cells: Optional[ndarray] = None,
+            life_count: int = 0,
+            cycle_window: int = 64,
+            auto_stop: bool = False,
+            rule: str = "B3/S23",
+        ) -> None:
             Initializes a new Game of Life instance with the specific width and height,
-            generating and initial random world.
+            generating and initial random world unless the initial `cells` are given
+            as a `height x width` array at generation `life_count`. The `engine`
+            selects one of the `engine.ENGINES` to form new generations. Repeats of
+            the world are looked for in the last `cycle_window` generations, and
+            with `auto_stop` the game stops forming generations at its velocity
+            once it entered a cycle. `rule` is the Life-like rule in B/S notation
+            the engine is compiled with.
         __repr__() -> str:
             Returns a string representation of the GameOfLife instance, including its
             width, height, and life count.
@@ -53,17 +138,287 @@ GameOfLife(metaclass=SingletonMeta):
         generate_world() -> None:
             Generates a new random world (grid) for the game, populating it with
             randomly assigned alive and dead cells.
+        load_cells(cells: Iterable[Tuple[int, int]]) -> None:
+            Replaces the current world with one where only the given cells are
+            alive, such as a pattern.
         form_new_generation() -> None:
-            Advances the game to the next generation based on the rules of Conway's Game
-            of Life. Updates the current world and keeps track of the previous world.
-        __get_near(
-            world: List[List[bool]],
-            pos: Tuple[int, int],
-            system: Optional[Tuple[Tuple[int, int], ...]] = None,
-        ) -> int:
-            A static method that counts the number of alive neighbors around a specific
-            cell position in the game world. Uses toroidal (wrap-around) boundary
-            conditions.
+            Advances the game to the next generation based on its Life-like rule,
+            Conway's Game of Life by default. Updates the current world and keeps
+            track of the previous world.
+        advance(generations: int, timeout: Optional[float] = None) -> None:
+            Advances the game by the given number of generations in a single call.
+            Engines that support it (e.g. `"hashlife"`) skip `2^k` generations at
+            once instead of forming every one of them. Such engines give up with
+            `TimeoutError` after the timeout, which leaves the game unchanged.
+        simulate(generations: int, until_stable: bool = False) -> int:
+            Forms the given number of generations without a clock, publishing a
+            frame for every `CHANGES_LIMIT` generations, and returns how many were
+            formed. With `until_stable`, stops early once the game entered a cycle,
+            at the world it would have after all generations.
+        catch_up(now: Optional[float] = None) -> int:
+            Forms the generations that are due at the game's velocity since the
+            first call, including the ones a late caller missed, and returns how
+            many were formed. At most `CHANGES_LIMIT` are formed at once.
+        changes_since(generation: int) -> Optional[Tuple[ndarray, ndarray]]:
+            Returns the flat indices of the cells born and died since the given
+            generation, or `None` if those changes are no longer known.
+        snapshot(generation: int) -> Optional[Frame]:
+            Returns the frame of an earlier generation, rebuilt from the history
+            without changing the game, or `None` if the history does not keep it.
+        rewind(generation: int) -> bool:
+            Returns the game to an earlier generation the history keeps and
+            forgets the generations after it. Returns whether the generation was
+            kept.
+
+History:
+    A bounded history of the last generations of a game. The alive cells are
+    kept as keyframes every few generations, and every generation as the XOR
+    delta of its alive cells with the previous generation. A delta applies in
+    both directions, so any kept generation is rebuilt from the nearest keyframe
+    or the newest generation with at most half a keyframe interval of deltas,
+    instead of replaying the game. The oldest generations are dropped when there
+    are more than `limit` of them or the history exceeds its memory budget.
+
+    Properties:
+    -----------
+        oldest: Optional[int]
+            The oldest generation kept, or `None` if the history is empty.
+        newest: Optional[int]
+            The newest generation kept, or `None` if the history is empty.
+        nbytes: int
+            The memory the deltas and keyframes use, in bytes.
+
+    Methods:
+    --------
+        __init__(width: int, height: int, limit: int = 1024,
+            memory_budget: int = 8 << 20, keyframe_interval: int = 32) -> None:
+            Initializes an empty history.
+        clear() -> None:
+            Forgets all generations, e.g. when the world is replaced.
+        record(frame: Frame) -> None:
+            Records the generations a published frame adds, from the changes it
+            keeps. The history restarts at a frame that does not continue it.
+        alive(generation: int) -> Optional[ndarray]:
+            Returns the flat indices of the alive cells of a kept generation.
+        frame(generation: int, version: int = 0) -> Optional[Frame]:
+            Returns the frame of a kept generation, or `None` if it is not kept.
+        truncate(generation: int) -> Optional[ndarray]:
+            Forgets the generations after a kept generation and returns its alive
+            cells, or `None` if it is not kept.
+
+CycleDetector:
+    Detects when a game repeats one of its recent generations, from a Zobrist
+    hash of every generation updated with the cells that changed in it. A game
+    that repeats a generation is a still life or an oscillator forever, so
+    detection stops at the first repeat.
+
+    Properties:
+    -----------
+        tracking: bool
+            Whether the detector was started since it was last cleared.
+        period: Optional[int]
+            The number of generations after which the world repeats, or `None`.
+        stabilized_at: Optional[int]
+            The first generation of the cycle, or `None`.
+
+    Methods:
+    --------
+        __init__(window: int = 64) -> None:
+            Initializes a detector that looks for repeats in the last `window`
+            generations.
+        clear() -> None:
+            Forgets all generations and the detected cycle.
+        start(alive: ndarray, generation: int) -> None:
+            Starts detecting from a generation, hashing all of its alive cells.
+        update(born: ndarray, died: ndarray, generation: int) -> Optional[int]:
+            Updates the hash with the cells that changed in a generation and
+            returns the period if the generation repeats one in the window.
+
+GameRegistry:
+    A registry of independent games keyed by a random game ID. Games that have
+    not been looked up for `ttl` seconds expire, and the least recently used
+    games are evicted when there are `max_games` games or the estimated memory
+    of the games (`GameOfLife.nbytes`) would exceed the memory budget. Looking up
+    a game never locks; adding and removing games hold the registry's lock.
+    Threads that use a game hold it, and the engine of a game that left the
+    registry is closed once the last of them released it.
+
+    Properties:
+    -----------
+        memory: int
+            The estimated memory all games use, in bytes.
+
+    Methods:
+    --------
+        __init__(max_games: int, ttl: float, memory_budget: int) -> None:
+            Initializes an empty registry. The memory budget is in bytes.
+        add(
+            game: GameOfLife,
+            now: Optional[float] = None,
+            game_id: Optional[str] = None,
+        ) -> str:
+            Adds a game, evicting expired and least recently used games to make
+            room for it, and returns its new ID, or `game_id` if given. Raises
+            `MemoryError` if the game alone exceeds the memory budget.
+        get(game_id: str, now: Optional[float] = None) -> Optional[GameOfLife]:
+            Returns the game with the given ID and marks it as recently used, or
+            `None` if there is no such game or it expired.
+        acquire(game_id: str, now: Optional[float] = None) -> Optional[GameOfLife]:
+            Returns the game with the given ID like `get()` and holds it.
+        hold(game_id: str) -> Optional[GameOfLife]:
+            Returns the game with the given ID and holds it, so that its engine is
+            not closed before it is released, without marking it as used.
+        release(game: GameOfLife) -> None:
+            Releases a held game, closing its engine if it was the last holder of
+            a game that left the registry.
+        expire(now: Optional[float] = None) -> None:
+            Removes the games that were not looked up for `ttl` seconds.
+        remove(game_id: str) -> None:
+            Removes the game with the given ID, if there is one.
+
+Frame:
+    An immutable snapshot of a game at one generation, taken while the game was
+    not changing. Cells are given as read-only arrays of flat indices
+    `row * width + column` of the world grid. Frames are shared by all readers,
+    so the dense grids are built once, when they are first needed.
+
+    Properties:
+    -----------
+        generation: int
+            The life count of the game.
+        width: int
+            The width of the world grid.
+        height: int
+            The height of the world grid.
+        alive: npt.NDArray[np.int64]
+            The sorted flat indices of the alive cells.
+        changes: Tuple[Tuple[ndarray, ndarray], ...]
+            The cells born and died in each of the last generations, oldest first.
+        version: int
+            The number of frames the game published before this one. Unlike the
+            generation, it also changes when the world is replaced.
+        period: Optional[int]
+            The number of generations after which the world repeats, `1` for a
+            still life, or `None` if no cycle was detected.
+        stabilized_at: Optional[int]
+            The first generation of the cycle, or `None` if no cycle was detected.
+        stopped: bool
+            Whether the game stopped forming generations on its own.
+        died: npt.NDArray[np.int64]
+            The cells that died in the last generation.
+        cells: npt.NDArray[np.uint8]
+            The world grid as a read-only `height x width` array.
+        previous_cells: npt.NDArray[np.uint8]
+            The world grid before the last generation as a read-only array.
+        world: List[List[bool]]
+            The world grid.
+        previous_world: List[List[bool]]
+            The world grid before the last generation.
+        nbytes: int
+            An estimate of the memory the frame uses, including built grids.
+
+    Methods:
+    --------
+        __init__(
+            generation: int,
+            width: int,
+            height: int,
+            alive: npt.NDArray[np.int64],
+            changes: Tuple[Tuple[ndarray, ndarray], ...] = (),
+            version: int = 0,
+            period: Optional[int] = None,
+            stabilized_at: Optional[int] = None,
+            stopped: bool = False,
+        ) -> None:
+            Initializes a frame. The arrays must not be changed afterwards.
+        rewind(generation: int) -> Optional[Frame]:
+            Returns the frame of an earlier generation, rebuilt from the changes
+            the frame keeps, or `None` if it does not keep the changes since then.
+        changes_since(generation: int) -> Optional[Tuple[ndarray, ndarray]]:
+            Returns the cells born and died since the given generation, or `None`
+            if the frame does not keep the changes since then.
+
+Scheduler:
+    Advances every game of a registry at its velocity on a background thread and
+    publishes a frame of each game whenever it changed, so that readers such as
+    the HTTP handlers never form generations themselves. A game that fell behind
+    forms all of its missed generations at once and publishes a single frame for
+    them. Given a checkpoint directory, it also checkpoints every game that
+    changed at a fixed interval and once more when it is stopped.
+
+    Properties:
+    -----------
+        running: bool
+            Whether the background thread is running.
+        lag: float
+            How late the scheduler woke up the last time, in seconds.
+        max_lag: float
+            How late the scheduler woke up at worst, in seconds.
+        coalesced: int
+            The number of generations formed without publishing a frame of their
+            own, because the scheduler fell behind.
+
+    Methods:
+    --------
+        __init__(games: GameRegistry, interval: float = 0.05,
+            checkpoints: Optional[str] = None, checkpoint_interval: float = 60.0)
+            -> None:
+            Initializes a scheduler that is not started yet. It sleeps at most
+            `interval` seconds, so that new games start promptly, and checkpoints
+            the games to the `checkpoints` directory, if any, every
+            `checkpoint_interval` seconds.
+        start() -> None:
+            Starts the background thread, unless it is already running.
+        stop(timeout: Optional[float] = None) -> None:
+            Stops the background thread, wakes up all waiting readers and writes a
+            last checkpoint.
+        checkpoint() -> int:
+            Checkpoints every game whose frame changed since its last checkpoint,
+            removes the checkpoints of games that left the registry and returns
+            the number of games checkpointed.
+        publish(game_id: str, game: GameOfLife) -> Frame:
+            Publishes and returns a frame of the game at its current generation.
+        frame(game_id: str) -> Optional[Frame]:
+            Returns the last published frame of a game, or `None` if none was
+            published yet.
+        wait(game_id: str, generation: Optional[int], timeout: float)
+            -> Optional[Frame]:
+            Waits until a frame of a game other than the given generation is
+            published and returns the last published frame of the game.
+        tick(now: Optional[float] = None) -> Optional[float]:
+            Forms the due generations of every game, publishes the frames of the
+            games that changed and returns the time the next generation of any
+            game is due, checkpointing the games when a checkpoint is due.
+
+Functions:
+----------
+compose_changes(steps: Iterable[Tuple[ndarray, ndarray]]) -> Tuple[ndarray, ndarray]:
+    Composes the cells born and died in consecutive generations into the cells
+    born and died over all of them.
+
+zobrist_hash(indices: ndarray) -> int:
+    Returns the XOR of a 64-bit key of every cell, derived from its flat index
+    with the SplitMix64 finalizer instead of a table of keys.
+
+save_checkpoint(game: GameOfLife, path: str) -> None:
+    Writes the last published frame of a game to a checkpoint file through a
+    memory map: a 64 byte header with the size, generation, velocity, rule and
+    engine of the game, followed by a bitmap of the alive cells and the alive
+    cells outside the world grid of unbounded engines. An existing checkpoint is
+    replaced atomically.
+
+load_checkpoint(path: str, cycle_window: int = 64) -> GameOfLife:
+    Restores a game from a checkpoint file, unpacking its bitmap straight from a
+    read-only memory map, and looks for cycles of the restored game in the last
+    `cycle_window` generations. Raises `ValueError` if the file is not a
+    checkpoint.
+
+restore_games(games: GameRegistry, directory: str, cycle_window: int = 64) -> List[str]:
+    Restores the games checkpointed in a directory into a registry under the IDs
+    they had and returns the IDs. Checkpoints that cannot be read are skipped.
+
+checkpoint_files(directory: str) -> List[Tuple[str, str]]:
+    Returns the game ID and path of every checkpoint file in a directory.
 
 Usage:
 ------
@@ -75,8 +430,56 @@ game = GameOfLife()
 game.form_new_generation()
 print(game.world)
 ```
+
+To host many games, add them to a `GameRegistry` and look them up by their ID:
+
+```python
+registry = GameRegistry(max_games=256, ttl=3600, memory_budget=1 << 30)
+game_id = registry.add(GameOfLife(100, 100))
+game = registry.get(game_id)
+```
+
+To advance many games in the background, start a `Scheduler` and read the
+published frames:
+
+```python
+scheduler = Scheduler(registry)
+scheduler.start()
+frame = scheduler.wait(game_id, None, timeout=1.0)
+```
+
+To keep games across restarts, restore them before starting a `Scheduler` that
+checkpoints them:
+
+```python
+restore_games(registry, "checkpoints")
+scheduler = Scheduler(registry, checkpoints="checkpoints", checkpoint_interval=60)
+```
 """
 
 from .game import GameOfLife
+from .frame import Frame
+from .cycles import CycleDetector, zobrist_hash
+from .history import History
+from .registry import GameRegistry
+from .scheduler import Scheduler
+from .checkpoint import (
+    restore_games,
+    load_checkpoint,
+    save_checkpoint,
+    checkpoint_files,
+)
 
-__all__ = ["GameOfLife"]
+__all__ = [
+    "Frame",
+    "GameOfLife",
+    "GameRegistry",
+    "History",
+    "CycleDetector",
+    "zobrist_hash",
+    "Scheduler",
+    "save_checkpoint",
+    "load_checkpoint",
+    "restore_games",
+    "checkpoint_files",
+]
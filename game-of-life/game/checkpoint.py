@@ -0,0 +1,234 @@
+import os
+import mmap
+import struct
+from typing import List, Tuple, Iterable
+
+import numpy as np
+import numpy.typing as npt
+
+from core import logger
+from engine import Rule
+
+from .game import GameOfLife
+from .registry import GameRegistry
+
+MAGIC = b"GOLC"
+VERSION = 2
+FLAG_AUTO_STOP = 0x01
+EXTENSION = ".ckpt"
+
+# magic, version, flags, reserved, width, height, generation, velocity, birth,
+# survival and neighborhood bits, number of cells outside the world grid, reserved,
+# engine.
+_HEADER = struct.Struct("<4sBBHIIQdHHHQ2x16s")
+_OUTSIDE = np.dtype("<i8")
+
+
+def _bits(values: Iterable[int]) -> int:
+    return sum(1 << value for value in values)
+
+
+def _rule(birth: int, survival: int, neighborhood: int) -> Rule:
+    mask = "".join("1" if neighborhood >> i & 1 else "0" for i in range(9))
+    return Rule(
+        (count for count in range(9) if birth >> count & 1),
+        (count for count in range(9) if survival >> count & 1),
+        mask,
+    )
+
+
+def _set_bits(bitmap: npt.NDArray[np.uint8], indices: npt.NDArray[np.int64]) -> None:
+    # The indices are sorted, so the bits of every byte are next to each other and
+    # are combined with a single `reduceat` instead of one write per cell.
+    if not len(indices):
+        return
+    positions = indices >> 3
+    bits = np.left_shift(1, indices & 7).astype(np.uint8)
+    starts = np.flatnonzero(np.diff(positions, prepend=-1))
+    bitmap[positions[starts]] = np.bitwise_or.reduceat(bits, starts)
+
+
+def save_checkpoint(game: GameOfLife, path: str) -> None:
+    """
+    Writes the last published frame of a game to a checkpoint file: a 64 byte
+    little-endian header (`b"GOLC"` magic, version, flags, reserved, width, height,
+    generation, velocity, the birth and survival counts and the neighborhood mask
+    of the rule as bits, the number of alive cells outside the world grid, reserved
+    and engine name) followed by a bitmap of the alive cells, cell
+    `row * width + column` being bit `i % 8` of byte `i // 8`, and by the `(row,
+    column)` pairs of the cells outside the world grid as 64-bit integers. Flag
+    `0x01` is set if the game stops once stable. The file is written through a
+    memory map and replaces an existing checkpoint atomically.
+
+    Parameters:
+    -----------
+        game: GameOfLife
+            The game to checkpoint. Reading its frame does not lock the game,
+            unless its engine keeps cells outside the world grid.
+        path: str
+            The path of the checkpoint file.
+    """
+    if game.engine.bounded:
+        frame, outside = game.frame, np.empty((0, 2), dtype=_OUTSIDE)
+    else:
+        # The engine matches the published frame while the game is locked.
+        with game.lock:
+            frame = game.frame
+            cells = np.array(game.engine.live_cells, dtype=_OUTSIDE).reshape(-1, 2)
+        rows, columns = cells[:, 0], cells[:, 1]
+        inside = (rows >= 0) & (rows < frame.height)
+        inside &= (columns >= 0) & (columns < frame.width)
+        outside = cells[~inside]
+
+    rule = game.rule
+    count = (frame.width * frame.height + 7) // 8
+    size = _HEADER.size + count + outside.nbytes
+    partial = path + ".partial"
+    with open(partial, "w+b") as file:
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as memory:
+            _HEADER.pack_into(
+                memory,
+                0,
+                MAGIC,
+                VERSION,
+                FLAG_AUTO_STOP if game.auto_stop else 0,
+                0,
+                frame.width,
+                frame.height,
+                frame.generation,
+                game.velocity,
+                _bits(rule.birth),
+                _bits(rule.survival),
+                _bits(i for i, cell in enumerate(rule.mask) if cell == "1"),
+                len(outside),
+                game.engine.name.encode(),
+            )
+            bitmap = np.frombuffer(
+                memory, dtype=np.uint8, count=count, offset=_HEADER.size
+            )
+            _set_bits(bitmap, frame.alive)
+            # The memory map cannot be closed while the array still points into it.
+            del bitmap
+            memory[_HEADER.size + count :] = outside.tobytes()  # noqa: E203
+            memory.flush()
+    os.replace(partial, path)
+
+
+def load_checkpoint(path: str, cycle_window: int = 64) -> GameOfLife:
+    """
+    Restores a game from a checkpoint file written by `save_checkpoint()`. The
+    bitmap is unpacked straight from a read-only memory map of the file. Raises
+    `ValueError` if the file is not a checkpoint of this version or its rule is
+    not supported.
+
+    Parameters:
+    -----------
+        path: str
+            The path of the checkpoint file.
+        cycle_window: int
+            The number of recent generations a repeat of the restored world is
+            looked for in (Default: 64).
+    """
+    with (
+        open(path, "rb") as file,
+        mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as memory,
+    ):
+        if len(memory) < _HEADER.size:
+            raise ValueError(f"checkpoint is shorter than the header: {path}")
+        (
+            magic,
+            version,
+            flags,
+            _,
+            width,
+            height,
+            generation,
+            velocity,
+            birth,
+            survival,
+            neighborhood,
+            outside_count,
+            engine,
+        ) = _HEADER.unpack_from(memory)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"unsupported checkpoint: {magic!r} version {version}")
+        rule = _rule(birth, survival, neighborhood)
+        count = (width * height + 7) // 8
+        offset = _HEADER.size + count
+        if len(memory) != offset + outside_count * 2 * _OUTSIDE.itemsize:
+            raise ValueError(f"checkpoint body does not match the world size: {path}")
+
+        bitmap = np.frombuffer(memory, dtype=np.uint8, count=count, offset=_HEADER.size)
+        cells = np.unpackbits(bitmap, count=width * height, bitorder="little")
+        outside = np.frombuffer(
+            memory, dtype=_OUTSIDE, count=2 * outside_count, offset=offset
+        ).reshape(-1, 2)
+        outside = outside.astype(np.int64)
+        del bitmap
+
+    game = GameOfLife(
+        width,
+        height,
+        velocity,
+        engine.rstrip(b"\0").decode(),
+        cells=cells.reshape(height, width),
+        life_count=generation,
+        cycle_window=cycle_window,
+        auto_stop=bool(flags & FLAG_AUTO_STOP),
+        rule=rule.notation,
+    )
+    if len(outside):
+        rows, columns = np.divmod(np.flatnonzero(cells), width)
+        inside = np.column_stack([rows, columns])
+        game.load_cells(np.concatenate([inside, outside]).tolist())
+    return game
+
+
+def restore_games(
+    games: GameRegistry, directory: str, cycle_window: int = 64
+) -> List[str]:
+    """
+    Restores the games checkpointed in a directory into a registry, under the IDs
+    they had, and returns the IDs. Checkpoints that cannot be read or do not fit
+    the memory budget are skipped.
+
+    Parameters:
+    -----------
+        games: GameRegistry
+            The registry to add the games to.
+        directory: str
+            The directory of the checkpoint files, named `<game ID>.ckpt`.
+        cycle_window: int
+            The number of recent generations a repeat of the restored worlds is
+            looked for in (Default: 64).
+    """
+    restored: List[str] = []
+    if not os.path.isdir(directory):
+        return restored
+    for game_id, path in checkpoint_files(directory):
+        try:
+            game = load_checkpoint(path, cycle_window)
+            games.add(game, game_id=game_id)
+        except (OSError, ValueError, MemoryError) as error:
+            logger.error("could not restore checkpoint '%s': %s", path, error)
+            continue
+        restored.append(game_id)
+    logger.info("%d games restored from '%s'", len(restored), directory)
+    return restored
+
+
+def checkpoint_files(directory: str) -> List[Tuple[str, str]]:
+    """
+    Returns the game ID and path of every checkpoint file in a directory.
+
+    Parameters:
+    -----------
+        directory: str
+            The directory of the checkpoint files, named `<game ID>.ckpt`.
+    """
+    return [
+        (filename[: -len(EXTENSION)], os.path.join(directory, filename))
+        for filename in sorted(os.listdir(directory))
+        if filename.endswith(EXTENSION)
+    ]
@@ -0,0 +1,166 @@
+from typing import Dict, Deque, Optional
+from collections import deque
+
+import numpy as np
+import numpy.typing as npt
+
+_SEED = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+
+
+def zobrist_hash(indices: npt.NDArray[np.int64]) -> int:
+    """
+    Returns the Zobrist hash of a set of cells: the XOR of a random 64-bit key of
+    every cell. The key of a cell is derived from its flat index with the
+    SplitMix64 finalizer instead of a table of `width * height` keys, so that huge
+    worlds need no memory for them. Since XOR is its own inverse, the hash of the
+    next generation is the hash of the last one XOR the hash of the cells that were
+    born or died.
+
+    Parameters:
+    -----------
+        indices: npt.NDArray[np.int64]
+            The flat indices `row * width + column` of the cells, without repeats.
+    """
+    if not len(indices):
+        return 0
+    keys = indices.astype(np.uint64) + _SEED
+    keys = (keys ^ (keys >> np.uint64(30))) * _MIX1
+    keys = (keys ^ (keys >> np.uint64(27))) * _MIX2
+    keys ^= keys >> np.uint64(31)
+    return int(np.bitwise_xor.reduce(keys))
+
+
+class CycleDetector:
+    """
+    Detects when a game repeats one of its recent generations, from a Zobrist hash
+    of every generation updated with the cells that changed in it. A game that
+    repeats a generation is deterministic from then on, so it is a still life
+    (period 1) or an oscillator forever, and detection stops at the first repeat.
+
+    Attributes:
+    -----------
+    _window: int
+        The number of recent generations a repeat is looked for in.
+    _hash: Optional[int]
+        The hash of the last generation, or `None` before `start()`.
+    _seen: Dict[int, int]
+        The generation of every hash in the window.
+    _hashes: Deque[int]
+        The hashes in the window, oldest first.
+    _period: Optional[int]
+        The period of the cycle, once detected.
+    _stabilized_at: Optional[int]
+        The first generation of the cycle, once detected.
+
+    Properties:
+    -----------
+        tracking: bool
+            Whether the detector was started since it was last cleared.
+        period: Optional[int]
+            The number of generations after which the world repeats, `1` for a
+            still life, or `None` if no repeat was detected.
+        stabilized_at: Optional[int]
+            The first generation of the cycle, or `None` if no repeat was detected.
+    """
+
+    def __init__(self, window: int = 64) -> None:
+        """
+        Initializes a detector that is not started yet.
+
+        Parameters:
+        -----------
+            window: int
+                The number of recent generations a repeat is looked for in, the
+                longest period detected (Default: 64).
+        """
+        if window < 1:
+            raise ValueError(f"cycle window must be positive: {window}")
+        self._window = window
+        self._hash: Optional[int] = None
+        self._seen: Dict[int, int] = {}
+        self._hashes: Deque[int] = deque()
+        self._period: Optional[int] = None
+        self._stabilized_at: Optional[int] = None
+
+    @property
+    def tracking(self) -> bool:
+        """
+        Whether the detector was started since it was last cleared.
+        """
+        return self._hash is not None
+
+    @property
+    def period(self) -> Optional[int]:
+        """
+        The number of generations after which the world repeats, `1` for a still
+        life, or `None` if no repeat was detected.
+        """
+        return self._period
+
+    @property
+    def stabilized_at(self) -> Optional[int]:
+        """
+        The first generation of the cycle, or `None` if no repeat was detected.
+        """
+        return self._stabilized_at
+
+    def clear(self) -> None:
+        """
+        Forgets all generations and the detected cycle, e.g. when the world is
+        replaced. Updates are ignored until the detector is started again.
+        """
+        self._hash = None
+        self._seen.clear()
+        self._hashes.clear()
+        self._period = self._stabilized_at = None
+
+    def start(self, alive: npt.NDArray[np.int64], generation: int) -> None:
+        """
+        Starts detecting from a generation, hashing all of its alive cells.
+
+        Parameters:
+        -----------
+            alive: npt.NDArray[np.int64]
+                The flat indices of the alive cells of the generation.
+            generation: int
+                The generation (life count).
+        """
+        self.clear()
+        self._hash = zobrist_hash(alive)
+        self._remember(self._hash, generation)
+
+    def update(
+        self, born: npt.NDArray[np.int64], died: npt.NDArray[np.int64], generation: int
+    ) -> Optional[int]:
+        """
+        Updates the hash with the cells that changed in a generation and returns the
+        period if the generation repeats one in the window.
+
+        Parameters:
+        -----------
+            born: npt.NDArray[np.int64]
+                The flat indices of the cells born in the generation.
+            died: npt.NDArray[np.int64]
+                The flat indices of the cells that died in the generation.
+            generation: int
+                The generation (life count).
+        """
+        if self._hash is None or self._period is not None:
+            return self._period
+        # The born and died cells never overlap, so their keys cancel nothing.
+        self._hash ^= zobrist_hash(born) ^ zobrist_hash(died)
+        first = self._seen.get(self._hash)
+        if first is not None:
+            self._period = generation - first
+            self._stabilized_at = first
+            return self._period
+        self._remember(self._hash, generation)
+        return None
+
+    def _remember(self, value: int, generation: int) -> None:
+        self._seen[value] = generation
+        self._hashes.append(value)
+        if len(self._hashes) > self._window:
+            del self._seen[self._hashes.popleft()]
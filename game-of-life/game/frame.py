@@ -0,0 +1,363 @@
+from typing import List, Tuple, Iterable, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+Changes = Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]
+
+_EMPTY: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+_EMPTY.flags.writeable = False
+
+
+def compose_changes(steps: Iterable[Changes]) -> Changes:
+    """
+    Composes the cells born and died in consecutive generations into the cells born
+    and died over all of them, as sorted flat indices. A cell that changes back
+    within the generations did not change at all.
+
+    Parameters:
+    -----------
+        steps: Iterable[Tuple[ndarray, ndarray]]
+            The cells born and died in each generation, oldest first.
+    """
+    born = died = np.empty(0, dtype=np.int64)
+    for step_born, step_died in steps:
+        reborn = np.intersect1d(died, step_born, assume_unique=True)
+        redied = np.intersect1d(born, step_died, assume_unique=True)
+        born = np.union1d(
+            np.setdiff1d(born, redied, assume_unique=True),
+            np.setdiff1d(step_born, reborn, assume_unique=True),
+        )
+        died = np.union1d(
+            np.setdiff1d(died, reborn, assume_unique=True),
+            np.setdiff1d(step_died, redied, assume_unique=True),
+        )
+    return born, died
+
+
+class Frame:
+    """
+    An immutable snapshot of a game at one generation, taken while the game was not
+    changing. Cells are given as read-only arrays of flat indices
+    `row * width + column` of the world grid. Frames are shared by all readers, so
+    the dense grids are built once, when they are first needed.
+
+    Attributes:
+    -----------
+    __generation: int
+        The life count of the game.
+    __width: int
+        The width of the world grid.
+    __height: int
+        The height of the world grid.
+    __alive: npt.NDArray[np.int64]
+        The sorted flat indices of the alive cells.
+    __changes: Tuple[Tuple[ndarray, ndarray], ...]
+        The cells born and died in each of the last generations, oldest first.
+    __version: int
+        The number of frames the game published before this one.
+    __period: Optional[int]
+        The period of the cycle the game entered, if detected.
+    __stabilized_at: Optional[int]
+        The first generation of the cycle the game entered, if detected.
+    __stopped: bool
+        Whether the game stopped forming generations on its own.
+    __cells: Optional[npt.NDArray[np.uint8]]
+        The world grid, once built.
+    __previous_cells: Optional[npt.NDArray[np.uint8]]
+        The world grid before the last generation, once built.
+
+    Properties:
+    -----------
+        generation: int
+            The life count of the game.
+        width: int
+            The width of the world grid.
+        height: int
+            The height of the world grid.
+        alive: npt.NDArray[np.int64]
+            The sorted flat indices of the alive cells.
+        changes: Tuple[Tuple[ndarray, ndarray], ...]
+            The cells born and died in each of the last generations, oldest first.
+        version: int
+            The number of frames the game published before this one. Unlike the
+            generation, it also changes when the world is replaced.
+        period: Optional[int]
+            The number of generations after which the world repeats, `1` for a
+            still life, or `None` if no cycle was detected.
+        stabilized_at: Optional[int]
+            The first generation of the cycle, or `None` if no cycle was detected.
+        stopped: bool
+            Whether the game stopped forming generations on its own, because it
+            entered a cycle.
+        died: npt.NDArray[np.int64]
+            The cells that died in the last generation.
+        cells: npt.NDArray[np.uint8]
+            The world grid as a read-only `height x width` array.
+        previous_cells: npt.NDArray[np.uint8]
+            The world grid before the last generation as a read-only array.
+        world: List[List[bool]]
+            The world grid.
+        previous_world: List[List[bool]]
+            The world grid before the last generation.
+        nbytes: int
+            An estimate of the memory the frame uses, in bytes.
+    """
+
+    __slots__ = (
+        "__generation",
+        "__width",
+        "__height",
+        "__alive",
+        "__changes",
+        "__version",
+        "__period",
+        "__stabilized_at",
+        "__stopped",
+        "__cells",
+        "__previous_cells",
+    )
+
+    def __init__(
+        self,
+        generation: int,
+        width: int,
+        height: int,
+        alive: npt.NDArray[np.int64],
+        changes: Tuple[Changes, ...] = (),
+        version: int = 0,
+        period: Optional[int] = None,
+        stabilized_at: Optional[int] = None,
+        stopped: bool = False,
+    ) -> None:
+        """
+        Initializes a frame. The arrays must not be changed afterwards.
+
+        Parameters:
+        -----------
+            generation: int
+                The life count of the game.
+            width: int
+                The width of the world grid.
+            height: int
+                The height of the world grid.
+            alive: npt.NDArray[np.int64]
+                The sorted flat indices of the alive cells.
+            changes: Tuple[Tuple[ndarray, ndarray], ...]
+                The cells born and died in each of the last generations, oldest
+                first (Default: ()).
+            version: int
+                The number of frames the game published before (Default: 0).
+            period: Optional[int]
+                The period of the cycle the game entered (Default: None).
+            stabilized_at: Optional[int]
+                The first generation of the cycle the game entered (Default: None).
+            stopped: bool
+                Whether the game stopped on its own (Default: False).
+        """
+        self.__generation = generation
+        self.__width = width
+        self.__height = height
+        self.__alive = alive
+        self.__changes = changes
+        self.__version = version
+        self.__period = period
+        self.__stabilized_at = stabilized_at
+        self.__stopped = stopped
+        self.__cells: Optional[npt.NDArray[np.uint8]] = None
+        self.__previous_cells: Optional[npt.NDArray[np.uint8]] = None
+
+    def __repr__(self) -> str:
+        """
+        Returns a string representation of the frame, including its generation and
+        size.
+        """
+        return (
+            f"Frame[generation:{self.__generation}, version:{self.__version}, "
+            f"width:{self.__width}, height:{self.__height}]"
+        )
+
+    @property
+    def generation(self) -> int:
+        """
+        The life count of the game.
+        """
+        return self.__generation
+
+    @property
+    def width(self) -> int:
+        """
+        The width of the world grid.
+        """
+        return self.__width
+
+    @property
+    def height(self) -> int:
+        """
+        The height of the world grid.
+        """
+        return self.__height
+
+    @property
+    def alive(self) -> npt.NDArray[np.int64]:
+        """
+        The sorted flat indices of the alive cells.
+        """
+        return self.__alive
+
+    @property
+    def changes(self) -> Tuple[Changes, ...]:
+        """
+        The cells born and died in each of the last generations, oldest first.
+        """
+        return self.__changes
+
+    @property
+    def version(self) -> int:
+        """
+        The number of frames the game published before this one. Unlike the
+        generation, it also changes when the world is replaced.
+        """
+        return self.__version
+
+    @property
+    def period(self) -> Optional[int]:
+        """
+        The number of generations after which the world repeats, `1` for a still
+        life, or `None` if no cycle was detected.
+        """
+        return self.__period
+
+    @property
+    def stabilized_at(self) -> Optional[int]:
+        """
+        The first generation of the cycle, or `None` if no cycle was detected.
+        """
+        return self.__stabilized_at
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Whether the game stopped forming generations on its own, because it entered
+        a cycle.
+        """
+        return self.__stopped
+
+    @property
+    def died(self) -> npt.NDArray[np.int64]:
+        """
+        The cells that died in the last generation.
+        """
+        return self.__changes[-1][1] if self.__changes else _EMPTY
+
+    @property
+    def nbytes(self) -> int:
+        """
+        An estimate of the memory the frame uses, in bytes: its cells, its changes
+        and the world grids built so far.
+        """
+        nbytes = self.__alive.nbytes
+        nbytes += sum(born.nbytes + died.nbytes for born, died in self.__changes)
+        if self.__cells is not None:
+            nbytes += self.__cells.nbytes
+        if (
+            self.__previous_cells is not None
+            and self.__previous_cells is not self.__cells
+        ):
+            nbytes += self.__previous_cells.nbytes
+        return nbytes
+
+    @property
+    def cells(self) -> npt.NDArray[np.uint8]:
+        """
+        The world grid as a read-only `height x width` array, `1` for alive and `0`
+        for dead cells.
+        """
+        # Concurrent readers may both build the grid; either result is the same.
+        if self.__cells is None:
+            cells = np.zeros(self.__height * self.__width, dtype=np.uint8)
+            cells[self.__alive] = 1
+            cells.flags.writeable = False
+            self.__cells = cells.reshape(self.__height, self.__width)
+        return self.__cells
+
+    @property
+    def previous_cells(self) -> npt.NDArray[np.uint8]:
+        """
+        The world grid before the last generation as a read-only `height x width`
+        array.
+        """
+        if self.__previous_cells is None:
+            if not self.__changes:
+                self.__previous_cells = self.cells
+            else:
+                born, died = self.__changes[-1]
+                cells = self.cells.ravel().copy()
+                cells[born] = 0
+                cells[died] = 1
+                cells.flags.writeable = False
+                self.__previous_cells = cells.reshape(self.__height, self.__width)
+        return self.__previous_cells
+
+    @property
+    def world(self) -> List[List[bool]]:
+        """
+        The world grid.
+        """
+        world: List[List[bool]] = self.cells.astype(np.bool_).tolist()
+        return world
+
+    @property
+    def previous_world(self) -> List[List[bool]]:
+        """
+        The world grid before the last generation.
+        """
+        world: List[List[bool]] = self.previous_cells.astype(np.bool_).tolist()
+        return world
+
+    def rewind(self, generation: int) -> Optional["Frame"]:
+        """
+        Returns the frame of an earlier generation, rebuilt from the changes the
+        frame keeps, or `None` if it does not keep the changes since then. The
+        earlier frame has the same version as this one.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to rewind to.
+        """
+        changes = self.changes_since(generation)
+        if changes is None:
+            return None
+        born, died = changes
+        alive = np.union1d(np.setdiff1d(self.__alive, born, assume_unique=True), died)
+        alive.flags.writeable = False
+        kept = self.__changes[: len(self.__changes) - (self.__generation - generation)]
+        # An earlier generation is only known to be in the cycle from its start on.
+        cycling = self.__stabilized_at is not None and generation >= self.__stabilized_at
+        return Frame(
+            generation,
+            self.__width,
+            self.__height,
+            alive,
+            kept,
+            self.__version,
+            self.__period if cycling else None,
+            self.__stabilized_at if cycling else None,
+        )
+
+    def changes_since(self, generation: int) -> Optional[Changes]:
+        """
+        Returns the cells born and died since the given generation, or `None` if the
+        frame does not keep the changes since then.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to compare the frame with.
+        """
+        behind = self.__generation - generation
+        if behind < 0 or behind > len(self.__changes):
+            return None
+        steps = self.__changes[len(self.__changes) - behind :]  # noqa: E203
+        return compose_changes(steps)
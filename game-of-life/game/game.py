@@ -1,19 +1,48 @@
-import copy
-import random
-from typing import List, Tuple, Optional
+import time
+from typing import List, Deque, Tuple, Iterable, Optional, Sequence
+from threading import RLock
+from collections import deque
 
-from core import logger
-from utils import SingletonMeta
+import numpy as np
+import numpy.typing as npt
 
+from core import Profiler, config, logger, metrics
+from engine import Rule, Engine, parse_rule, create_engine
+from core.metrics import MAGNITUDES
 
-class GameOfLife(metaclass=SingletonMeta):
+from .frame import Frame
+from .cycles import CycleDetector
+from .history import History
+
+_GENERATION_SECONDS = metrics.histogram(
+    "life_generation_seconds", "Time to form a generation of a game."
+)
+_ALIVE_CELLS = metrics.histogram(
+    "life_alive_cells", "Alive cells of every published frame.", buckets=MAGNITUDES
+)
+_PROFILER = Profiler("generation", config.profile)
+
+
+class GameOfLife:
     """
-    A singleton class that manages the state and behavior of the Game of Life.
-    It initializes the game world, generates new generations, and maintains
-    the current and previous states of the grid.
+    A class that manages the state and behavior of the Game of Life. It initializes
+    the game world, generates new generations, and maintains the current and
+    previous states of the grid. Every instance is an independent game; the
+    application keeps them in a `GameRegistry`.
+
+    Writers hold the game's lock and publish an immutable `Frame` when they are
+    done. Readers only dereference the last published frame, so they never lock
+    and never see a half-formed generation.
 
     Attributes:
     -----------
+    CHANGES_LIMIT: int
+        The number of generations whose changes are kept for `changes_since()`.
+    HISTORY_LIMIT: int
+        The number of generations kept in the history for `snapshot()` and
+        `rewind()`.
+    HISTORY_BUDGET: int
+        The memory the history of a game may use, in bytes.
     __width: int
         The width of the game world grid.
     __height: int
@@ -22,21 +51,61 @@ class GameOfLife(metaclass=SingletonMeta):
         The velocity of the world generation in seconds.
     __life_count: int
         The number of generations that have been created.
-    __world: List[List[bool]]
-        The current state of the game world (grid).
-    __prev_world: List[List[bool]]
-        A deep copy of the previous sate of the game world.
+    __engine: Engine
+        The engine that stores the game world (grid) and forms new generations.
+    __changes: Deque[Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]]
+        The cells born and died in each of the last generations, oldest first.
+    __lock: RLock
+        The lock held while the game changes.
+    __clock: Optional[Tuple[float, int]]
+        The time and the life count `catch_up()` counts due generations from.
+    __version: int
+        The number of frames published so far.
+    __frame: Frame
+        The last published frame.
+    __history: History
+        The last generations of the game.
+    __cycles: CycleDetector
+        The detector of the cycle the game enters.
+    __auto_stop: bool
+        Whether the game stops forming generations once it entered a cycle.
 
     Properties:
     -----------
         velocity: float
             The velocity of the world generation in seconds.
+        engine: Engine
+            The engine that stores the game world and forms new generations.
+        rule: Rule
+            The compiled rule the game forms new generations with.
+        lock: RLock
+            The lock held while the game changes. Readers do not need it, they
+            read the last published `frame`.
         world: List[List[bool]]
-            The current game world grid.
+            The current game world grid. Assigning a grid replaces the world.
         previous_world: List[List[bool]]
             The previous game world grid.
         life_count: int
             The number of generations that have occurred.
+        frame: Frame
+            The last published snapshot of the game. Reading it never locks.
+        history: History
+            The last generations of the game, as keyframes and XOR deltas.
+        nbytes: int
+            An estimate of the memory the game uses, in bytes.
+        period: Optional[int]
+            The number of generations after which the world repeats, `1` for a
+            still life, or `None` if no cycle was detected.
+        stabilized_at: Optional[int]
+            The first generation of the cycle, or `None` if no cycle was detected.
+        auto_stop: bool
+            Whether the game stops forming generations once it entered a cycle.
+        stopped: bool
+            Whether the game stopped forming generations, because it entered a
+            cycle and `auto_stop` is set.
+        next_due: Optional[float]
+            The `time.monotonic()` time the next generation is due at the game's
+            velocity, or `None` before the first `catch_up()`.
 
     Usage:
     ------
@@ -50,10 +119,25 @@ class GameOfLife(metaclass=SingletonMeta):
     ```
     """
 
-    def __init__(self, width: int = 20, height: int = 20, velocity: float = 1.0) -> None:
+    CHANGES_LIMIT = 64
+    HISTORY_LIMIT = 1024
+    HISTORY_BUDGET = 8 << 20
+
+    def __init__(
+        self,
+        width: int = 20,
+        height: int = 20,
+        velocity: float = 1.0,
+        engine: str = "numpy",
+        cells: Optional[npt.NDArray[np.uint8]] = None,
+        life_count: int = 0,
+        cycle_window: int = 64,
+        auto_stop: bool = False,
+        rule: str = "B3/S23",
+    ) -> None:
         """
         Initializes a new Game of Life instance with the specific width and height,
-        generating and initial random world.
+        generating and initial random world unless the initial cells are given.
 
         Parameters:
         -----------
@@ -63,15 +147,47 @@ class GameOfLife(metaclass=SingletonMeta):
                 The height of the game world grid (Default: 20).
             velocity: float
                 The velocity of the world generation in seconds (Default: 1.0).
+            engine: str
+                The name of the engine that forms new generations, one of the
+                `engine.ENGINES` keys (Default: "numpy").
+            cells: Optional[npt.NDArray[np.uint8]]
+                The initial world as a `height x width` array, nonzero for alive
+                cells, such as a restored checkpoint (Default: None, a random world).
+            life_count: int
+                The generation the initial world is at (Default: 0).
+            cycle_window: int
+                The number of recent generations a repeat of the world is looked
+                for in, the longest period detected (Default: 64).
+            auto_stop: bool
+                Whether the game stops forming generations at its velocity once it
+                entered a cycle, so that it costs no CPU (Default: False).
+            rule: str
+                The Life-like rule in B/S notation, such as "B36/S23", with an
+                optional neighborhood suffix. Raises `ValueError` if it is not a
+                supported rule (Default: "B3/S23").
         """
         self.__width = width
         self.__height = height
         self.__velocity = velocity
-        self.__life_count = 0
+        self.__life_count = life_count
+        self.__changes: Deque[Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]] = (
+            deque(maxlen=self.CHANGES_LIMIT)
+        )
+        self.__lock = RLock()
+        self.__clock: Optional[Tuple[float, int]] = None
+        self.__version = 0
+        self.__history = History(width, height, self.HISTORY_LIMIT, self.HISTORY_BUDGET)
+        self.__cycles = CycleDetector(cycle_window)
+        self.__auto_stop = auto_stop
 
-        self.__world: List[List[bool]] = []
-        self.generate_world()
-        self.__prev_world = copy.deepcopy(self.world)
+        self.__engine = create_engine(engine, width, height, parse_rule(rule))
+        self.__frame = self.__capture()
+        if cells is None:
+            self.generate_world()
+        else:
+            with self.__lock:
+                self.__engine.load_array(cells)
+                self.__publish()
 
     def __repr__(self) -> str:
         """
@@ -83,6 +199,8 @@ class GameOfLife(metaclass=SingletonMeta):
             f"width:{self.__width}, "
             f"height:{self.__height}, "
             f"velocity:{self.__velocity}, "
+            f"engine:{self.__engine.name}, "
+            f"rule:{self.__engine.rule}, "
             f"life_count:{self.__life_count}"
             "]"
         )
@@ -100,102 +218,370 @@ class GameOfLife(metaclass=SingletonMeta):
         """
         return self.__velocity
 
+    @property
+    def engine(self) -> Engine:
+        """
+        The engine that stores the game world and forms new generations.
+        """
+        return self.__engine
+
+    @property
+    def rule(self) -> Rule:
+        """
+        The compiled rule the game forms new generations with.
+        """
+        return self.__engine.rule
+
+    @property
+    def lock(self) -> RLock:
+        """
+        The lock held while the game changes. Readers do not need it, they read the
+        last published `frame`.
+        """
+        return self.__lock
+
     @property
     def world(self) -> List[List[bool]]:
         """
         The current game world grid.
         """
-        return self.__world
+        return self.__frame.world
+
+    @world.setter
+    def world(self, world: Sequence[Sequence[bool]]) -> None:
+        """
+        Replaces the current game world grid. The previous game world grid becomes
+        equal to the new one.
+        """
+        with self.__lock:
+            self.__engine.load(world)
+            self.__changes.clear()
+            self.__history.clear()
+            self.__cycles.clear()
+            self.__publish()
 
     @property
     def previous_world(self) -> List[List[bool]]:
         """
         The previous game world grid.
         """
-        return self.__prev_world
+        return self.__frame.previous_world
 
     @property
     def life_count(self) -> int:
         """
         The number of generations that have occurred.
         """
-        return self.__life_count
+        return self.__frame.generation
+
+    @property
+    def frame(self) -> Frame:
+        """
+        The last published snapshot of the game, with the changes of the last
+        generations. Reading it never locks.
+        """
+        return self.__frame
+
+    @property
+    def history(self) -> History:
+        """
+        The last generations of the game, as keyframes and XOR deltas.
+        """
+        return self.__history
+
+    @property
+    def nbytes(self) -> int:
+        """
+        An estimate of the memory the game uses, in bytes: its engine, its history
+        and its last published frame.
+        """
+        return self.__engine.nbytes + self.__history.nbytes + self.__frame.nbytes
+
+    @property
+    def period(self) -> Optional[int]:
+        """
+        The number of generations after which the world repeats, `1` for a still
+        life, or `None` if no cycle was detected.
+        """
+        return self.__frame.period
+
+    @property
+    def stabilized_at(self) -> Optional[int]:
+        """
+        The first generation of the cycle, or `None` if no cycle was detected.
+        """
+        return self.__frame.stabilized_at
+
+    @property
+    def auto_stop(self) -> bool:
+        """
+        Whether the game stops forming generations once it entered a cycle.
+        """
+        return self.__auto_stop
+
+    @property
+    def stopped(self) -> bool:
+        """
+        Whether the game stopped forming generations, because it entered a cycle
+        and `auto_stop` is set. Explicit steps still form generations.
+        """
+        return self.__auto_stop and self.__cycles.period is not None
+
+    @property
+    def next_due(self) -> Optional[float]:
+        """
+        The `time.monotonic()` time the next generation is due at the game's
+        velocity, or `None` before the first `catch_up()` or once the game stopped.
+        """
+        with self.__lock:
+            if self.__clock is None or self.stopped:
+                return None
+            started, start_count = self.__clock
+            return started + (self.__life_count - start_count + 1) * self.__velocity
 
     def generate_world(self) -> None:
         """
         Generates a new random world (grid) for the game, populating it with
         randomly assigned alive and dead cells.
         """
-        self.__world = [
-            [bool(random.randint(0, 1)) for _ in range(self.__width)]
-            for _ in range(self.__height)
-        ]
-        logger.debug(f"world generated: {self}")
+        with self.__lock:
+            self.__engine.randomize()
+            self.__changes.clear()
+            self.__history.clear()
+            self.__cycles.clear()
+            self.__publish()
+        logger.debug("world generated: %s", self)
+
+    def load_cells(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Replaces the current world with one where only the given cells are alive,
+        such as a pattern. The previous world becomes equal to the new one.
+
+        Parameters:
+        -----------
+            cells: Iterable[Tuple[int, int]]
+                The `(row, column)` positions of the alive cells.
+        """
+        with self.__lock:
+            self.__engine.load_cells(cells)
+            self.__changes.clear()
+            self.__history.clear()
+            self.__cycles.clear()
+            self.__publish()
+        logger.debug("cells loaded: %s", self)
 
     def form_new_generation(self) -> None:
         """
-        Advances the game to the next generation based on the rules of Conway's Game
-        of Life. Updates the current world and keeps track of the previous world.
+        Advances the game to the next generation based on its Life-like rule,
+        Conway's Game of Life by default. Updates the current world and keeps track
+        of the previous world.
         """
-        self.__life_count += 1
-        if self.life_count <= 0:
+        with self.__lock:
+            self.__form_new_generation()
+            self.__publish()
+        logger.debug("world updated: %s", self)
+
+    def advance(self, generations: int, timeout: Optional[float] = None) -> None:
+        """
+        Advances the game by the given number of generations in a single call.
+        Engines that support it (e.g. `"hashlife"`) skip `2^k` generations at once
+        instead of forming every one of them. Such engines give up with
+        `TimeoutError` after the timeout, which leaves the game unchanged.
+
+        Parameters:
+        -----------
+            generations: int
+                The number of generations to advance by.
+            timeout: Optional[float]
+                The longest time a jump may take, in seconds (Default: None, no
+                limit).
+        """
+        if generations < 0:
+            raise ValueError(f"cannot advance by {generations} generations")
+        if generations == 0:
             return
 
-        new_world = [[False for _ in range(self.__width)] for _ in range(self.__height)]
-
-        for i in range(len(self.world)):
-            for j in range(len(self.world[0])):
-                near = self.__get_near(self.world, (i, j))
-
-                if self.world[i][j]:
-                    if near not in (2, 3):
-                        new_world[i][j] = False
-                    else:
-                        new_world[i][j] = True
-                    continue
-                if near == 3:
-                    new_world[i][j] = True
-                else:
-                    new_world[i][j] = False
-
-        self.__prev_world = copy.deepcopy(self.world)
-        self.__world = new_world
-        logger.debug(f"world updated: {self}")
-
-    @staticmethod
-    def __get_near(
-        world: List[List[bool]],
-        pos: Tuple[int, int],
-        system: Optional[Tuple[Tuple[int, int], ...]] = None,
-    ) -> int:
-        """
-        A static method that counts the number of alive neighbors around a specific
-        cell position in the game world. Uses toroidal (wrap-around) boundary
-        conditions.
+        with self.__lock:
+            self.__engine.advance(generations, timeout)
+            self.__life_count += generations
+            # Only the changes of the last generation are known after a jump.
+            self.__changes.clear()
+            self.__changes.append(self.__read_only_changes())
+            self.__cycles.clear()
+            self.__publish()
+        logger.debug("world advanced by %d generations: %s", generations, self)
+
+    def simulate(self, generations: int, until_stable: bool = False) -> int:
+        """
+        Forms the given number of generations without a clock, such as for offline
+        simulations, and returns how many were formed. Like `catch_up()`, a frame is
+        published for every `CHANGES_LIMIT` generations instead of every one. Once
+        the game entered a cycle, `until_stable` stops it early, at the generation
+        of the cycle whose world the game would have after all generations.
+
+        Parameters:
+        -----------
+            generations: int
+                The number of generations to form.
+            until_stable: bool
+                Whether to stop once the game entered a cycle (Default: False).
+        """
+        if generations < 0:
+            raise ValueError(f"cannot simulate {generations} generations")
+
+        formed = 0
+        with self.__lock:
+            while formed < generations:
+                for _ in range(min(self.CHANGES_LIMIT, generations - formed)):
+                    self.__form_new_generation()
+                    formed += 1
+                    period = self.__cycles.period
+                    if until_stable and period is not None:
+                        generations = formed + (generations - formed) % period
+                        until_stable = False
+                        break
+                self.__publish()
+        logger.debug("world simulated for %d generations: %s", formed, self)
+        return formed
+
+    def catch_up(self, now: Optional[float] = None) -> int:
+        """
+        Forms the generations that are due at the game's velocity since the first
+        call and returns how many were formed. Callers that fall behind, e.g. a slow
+        client, form the generations they missed at once, so every caller sees the
+        game at the same pace. If more than `CHANGES_LIMIT` generations are due, the
+        game cannot keep up with its velocity; only `CHANGES_LIMIT` are formed and
+        the clock is restarted. A stopped game forms no generations.
+
+        Parameters:
+        -----------
+            now: Optional[float]
+                The current `time.monotonic()` time (Default: None, the current one).
+        """
+        now = time.monotonic() if now is None else now
+        with self.__lock:
+            if self.__clock is None or self.stopped:
+                # A stopped game goes on from now once it is restarted.
+                self.__clock = (now, self.__life_count)
+                return 0
+
+            started, start_count = self.__clock
+            due = start_count + int((now - started) / self.__velocity) - self.__life_count
+            if due <= 0:
+                return 0
+            if due > self.CHANGES_LIMIT:
+                due = self.CHANGES_LIMIT
+                self.__clock = (now, self.__life_count + due)
+            # The generations are published at once, as a single frame.
+            for _ in range(due):
+                self.__form_new_generation()
+            self.__publish()
+            return due
+
+    def changes_since(
+        self, generation: int
+    ) -> Optional[Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]]:
+        """
+        Returns the cells that are alive now but were dead at the given generation
+        and the cells that were alive then but are dead now, as sorted flat indices
+        `row * width + column` of the world grid. Returns `None` if the changes
+        since that generation are no longer (or not yet) known.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to compare the current world with.
+        """
+        return self.__frame.changes_since(generation)
+
+    def snapshot(self, generation: int) -> Optional[Frame]:
+        """
+        Returns the frame of an earlier generation, rebuilt from the history without
+        changing the game, or `None` if the history does not keep it.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to rebuild.
+        """
+        return self.__history.frame(generation, self.__version)
+
+    def rewind(self, generation: int) -> bool:
+        """
+        Returns the game to an earlier generation the history keeps and forgets the
+        generations after it, so that the game goes on from there. Returns whether
+        the generation was kept.
 
         Parameters:
         -----------
-            world: List[List[bool]]
-                The game world grid.
-            pos: Tuple[int, int]
-                A specific cell position to check around.
-            system: Optional[Tuple[Tuple[int, int], ...]] = None
-                Check conditions.
-        """
-        if system is None:
-            system = (
-                (-1, -1),
-                (-1, 0),
-                (-1, 1),
-                (0, -1),
-                (0, 1),
-                (1, -1),
-                (1, 0),
-                (1, 1),
-            )
-
-        count = 0
-        for i in system:
-            if world[(pos[0] + i[0]) % len(world)][(pos[1] + i[1]) % len(world[0])]:
-                count += 1
-        return count
+            generation: int
+                The generation (life count) to return to.
+        """
+        with self.__lock:
+            alive = self.__history.truncate(generation)
+            if alive is None:
+                return False
+            cells = np.zeros(self.__width * self.__height, dtype=np.uint8)
+            cells[alive] = 1
+            self.__engine.load_array(cells.reshape(self.__height, self.__width))
+            self.__life_count = generation
+            self.__changes.clear()
+            self.__cycles.clear()
+            if self.__clock is not None:
+                # The next generation is due a full period from now.
+                self.__clock = (time.monotonic(), generation)
+            self.__publish()
+        logger.debug("world rewound: %s", self)
+        return True
+
+    def __form_new_generation(self) -> None:
+        self.__life_count += 1
+        if self.__life_count <= 0:
+            return
+
+        started = time.perf_counter()
+        _PROFILER.run(self.__evolve)
+        _GENERATION_SECONDS.observe(time.perf_counter() - started)
+
+    def __evolve(self) -> None:
+        self.__engine.step()
+        born, died = self.__read_only_changes()
+        self.__changes.append((born, died))
+        if not self.__engine.bounded:
+            # The cells outside the window keep changing after the window repeats.
+            born, died = self.__engine.key_changes()
+        self.__cycles.update(born, died, self.__life_count)
+
+    def __read_only_changes(
+        self,
+    ) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+        born, died = self.__engine.changes()
+        born.flags.writeable = died.flags.writeable = False
+        return born, died
+
+    def __capture(self) -> Frame:
+        alive = self.__engine.live_indices
+        alive.flags.writeable = False
+        return Frame(
+            self.__life_count,
+            self.__width,
+            self.__height,
+            alive,
+            tuple(self.__changes),
+            self.__version,
+            self.__cycles.period,
+            self.__cycles.stabilized_at,
+            self.stopped,
+        )
+
+    def __publish(self) -> None:
+        # Called with the lock held. Replacing the reference is atomic, so readers
+        # see either the previous or the new frame, never a mix of both.
+        self.__version += 1
+        self.__frame = self.__capture()
+        _ALIVE_CELLS.observe(len(self.__frame.alive))
+        if not self.__cycles.tracking:
+            engine = self.__engine
+            alive = self.__frame.alive if engine.bounded else engine.cell_keys
+            self.__cycles.start(alive, self.__frame.generation)
+        self.__history.record(self.__frame)
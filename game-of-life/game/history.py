@@ -0,0 +1,325 @@
+from bisect import bisect_left
+from typing import Dict, List, Deque, Tuple, Optional
+from functools import reduce
+from itertools import islice
+from threading import Lock
+from collections import deque
+
+import numpy as np
+import numpy.typing as npt
+
+from .frame import Frame
+
+_EMPTY: npt.NDArray[np.int64] = np.empty(0, dtype=np.int64)
+_EMPTY.flags.writeable = False
+
+
+def _xor(
+    first: npt.NDArray[np.int64], second: npt.NDArray[np.int64]
+) -> npt.NDArray[np.int64]:
+    return np.setxor1d(first, second, assume_unique=True)
+
+
+class History:
+    """
+    A bounded history of the last generations of a game. The alive cells are kept
+    as keyframes every few generations, and every generation as the XOR delta of
+    its alive cells with the previous generation: the sorted flat indices of the
+    cells that were born or died. A delta applies in both directions, so any kept
+    generation is rebuilt from the nearest keyframe before or after it, or from the
+    newest generation, with at most half a keyframe interval of deltas, instead of
+    replaying the game from its start. The oldest generations are dropped when
+    there are more than `limit` of them or the history exceeds its memory budget.
+
+    Attributes:
+    -----------
+    _width: int
+        The width of the world grid.
+    _height: int
+        The height of the world grid.
+    _limit: int
+        The largest number of generations kept.
+    _memory_budget: int
+        The memory the deltas and keyframes may use, in bytes.
+    _keyframe_interval: int
+        The number of generations between two keyframes.
+    _oldest: int
+        The oldest generation kept.
+    _newest: Optional[int]
+        The newest generation kept, or `None` if the history is empty.
+    _latest: npt.NDArray[np.int64]
+        The alive cells of the newest generation.
+    _deltas: Deque[npt.NDArray[np.int64]]
+        The XOR delta of every generation after the oldest with the generation
+        before it, oldest first.
+    _keyframes: Dict[int, npt.NDArray[np.int64]]
+        The alive cells of the keyframes by generation.
+    _keyframe_generations: Deque[int]
+        The generations of the keyframes, oldest first.
+    _nbytes: int
+        The memory the deltas and keyframes use, in bytes.
+    _lock: Lock
+        The lock held while the history is read or changes.
+
+    Properties:
+    -----------
+        oldest: Optional[int]
+            The oldest generation kept, or `None` if the history is empty.
+        newest: Optional[int]
+            The newest generation kept, or `None` if the history is empty.
+        nbytes: int
+            The memory the deltas and keyframes use, in bytes.
+    """
+
+    def __init__(
+        self,
+        width: int,
+        height: int,
+        limit: int = 1024,
+        memory_budget: int = 8 << 20,
+        keyframe_interval: int = 32,
+    ) -> None:
+        """
+        Initializes an empty history.
+
+        Parameters:
+        -----------
+            width: int
+                The width of the world grid.
+            height: int
+                The height of the world grid.
+            limit: int
+                The largest number of generations kept (Default: 1024).
+            memory_budget: int
+                The memory the deltas and keyframes may use, in bytes (Default: 8
+                MiB).
+            keyframe_interval: int
+                The number of generations between two keyframes (Default: 32).
+        """
+        if limit < 1 or keyframe_interval < 1:
+            raise ValueError("history limit and keyframe interval must be positive")
+        self._width = width
+        self._height = height
+        self._limit = limit
+        self._memory_budget = memory_budget
+        self._keyframe_interval = keyframe_interval
+        self._oldest = 0
+        self._newest: Optional[int] = None
+        self._latest = _EMPTY
+        self._deltas: Deque[npt.NDArray[np.int64]] = deque()
+        self._keyframes: Dict[int, npt.NDArray[np.int64]] = {}
+        self._keyframe_generations: Deque[int] = deque()
+        self._nbytes = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return 0 if self._newest is None else self._newest - self._oldest + 1
+
+    def __contains__(self, generation: object) -> bool:
+        newest = self._newest
+        return (
+            isinstance(generation, int)
+            and newest is not None
+            and self._oldest <= generation <= newest
+        )
+
+    @property
+    def oldest(self) -> Optional[int]:
+        """
+        The oldest generation kept, or `None` if the history is empty.
+        """
+        return None if self._newest is None else self._oldest
+
+    @property
+    def newest(self) -> Optional[int]:
+        """
+        The newest generation kept, or `None` if the history is empty.
+        """
+        return self._newest
+
+    @property
+    def nbytes(self) -> int:
+        """
+        The memory the deltas and keyframes use, in bytes.
+        """
+        return self._nbytes
+
+    def clear(self) -> None:
+        """
+        Forgets all generations, e.g. when the world is replaced.
+        """
+        with self._lock:
+            self._newest = None
+            self._latest = _EMPTY
+            self._deltas.clear()
+            self._keyframes.clear()
+            self._keyframe_generations.clear()
+            self._nbytes = 0
+
+    def record(self, frame: Frame) -> None:
+        """
+        Records the generations a published frame adds to the history, from the
+        changes it keeps. The history restarts at the frame if the frame does not
+        continue it, e.g. after the game skipped generations.
+
+        Parameters:
+        -----------
+            frame: Frame
+                The last published frame of the game.
+        """
+        with self._lock:
+            added = None if self._newest is None else frame.generation - self._newest
+            if added is None or not 0 <= added <= len(frame.changes):
+                self._restart(frame)
+                return
+
+            for born, died in frame.changes[len(frame.changes) - added :]:  # noqa: E203
+                # The born and died cells never overlap, so their union is sorted
+                # without removing duplicates.
+                delta = np.sort(np.concatenate((born, died)))
+                delta.flags.writeable = False
+                self._deltas.append(delta)
+                self._nbytes += delta.nbytes
+            self._newest = frame.generation
+            self._latest = frame.alive
+
+            generations = self._keyframe_generations
+            if (
+                not generations
+                or frame.generation - generations[-1] >= self._keyframe_interval
+            ):
+                self._add_keyframe(frame.generation, frame.alive)
+            self._evict()
+
+    def alive(self, generation: int) -> Optional[npt.NDArray[np.int64]]:
+        """
+        Returns the sorted flat indices of the alive cells of a generation, or
+        `None` if the generation is not kept.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to rebuild.
+        """
+        with self._lock:
+            found = self._lookup(generation)
+        if found is None:
+            return None
+        anchor, deltas = found
+        return self._apply(anchor, deltas)
+
+    def frame(self, generation: int, version: int = 0) -> Optional[Frame]:
+        """
+        Returns the frame of a kept generation, with the cells born and died in it
+        if the generation before it is kept as well, or `None` if the generation is
+        not kept.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to rebuild.
+            version: int
+                The version of the frame (Default: 0).
+        """
+        with self._lock:
+            found = self._lookup(generation)
+            before = generation - self._oldest - 1
+            delta = self._deltas[before] if found and before >= 0 else None
+        if found is None:
+            return None
+
+        alive = self._apply(*found)
+        changes: Tuple[Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64]], ...] = ()
+        if delta is not None:
+            born = np.intersect1d(delta, alive, assume_unique=True)
+            died = np.setdiff1d(delta, alive, assume_unique=True)
+            born.flags.writeable = died.flags.writeable = False
+            changes = ((born, died),)
+        return Frame(generation, self._width, self._height, alive, changes, version)
+
+    def truncate(self, generation: int) -> Optional[npt.NDArray[np.int64]]:
+        """
+        Forgets the generations after a kept generation, so that the game can go on
+        from it, and returns its alive cells, or `None` if it is not kept.
+
+        Parameters:
+        -----------
+            generation: int
+                The generation (life count) to keep as the newest.
+        """
+        with self._lock:
+            found = self._lookup(generation)
+            if found is None:
+                return None
+            alive = self._apply(*found)
+
+            newest = self._newest
+            assert newest is not None
+            for _ in range(newest - generation):
+                self._nbytes -= self._deltas.pop().nbytes
+            generations = self._keyframe_generations
+            while generations and generations[-1] > generation:
+                self._nbytes -= self._keyframes.pop(generations.pop()).nbytes
+            self._newest = generation
+            self._latest = alive
+            if not generations:
+                self._add_keyframe(generation, alive)
+            return alive
+
+    def _restart(self, frame: Frame) -> None:
+        self._deltas.clear()
+        self._keyframes.clear()
+        self._keyframe_generations.clear()
+        self._nbytes = 0
+        self._oldest = self._newest = frame.generation
+        self._latest = frame.alive
+        self._add_keyframe(frame.generation, frame.alive)
+
+    def _add_keyframe(self, generation: int, alive: npt.NDArray[np.int64]) -> None:
+        self._keyframes[generation] = alive
+        self._keyframe_generations.append(generation)
+        self._nbytes += alive.nbytes
+
+    def _evict(self) -> None:
+        # The newest generation is never evicted, it rebuilds all the others.
+        while self._deltas and (
+            len(self._deltas) >= self._limit or self._nbytes > self._memory_budget
+        ):
+            self._nbytes -= self._deltas.popleft().nbytes
+            self._oldest += 1
+            generations = self._keyframe_generations
+            while generations and generations[0] < self._oldest:
+                self._nbytes -= self._keyframes.pop(generations.popleft()).nbytes
+
+    def _lookup(
+        self, generation: int
+    ) -> Optional[Tuple[npt.NDArray[np.int64], List[npt.NDArray[np.int64]]]]:
+        # Called with the lock held. Returns the nearest anchor of the generation,
+        # a keyframe or the newest generation, with the deltas between them.
+        newest = self._newest
+        if newest is None or not self._oldest <= generation <= newest:
+            return None
+
+        anchors = [(newest, self._latest)]
+        generations = self._keyframe_generations
+        index = bisect_left(generations, generation)
+        for near in islice(generations, max(0, index - 1), index + 1):
+            anchors.append((near, self._keyframes[near]))
+        anchor, alive = min(anchors, key=lambda item: abs(item[0] - generation))
+
+        # The delta at `i` leads from generation `oldest + i` to the next one.
+        start, stop = sorted((anchor, generation))
+        start -= self._oldest
+        stop -= self._oldest
+        return alive, [self._deltas[i] for i in range(start, stop)]
+
+    @staticmethod
+    def _apply(
+        alive: npt.NDArray[np.int64], deltas: List[npt.NDArray[np.int64]]
+    ) -> npt.NDArray[np.int64]:
+        if not deltas:
+            return alive
+        # Deltas are small next to the world, so they are combined first.
+        rebuilt = _xor(alive, reduce(_xor, deltas))
+        rebuilt.flags.writeable = False
+        return rebuilt
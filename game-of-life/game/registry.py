@@ -0,0 +1,280 @@
+import time
+import secrets
+from typing import Set, Dict, List, Tuple, Iterable, Iterator, Optional
+from threading import Lock
+
+from core import logger
+
+from .game import GameOfLife
+
+
+class _Entry:
+    """
+    A game of the registry and the `time.monotonic()` time it was last looked up.
+    """
+
+    __slots__ = ("game", "used")
+
+    def __init__(self, game: GameOfLife, used: float) -> None:
+        self.game = game
+        self.used = used
+
+
+class GameRegistry:
+    """
+    A registry of independent games keyed by a random game ID. Games that have not
+    been looked up for `ttl` seconds expire, and when adding a game would exceed
+    `max_games` or the memory budget, the least recently used games are evicted.
+
+    Looking up a game never locks: it reads the entry from a dictionary that is
+    only replaced or changed by single atomic operations and stamps the entry with
+    the time of the lookup. Adding and removing games hold the registry's lock.
+
+    Threads that use a game beyond a lookup, such as requests and the scheduler,
+    hold it until they release it. The engine of a game that left the registry is
+    closed once no thread holds the game any more.
+
+    Attributes:
+    -----------
+    _max_games: int
+        The maximum number of games kept at once.
+    _ttl: float
+        The number of seconds a game is kept without being looked up.
+    _memory_budget: int
+        The memory all games may use, in bytes, as estimated by
+        `GameOfLife.nbytes`.
+    _games: Dict[str, _Entry]
+        The games and the time they were last looked up, by game ID.
+    _holders: Dict[GameOfLife, int]
+        The number of threads holding each game, while it is held.
+    _retired: Set[GameOfLife]
+        The held games that left the registry, closed once they are released.
+    _lock: Lock
+        The lock held while the registry changes.
+
+    Properties:
+    -----------
+        memory: int
+            The estimated memory all games use, in bytes.
+    """
+
+    def __init__(self, max_games: int, ttl: float, memory_budget: int) -> None:
+        """
+        Initializes an empty registry.
+
+        Parameters:
+        -----------
+            max_games: int
+                The maximum number of games kept at once.
+            ttl: float
+                The number of seconds a game is kept without being looked up.
+            memory_budget: int
+                The memory all games may use, in bytes.
+        """
+        self._max_games = max_games
+        self._ttl = ttl
+        self._memory_budget = memory_budget
+        self._games: Dict[str, _Entry] = {}
+        self._holders: Dict[GameOfLife, int] = {}
+        self._retired: Set[GameOfLife] = set()
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return len(self._games)
+
+    def __contains__(self, game_id: object) -> bool:
+        """
+        Whether there is a game with the given ID, without marking it as used.
+        """
+        return game_id in self._games
+
+    def __iter__(self) -> Iterator[Tuple[str, GameOfLife]]:
+        """
+        Iterates over a snapshot of the game IDs and games, without touching them.
+        """
+        return iter(
+            [(game_id, entry.game) for game_id, entry in self._games.copy().items()]
+        )
+
+    @property
+    def memory(self) -> int:
+        """
+        The estimated memory all games use, in bytes.
+        """
+        return sum(entry.game.nbytes for entry in self._games.copy().values())
+
+    def add(
+        self,
+        game: GameOfLife,
+        now: Optional[float] = None,
+        game_id: Optional[str] = None,
+    ) -> str:
+        """
+        Adds a game and returns its new ID. Expired games are removed first, then
+        the least recently used games until the new game fits. Raises `MemoryError`
+        if the game alone exceeds the memory budget.
+
+        Parameters:
+        -----------
+            game: GameOfLife
+                The game to add.
+            now: Optional[float]
+                The current `time.monotonic()` time (Default: None, the current one).
+            game_id: Optional[str]
+                The ID to add the game under, such as the ID of a restored game
+                (Default: None, a new random ID).
+        """
+        now = time.monotonic() if now is None else now
+        size = game.nbytes
+        if size > self._memory_budget:
+            raise MemoryError(
+                f"game needs {size} bytes, the budget is {self._memory_budget} bytes"
+            )
+
+        with self._lock:
+            evicted = self._expire(now)
+            memory = sum(entry.game.nbytes for entry in self._games.values())
+            # Lookups may stamp entries meanwhile, which only makes them survive.
+            by_use = sorted(self._games.items(), key=lambda item: item[1].used)
+            for evicted_id, entry in by_use:
+                if (
+                    len(self._games) < self._max_games
+                    and memory + size <= self._memory_budget
+                ):
+                    break
+                del self._games[evicted_id]
+                memory -= entry.game.nbytes
+                evicted.append(entry.game)
+                logger.debug("game evicted: %s", evicted_id)
+
+            game_id = game_id or secrets.token_urlsafe(8)
+            self._games[game_id] = _Entry(game, now)
+            closed = self._retire(evicted)
+
+        self._close(closed)
+        return game_id
+
+    def get(self, game_id: str, now: Optional[float] = None) -> Optional[GameOfLife]:
+        """
+        Returns the game with the given ID and marks it as recently used, or `None`
+        if there is no such game or it expired.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID returned by `add()`.
+            now: Optional[float]
+                The current `time.monotonic()` time (Default: None, the current one).
+        """
+        now = time.monotonic() if now is None else now
+        entry = self._games.get(game_id)
+        if entry is None or now - entry.used >= self._ttl:
+            return None
+        entry.used = now
+        return entry.game
+
+    def acquire(self, game_id: str, now: Optional[float] = None) -> Optional[GameOfLife]:
+        """
+        Returns the game with the given ID like `get()` and holds it until it is
+        released, or returns `None` without holding anything.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID returned by `add()`.
+            now: Optional[float]
+                The current `time.monotonic()` time (Default: None, the current one).
+        """
+        return self.hold(game_id) if self.get(game_id, now) is not None else None
+
+    def hold(self, game_id: str) -> Optional[GameOfLife]:
+        """
+        Returns the game with the given ID without marking it as recently used and
+        holds it, so that its engine is not closed before it is released even if
+        the game leaves the registry meanwhile. Returns `None` without holding
+        anything if there is no such game.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID returned by `add()`.
+        """
+        with self._lock:
+            entry = self._games.get(game_id)
+            if entry is None:
+                return None
+            self._holders[entry.game] = self._holders.get(entry.game, 0) + 1
+        return entry.game
+
+    def release(self, game: GameOfLife) -> None:
+        """
+        Releases a game returned by `hold()` or `acquire()`. The engine of a game that
+        left the registry is closed when its last holder releases it.
+
+        Parameters:
+        -----------
+            game: GameOfLife
+                The held game.
+        """
+        with self._lock:
+            holders = self._holders.pop(game) - 1
+            if holders:
+                self._holders[game] = holders
+                return
+            if game not in self._retired:
+                return
+            self._retired.discard(game)
+        game.engine.close()
+
+    def expire(self, now: Optional[float] = None) -> None:
+        """
+        Removes the games that were not looked up for `ttl` seconds.
+
+        Parameters:
+        -----------
+            now: Optional[float]
+                The current `time.monotonic()` time (Default: None, the current one).
+        """
+        now = time.monotonic() if now is None else now
+        with self._lock:
+            closed = self._retire(self._expire(now))
+        self._close(closed)
+
+    def remove(self, game_id: str) -> None:
+        """
+        Removes the game with the given ID, if there is one.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID returned by `add()`.
+        """
+        with self._lock:
+            entry = self._games.pop(game_id, None)
+            closed = self._retire([entry.game] if entry is not None else [])
+        self._close(closed)
+
+    def _expire(self, now: float) -> List[GameOfLife]:
+        expired = []
+        for game_id, entry in list(self._games.items()):
+            if now - entry.used >= self._ttl:
+                del self._games[game_id]
+                expired.append(entry.game)
+                logger.debug("game expired: %s", game_id)
+        return expired
+
+    def _retire(self, games: Iterable[GameOfLife]) -> List[GameOfLife]:
+        # Called with the lock held. Returns the games no thread holds, which are
+        # closed right away; the others are closed by their last `release()`.
+        closed = []
+        for game in games:
+            if game in self._holders:
+                self._retired.add(game)
+            else:
+                closed.append(game)
+        return closed
+
+    @staticmethod
+    def _close(games: Iterable[GameOfLife]) -> None:
+        for game in games:
+            game.engine.close()
@@ -0,0 +1,335 @@
+import os
+import time
+from typing import Dict, Optional
+from threading import Event, Thread, Condition
+
+from core import logger, metrics
+
+from .game import GameOfLife
+from .frame import Frame
+from .registry import GameRegistry
+from .checkpoint import EXTENSION, save_checkpoint, checkpoint_files
+
+_TICK_SECONDS = metrics.histogram(
+    "life_tick_seconds", "Time of a tick of the scheduler over all games."
+)
+
+
+class Scheduler:
+    """
+    Advances every game of a registry at its velocity on a background thread and
+    publishes a frame of each game whenever it changed, so that readers such as the
+    HTTP handlers never form generations themselves. A game that fell behind forms
+    all of its missed generations at once and publishes a single frame for them.
+    Given a checkpoint directory, the scheduler also checkpoints every game that
+    changed at a fixed interval and once more when it is stopped.
+
+    Attributes:
+    -----------
+    _games: GameRegistry
+        The games to advance.
+    _interval: float
+        The longest time in seconds the scheduler sleeps, so that new games start
+        promptly.
+    _frames: Dict[str, Frame]
+        The last published frame of every game, by game ID.
+    _published: Condition
+        The condition notified whenever a frame is published.
+    _stopped: Event
+        The event set when the scheduler is stopped.
+    _thread: Optional[Thread]
+        The background thread, once started.
+    _lag: float
+        How late the scheduler woke up the last time, in seconds.
+    _max_lag: float
+        How late the scheduler woke up at worst, in seconds.
+    _coalesced: int
+        The number of generations formed without publishing a frame of their own.
+    _checkpoints: Optional[str]
+        The directory games are checkpointed to, if any.
+    _checkpoint_interval: float
+        The number of seconds between two checkpoints.
+    _checkpoint_due: float
+        The `time.monotonic()` time the next checkpoint is due.
+    _checkpointed: Dict[str, Frame]
+        The last checkpointed frame of every game, by game ID.
+
+    Properties:
+    -----------
+        running: bool
+            Whether the background thread is running.
+        lag: float
+            How late the scheduler woke up the last time, in seconds.
+        max_lag: float
+            How late the scheduler woke up at worst, in seconds.
+        coalesced: int
+            The number of generations formed without publishing a frame of their
+            own, because the scheduler fell behind.
+    """
+
+    def __init__(
+        self,
+        games: GameRegistry,
+        interval: float = 0.05,
+        checkpoints: Optional[str] = None,
+        checkpoint_interval: float = 60.0,
+    ) -> None:
+        """
+        Initializes a scheduler that is not started yet.
+
+        Parameters:
+        -----------
+            games: GameRegistry
+                The games to advance.
+            interval: float
+                The longest time in seconds the scheduler sleeps (Default: 0.05).
+            checkpoints: Optional[str]
+                The directory to checkpoint games to (Default: None, no checkpoints).
+            checkpoint_interval: float
+                The number of seconds between two checkpoints (Default: 60).
+        """
+        self._games = games
+        self._interval = interval
+        self._frames: Dict[str, Frame] = {}
+        self._published = Condition()
+        self._stopped = Event()
+        self._thread: Optional[Thread] = None
+        self._lag = 0.0
+        self._max_lag = 0.0
+        self._coalesced = 0
+        self._checkpoints = checkpoints
+        self._checkpoint_interval = checkpoint_interval
+        self._checkpoint_due = time.monotonic() + checkpoint_interval
+        self._checkpointed: Dict[str, Frame] = {}
+
+    @property
+    def running(self) -> bool:
+        """
+        Whether the background thread is running.
+        """
+        return self._thread is not None and self._thread.is_alive()
+
+    @property
+    def lag(self) -> float:
+        """
+        How late the scheduler woke up the last time, in seconds.
+        """
+        return self._lag
+
+    @property
+    def max_lag(self) -> float:
+        """
+        How late the scheduler woke up at worst, in seconds.
+        """
+        return self._max_lag
+
+    @property
+    def coalesced(self) -> int:
+        """
+        The number of generations formed without publishing a frame of their own,
+        because the scheduler fell behind.
+        """
+        return self._coalesced
+
+    def start(self) -> None:
+        """
+        Starts the background thread, unless it is already running.
+        """
+        if self.running:
+            return
+        self._stopped.clear()
+        self._thread = Thread(target=self._run, name="life-scheduler", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """
+        Stops the background thread, wakes up all waiting readers and writes a last
+        checkpoint.
+
+        Parameters:
+        -----------
+            timeout: Optional[float]
+                The number of seconds to wait for the thread to stop (Default: None,
+                without a limit).
+        """
+        self._stopped.set()
+        with self._published:
+            self._published.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout)
+        self.checkpoint()
+
+    def checkpoint(self) -> int:
+        """
+        Checkpoints every game whose frame changed since its last checkpoint and
+        removes the checkpoints of games that left the registry. Returns the number
+        of games checkpointed, none without a checkpoint directory.
+        """
+        if self._checkpoints is None:
+            return 0
+        os.makedirs(self._checkpoints, exist_ok=True)
+        games = dict(self._games)
+        saved = 0
+        for game_id in games:
+            # Unbounded engines are read while saving, so they must not be closed.
+            game = self._games.hold(game_id)
+            if game is None:
+                continue
+            try:
+                frame = game.frame
+                if self._checkpointed.get(game_id) is frame:
+                    continue
+                path = os.path.join(self._checkpoints, game_id + EXTENSION)
+                save_checkpoint(game, path)
+            except OSError:
+                logger.exception("could not checkpoint game %s", game_id)
+                continue
+            finally:
+                self._games.release(game)
+            self._checkpointed[game_id] = frame
+            saved += 1
+
+        for game_id, path in checkpoint_files(self._checkpoints):
+            if game_id not in games:
+                self._checkpointed.pop(game_id, None)
+                try:
+                    os.remove(path)
+                except OSError:
+                    logger.exception("could not remove checkpoint '%s'", path)
+        logger.debug("%d games checkpointed to '%s'", saved, self._checkpoints)
+        return saved
+
+    def publish(self, game_id: str, game: GameOfLife) -> Frame:
+        """
+        Publishes and returns a frame of the game at its current generation.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID of the game in the registry.
+            game: GameOfLife
+                The game to publish a frame of.
+        """
+        frame = game.frame
+        with self._published:
+            self._frames[game_id] = frame
+            self._published.notify_all()
+        return frame
+
+    def frame(self, game_id: str) -> Optional[Frame]:
+        """
+        Returns the last published frame of a game, or `None` if no frame of the
+        game was published yet.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID of the game in the registry.
+        """
+        return self._frames.get(game_id)
+
+    def wait(
+        self, game_id: str, generation: Optional[int], timeout: float
+    ) -> Optional[Frame]:
+        """
+        Waits until a frame of a game other than the given generation is published,
+        the scheduler is stopped or the timeout passes, and returns the last
+        published frame of the game.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID of the game in the registry.
+            generation: Optional[int]
+                The generation the caller already knows, if any.
+            timeout: float
+                The longest time to wait, in seconds.
+        """
+
+        def published() -> bool:
+            frame = self._frames.get(game_id)
+            return frame is not None and frame.generation != generation
+
+        with self._published:
+            self._published.wait_for(
+                lambda: self._stopped.is_set() or published(), timeout
+            )
+            return self._frames.get(game_id)
+
+    def tick(self, now: Optional[float] = None) -> Optional[float]:
+        """
+        Expires the games of the registry that were not looked up for a while, forms
+        the generations of every other game that are due at its velocity, publishes
+        a frame of every game that changed and forgets the frames of games that left
+        the registry, and checkpoints the games when a checkpoint is due. Games held
+        by another thread are skipped until the next tick. Returns the
+        `time.monotonic()` time the next generation of any game is due, or `None` if
+        no game has started yet.
+
+        Parameters:
+        -----------
+            now: Optional[float]
+                The current `time.monotonic()` time (Default: None, the current one).
+        """
+        started = time.perf_counter()
+        now = time.monotonic() if now is None else now
+        self._games.expire(now)
+        games = dict(self._games)
+        next_due: Optional[float] = None
+        for game_id in games:
+            # The engine of a held game is not closed, even if it is evicted meanwhile.
+            game = self._games.hold(game_id)
+            if game is None:
+                continue
+            try:
+                formed = self._catch_up(game_id, game, now)
+            finally:
+                self._games.release(game)
+            if formed is None:
+                continue
+            if formed > 1:
+                self._coalesced += formed - 1
+            if formed == game.CHANGES_LIMIT:
+                logger.warning("game %s cannot keep up with its velocity", game_id)
+            if formed or game_id not in self._frames:
+                self.publish(game_id, game)
+
+            due = game.next_due
+            if due is not None and (next_due is None or due < next_due):
+                next_due = due
+
+        with self._published:
+            for game_id in self._frames.keys() - games.keys():
+                del self._frames[game_id]
+
+        if self._checkpoints is not None and now >= self._checkpoint_due:
+            self._checkpoint_due = now + self._checkpoint_interval
+            self.checkpoint()
+        _TICK_SECONDS.observe(time.perf_counter() - started)
+        return next_due
+
+    def _catch_up(self, game_id: str, game: GameOfLife, now: float) -> Optional[int]:
+        # A request skipping a game ahead locks it for as long as the jump takes and
+        # publishes the game itself, so the other games do not wait for it.
+        if not game.lock.acquire(blocking=False):
+            return None
+        try:
+            return game.catch_up(now)
+        except Exception:
+            logger.exception("could not advance game %s", game_id)
+            return None
+        finally:
+            game.lock.release()
+
+    def _run(self) -> None:
+        deadline = time.monotonic()
+        while not self._stopped.is_set():
+            now = time.monotonic()
+            self._lag = max(0.0, now - deadline)
+            self._max_lag = max(self._max_lag, self._lag)
+
+            next_due = self.tick(now)
+            deadline = now + self._interval
+            if next_due is not None:
+                deadline = min(deadline, next_due)
+            self._stopped.wait(max(0.0, deadline - time.monotonic()))
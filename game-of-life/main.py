@@ -1,19 +1,129 @@
+import io
+import atexit
+from typing import List, Tuple, Iterator, Optional
+
 import flask
 from werkzeug import Response
 
-from core import config
-from game import GameOfLife
+from core import Profiler, config, metrics
+from game import Frame, Scheduler, GameOfLife, GameRegistry, restore_games
 from forms import WorldForm
+from render import (
+    GIF_MIMETYPE,
+    PNG_MIMETYPE,
+    MAX_ANIMATION_PIXELS,
+    render_gif,
+    render_png,
+)
+from patterns import (
+    Pattern,
+    PatternLibrary,
+    iter_rle,
+    iter_cells,
+    frame_pattern,
+    parse_pattern,
+)
+from protocol import MIMETYPE, Encoded, FrameCache, encode_frame
+from core.metrics import MAGNITUDES
 
 
 class FlaskConfig:
     SECRET_KEY = config.secret
+    # The largest pattern of the form is far smaller as RLE or plaintext.
+    MAX_CONTENT_LENGTH = 1 << 20
 
 
 app = flask.Flask(__name__)
 app.config.from_object(FlaskConfig)
 app.jinja_env.filters["zip"] = zip
 
+games = GameRegistry(config.max_games, config.game_ttl, config.memory_budget << 20)
+if config.checkpoints is not None:
+    restore_games(games, config.checkpoints, config.cycle_window)
+scheduler = Scheduler(
+    games, checkpoints=config.checkpoints, checkpoint_interval=config.checkpoint_interval
+)
+scheduler.start()
+# Stopping the scheduler writes a last checkpoint.
+atexit.register(scheduler.stop)
+payloads = FrameCache(config.frame_cache)
+patterns = PatternLibrary(config.patterns)
+profiler = Profiler("life", config.profile)
+
+# Values the application keeps anyway are only read when the metrics are scraped.
+metrics.gauge("life_games", "Games in memory.", function=lambda: len(games))
+metrics.gauge(
+    "life_games_memory_bytes",
+    "Estimated memory of the games in memory.",
+    function=lambda: games.memory,
+)
+metrics.gauge(
+    "life_scheduler_lag_seconds",
+    "How late the scheduler woke up the last time.",
+    function=lambda: scheduler.lag,
+)
+metrics.gauge(
+    "life_scheduler_max_lag_seconds",
+    "How late the scheduler woke up at worst.",
+    function=lambda: scheduler.max_lag,
+)
+metrics.counter(
+    "life_coalesced_generations_total",
+    "Generations formed without publishing a frame of their own.",
+    function=lambda: scheduler.coalesced,
+)
+metrics.counter(
+    "life_frame_cache_hits_total",
+    "Payloads served from the frame cache.",
+    function=lambda: payloads.hits,
+)
+metrics.counter(
+    "life_frame_cache_misses_total",
+    "Payloads encoded for the frame cache.",
+    function=lambda: payloads.misses,
+)
+
+
+def _current_game(create: bool = False) -> Tuple[str, GameOfLife]:
+    # The game is chosen by the `game` argument, so that it can be shared, or by the
+    # session. Unknown games are not found; only `create` makes a new default game
+    # for a session without one, so that requests for made-up IDs cannot evict the
+    # games of others. The game is held until the request ends, so that its engine
+    # is not closed while it is used.
+    game_id = flask.request.args.get("game")
+    if game_id is not None:
+        game = games.acquire(game_id)
+        if game is None:
+            flask.abort(404, f"there is no game {game_id}")
+    else:
+        game_id = flask.session.get("game")
+        game = games.acquire(game_id) if game_id else None
+    if game_id is None or game is None:
+        if not create:
+            flask.abort(404, "there is no game in this session")
+        game_id = games.add(GameOfLife(cycle_window=config.cycle_window))
+        game = games.hold(game_id)
+        if game is None:
+            flask.abort(503, "the new game was evicted right away")
+    flask.g.game = game
+    flask.session["game"] = game_id
+    return game_id, game
+
+
+@app.teardown_request
+def _release_game(error: Optional[BaseException]) -> None:
+    game = flask.g.pop("game", None)
+    if game is not None:
+        games.release(game)
+
+
+def _wants_binary() -> bool:
+    wire_format = flask.request.args.get("format")
+    if wire_format is not None:
+        return wire_format == "binary"
+    accepted = flask.request.accept_mimetypes.best_match(["application/json", MIMETYPE])
+    return accepted == MIMETYPE
+
 
 @app.route("/", methods=["GET", "POST"])
 def index() -> str | Response:
@@ -22,9 +132,39 @@ def index() -> str | Response:
         return
 
     form = WorldForm()
+    form.pattern.choices = [("", "Random"), *patterns.choices()]
     if flask.request.method == "POST" and form.validate_on_submit():
-        GameOfLife(form.width.data, form.height.data, form.velocity.data)
-        return flask.redirect(flask.url_for("life"))
+        try:
+            pattern = _form_pattern(form)
+        except ValueError as error:
+            form.upload.errors.append(str(error))
+            return flask.render_template("index.html", form=form)
+
+        width, height = form.width.data, form.height.data
+        if pattern is not None and (pattern.width > width or pattern.height > height):
+            form.pattern.errors.append(
+                f"The pattern of {pattern.width}x{pattern.height} cells does not fit"
+            )
+            return flask.render_template("index.html", form=form)
+
+        game = GameOfLife(
+            width,
+            height,
+            form.velocity.data,
+            form.engine.data,
+            cycle_window=config.cycle_window,
+            auto_stop=form.auto_stop.data,
+            rule=form.compiled_rule().notation,
+        )
+        if pattern is not None:
+            game.load_cells(pattern.centered(width, height).tolist())
+        try:
+            game_id = games.add(game)
+        except MemoryError as error:
+            game.engine.close()
+            flask.abort(503, str(error))
+        flask.session["game"] = game_id
+        return flask.redirect(flask.url_for("life", game=game_id))
 
     return flask.render_template(
         "index.html",
@@ -32,33 +172,239 @@ def index() -> str | Response:
     )
 
 
+def _form_pattern(form: WorldForm) -> Optional[Pattern]:
+    # An uploaded pattern is read as it streams in and rejected as soon as it does
+    # not fit the world; a library pattern is read once.
+    upload = form.upload.data
+    if upload:
+        lines = io.TextIOWrapper(upload.stream, encoding="utf-8")
+        max_size = form.width.data, form.height.data
+        return parse_pattern(lines, upload.filename or "", max_size)
+    if form.pattern.data:
+        return patterns.load(form.pattern.data)
+    return None
+
+
 @app.route("/life", methods=["GET", "POST"])
 def life() -> str | Response:
     if flask.request.method not in ("GET", "POST"):
         flask.abort(405, "Only 'GET' and 'POST' methods allowed")
         return
+    return profiler.run(_life)
+
 
-    game = GameOfLife()
+def _life() -> str | Response:
+    game_id, game = _current_game(create=flask.request.method == "GET")
     if flask.request.method == "GET":
+        frame = scheduler.frame(game_id) or scheduler.publish(game_id, game)
         addr = "127.0.0.1" if config.addr == "0.0.0.0" else config.addr
         return flask.render_template(
             "life.html",
             host=f"{addr}:{config.port}",
+            game_id=game_id,
             velocity=game.velocity,
-            life_count=game.life_count,
-            world=game.world,
-            previous_world=game.previous_world,
+            life_count=frame.generation,
+            world=frame.world,
+            wire_format=flask.request.args.get("format", "json"),
         )
 
-    game.form_new_generation()
-    return flask.jsonify(
-        {
-            "life_count": game.life_count,
-            "world": game.world,
-            "previous_world": game.previous_world,
-        }
+    # The scheduler forms the generations; `steps` explicitly skips ahead.
+    steps = flask.request.args.get("steps", type=int)
+    if steps is not None:
+        # The game is locked while it skips ahead. Other engines form every
+        # generation, HashLife jumps by powers of two but gives up after its timeout.
+        limit = 1 << 62 if game.engine.name == "hashlife" else config.max_steps
+        if not 1 <= steps <= limit:
+            flask.abort(400, f"'steps' must be from 1 to {limit}")
+        try:
+            game.advance(steps, config.hashlife_timeout)
+        except TimeoutError as error:
+            flask.abort(400, str(error))
+        frame = scheduler.publish(game_id, game)
+    else:
+        frame = scheduler.frame(game_id) or scheduler.publish(game_id, game)
+
+    since = flask.request.args.get("since", type=int)
+    if _wants_binary():
+        encoded = payloads.payload(game_id, frame, "binary")
+    elif since is None:
+        encoded = payloads.payload(game_id, frame, "world")
+    else:
+        encoded = payloads.payload(game_id, frame, "delta", since)
+    return _respond(encoded)
+
+
+def _respond(encoded: Encoded) -> Response:
+    # Viewers that already have this payload only get its entity tag back.
+    if flask.request.if_none_match.contains(encoded.etag):
+        response = Response(status=304)
+    else:
+        response = Response(encoded.body, mimetype=encoded.mimetype)
+        metrics.histogram(
+            "life_response_bytes",
+            "Size of the payloads sent, by endpoint.",
+            {"endpoint": flask.request.endpoint or ""},
+            MAGNITUDES,
+        ).observe(len(encoded.body))
+    response.set_etag(encoded.etag)
+    return response
+
+
+def _stream(game_id: str, since: Optional[int]) -> Iterator[bytes]:
+    # The server only resumes the generator once the previous event was written, so
+    # a slow client skips the frames published in the meantime instead of queueing
+    # them, and receives a single delta of all their changes. The stream ends with
+    # the last frame of a stopped game, or when the game is evicted; checking for
+    # the game does not mark it as used, so an open stream does not keep it alive.
+    # A comment is written whenever no frame was published, so that a closed
+    # connection is noticed.
+    while game_id in games:
+        frame = scheduler.wait(game_id, since, timeout=1.0)
+        if frame is None or (frame.generation == since and not frame.stopped):
+            yield b": keepalive\n\n"
+            continue
+        if since is None:
+            encoded = payloads.payload(game_id, frame, "snapshot")
+        else:
+            encoded = payloads.payload(game_id, frame, "delta", since)
+        since = frame.generation
+        yield b"data: " + encoded.body + b"\n\n"
+        if frame.stopped:
+            return
+
+
+@app.route("/life/stream", methods=["GET"])
+def life_stream() -> Response:
+    game_id, _ = _current_game()
+    since = flask.request.args.get("since", type=int)
+    return Response(
+        _stream(game_id, since),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
     )
 
 
+@app.route("/life/history", methods=["GET"])
+def life_history() -> Response:
+    game_id, game = _current_game()
+    generation = flask.request.args.get("generation", type=int)
+    if generation is None:
+        history = game.history
+        return flask.jsonify(oldest=history.oldest, newest=history.newest)
+
+    # Scrubbing reads a rebuilt frame of the history without changing the game.
+    snapshot = game.snapshot(generation)
+    if snapshot is None:
+        flask.abort(404, f"generation {generation} is not kept in the history")
+    wire_format = "binary" if _wants_binary() else "snapshot"
+    mimetype = MIMETYPE if wire_format == "binary" else "application/json"
+    encoded = payloads.cached(
+        (game_id, snapshot.version, "history", generation, wire_format),
+        lambda: (encode_frame(snapshot, wire_format), mimetype),
+    )
+    return _respond(encoded)
+
+
+@app.route("/life/rewind", methods=["POST"])
+def life_rewind() -> Response:
+    game_id, game = _current_game()
+    generation = flask.request.args.get("generation", type=int)
+    if generation is None:
+        flask.abort(400, "'generation' must be an integer")
+    if not game.rewind(generation):
+        flask.abort(404, f"generation {generation} is not kept in the history")
+    frame = scheduler.publish(game_id, game)
+    return _respond(payloads.payload(game_id, frame, "snapshot"))
+
+
+def _scale() -> int:
+    scale = flask.request.args.get("scale", 4, type=int)
+    if scale < 1:
+        flask.abort(400, "'scale' must be a positive integer")
+    return scale
+
+
+@app.route("/life/frame.png", methods=["GET"])
+def life_frame() -> Response:
+    game_id, game = _current_game()
+    scale = _scale()
+    frame = scheduler.frame(game_id) or scheduler.publish(game_id, game)
+    try:
+        encoded = payloads.cached(
+            (game_id, frame.version, "png", scale),
+            lambda: (render_png(frame, scale), PNG_MIMETYPE),
+        )
+    except ValueError as error:
+        flask.abort(400, str(error))
+    return _respond(encoded)
+
+
+@app.route("/life/animation.gif", methods=["GET"])
+def life_animation() -> Response:
+    game_id, game = _current_game()
+    scale = _scale()
+    frame = scheduler.frame(game_id) or scheduler.publish(game_id, game)
+
+    # Only the generations the history keeps can be rebuilt, by default the ones
+    # whose changes the last frame keeps.
+    oldest = game.history.oldest
+    if oldest is None or oldest > frame.generation:
+        oldest = frame.generation
+    default = max(oldest, frame.generation - len(frame.changes))
+    start = flask.request.args.get("from", default, type=int)
+    stop = flask.request.args.get("to", frame.generation, type=int)
+    if not oldest <= start <= stop <= frame.generation:
+        flask.abort(
+            400, f"'from' and 'to' must be within {oldest} and {frame.generation}"
+        )
+    # Rejected before any generation is rebuilt from the history.
+    if (stop - start + 1) * frame.width * frame.height * scale**2 > MAX_ANIMATION_PIXELS:
+        flask.abort(
+            400, f"animation of {stop - start + 1} frames at {scale}x is too large"
+        )
+
+    def encode() -> Tuple[bytes, str]:
+        frames: List[Frame] = []
+        for generation in range(start, stop + 1):
+            snapshot = game.snapshot(generation)
+            if snapshot is None:
+                raise ValueError(f"generation {generation} is no longer kept")
+            frames.append(snapshot)
+        return render_gif(frames, game.velocity, scale), GIF_MIMETYPE
+
+    try:
+        encoded = payloads.cached(
+            (game_id, frame.version, "gif", start, stop, scale), encode
+        )
+    except ValueError as error:
+        flask.abort(400, str(error))
+    return _respond(encoded)
+
+
+@app.route("/life/pattern.<extension>", methods=["GET"])
+def life_pattern(extension: str) -> Response:
+    if extension not in ("rle", "cells"):
+        flask.abort(404)
+    game_id, game = _current_game()
+    frame = scheduler.frame(game_id) or scheduler.publish(game_id, game)
+    pattern = frame_pattern(
+        frame,
+        f"Game {game_id} at generation {frame.generation}",
+        game.rule.notation,
+    )
+    lines = iter_rle(pattern) if extension == "rle" else iter_cells(pattern)
+    filename = f"{game_id}-{frame.generation}.{extension}"
+    return Response(
+        lines,
+        mimetype="text/plain",
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@app.route("/metrics", methods=["GET"])
+def life_metrics() -> Response:
+    return Response(metrics.render(), content_type="text/plain; version=0.0.4")
+
+
 if __name__ == "__main__":
     app.run(host=config.addr, port=config.port, debug=config.debug)
@@ -0,0 +1,151 @@
+"""
+Patterns for Game of Life Application
+
+This module reads and writes patterns in the standard RLE (`.rle`) and plaintext
+(`.cells`) formats, and keeps a catalogue of the pattern files of a directory, so
+that new worlds can be seeded with known patterns instead of random cells. Pattern
+files are read and written line by line: only the runs or columns of alive cells
+of a pattern are kept while reading, and exports are written as they are produced,
+so multi-megabyte patterns never exist as a single string in memory.
+
+Modules:
+--------
+- `patterns/pattern.py`: Defines the `Pattern` class and the export of a frame.
+
+- `patterns/rle.py`: Defines the reader and writer of the RLE format.
+
+- `patterns/plaintext.py`: Defines the reader and writer of the plaintext format.
+
+- `patterns/library.py`: Defines the `PatternLibrary` catalogue.
+
+- `patterns/files`: The bundled pattern files.
+
+Classes:
+--------
+Pattern(NamedTuple):
+    A pattern of alive cells with its `name`, the `width` and `height` of its
+    bounding box, the `n x 2` array of the `(row, column)` positions of its alive
+    `cells` and its `rule` in B/S notation.
+
+    Methods:
+    --------
+        centered(width: int, height: int) -> ndarray:
+            Returns the positions of the alive cells moved to the center of a world.
+
+PatternEntry(NamedTuple):
+    A pattern of a `PatternLibrary`, known from its file without reading its
+    cells: its `key` (the file name without extension), `name`, `path`, `width`
+    and `height`.
+
+PatternLibrary:
+    A catalogue of the pattern files in a directory. The catalogue is indexed once
+    from the names and sizes of the files, without reading their cells, and every
+    pattern is read on first use only and kept, so that worlds are seeded from it
+    without reading the file again.
+
+    Properties:
+    -----------
+        directory: str
+            The directory of the pattern files.
+
+    Methods:
+    --------
+        __init__(directory: str) -> None:
+            Indexes the pattern files of a directory. Files that cannot be read
+            are left out of the catalogue.
+        entry(key: str) -> Optional[PatternEntry]:
+            Returns the catalogue entry of a pattern, or `None` if there is no
+            such pattern.
+        load(key: str) -> Pattern:
+            Returns a pattern of the catalogue, reading its file on first use.
+            Raises `KeyError` if there is no such pattern.
+        choices() -> List[Tuple[str, str]]:
+            Returns the `(key, name)` pairs of all patterns, sorted by name.
+
+Functions:
+----------
+read_rle(lines: Iterable[str], max_size: Optional[Tuple[int, int]] = None) -> Pattern:
+    Reads a pattern in the RLE format line by line. Any state other than `b` or
+    `.` is read as alive. Runs past the size of the header, or past `max_size`,
+    are rejected while reading.
+
+read_rle_header(lines: Iterable[str]) -> Tuple[str, int, int]:
+    Reads the name and size of an RLE pattern, stopping at its header line.
+
+iter_rle(pattern: Pattern, line_length: int = 70) -> Iterator[str]:
+    Writes a pattern in the RLE format, yielding it line by line.
+
+write_rle(file: IO[str], pattern: Pattern) -> None:
+    Writes a pattern in the RLE format to a file, line by line.
+
+read_cells(
+    lines: Iterable[str], max_size: Optional[Tuple[int, int]] = None
+) -> Pattern:
+    Reads a pattern in the plaintext format line by line, with `O` (or `*`) for
+    alive and `.` for dead cells. Rows past `max_size` are rejected while reading.
+
+read_cells_header(lines: Iterable[str]) -> Tuple[str, int, int]:
+    Reads the name and size of a plaintext pattern without keeping its cells.
+
+iter_cells(pattern: Pattern) -> Iterator[str]:
+    Writes a pattern in the plaintext format, yielding it row by row.
+
+write_cells(file: IO[str], pattern: Pattern) -> None:
+    Writes a pattern in the plaintext format to a file, row by row.
+
+parse_pattern(
+    file: IO[str], filename: str, max_size: Optional[Tuple[int, int]] = None
+) -> Pattern:
+    Reads a pattern in the format chosen by the extension of its file name,
+    rejecting cells past `max_size` while reading.
+
+read_pattern(path: str) -> Pattern:
+    Reads a pattern file in the format chosen by its extension.
+
+frame_pattern(frame: Frame, name: str = "", rule: str = "B3/S23") -> Pattern:
+    Returns the alive cells of a frame as a pattern the size of its world, with
+    the rule of its game.
+
+Endpoint:
+---------
+The form of the index page seeds the new world with a pattern of the library or
+an uploaded pattern file, centered in the world. Uploads are read no further than
+the size of the world, and requests of more than 1 MiB are rejected with `413`.
+`GET /life/pattern.rle` and `GET /life/pattern.cells` export the last frame of the
+game.
+
+Usage:
+------
+```python
+from game import GameOfLife
+from patterns import PatternLibrary, iter_rle, frame_pattern
+
+library = PatternLibrary("game-of-life/patterns/files")
+game = GameOfLife(100, 100)
+game.load_cells(library.load("glider").centered(100, 100).tolist())
+with open("game.rle", "w") as file:
+    file.writelines(iter_rle(frame_pattern(game.frame, rule=game.rule.notation)))
+```
+"""
+
+from .rle import iter_rle, read_rle, write_rle, read_rle_header
+from .library import PatternEntry, PatternLibrary, read_pattern, parse_pattern
+from .pattern import Pattern, frame_pattern
+from .plaintext import iter_cells, read_cells, write_cells, read_cells_header
+
+__all__ = [
+    "Pattern",
+    "PatternEntry",
+    "PatternLibrary",
+    "frame_pattern",
+    "iter_cells",
+    "iter_rle",
+    "parse_pattern",
+    "read_cells",
+    "read_cells_header",
+    "read_pattern",
+    "read_rle",
+    "read_rle_header",
+    "write_cells",
+    "write_rle",
+]
@@ -0,0 +1,200 @@
+import os
+from typing import (
+    IO,
+    Dict,
+    List,
+    Tuple,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+    NamedTuple,
+)
+from threading import Lock
+
+from core import logger
+
+from .rle import read_rle, read_rle_header
+from .pattern import Pattern
+from .plaintext import read_cells, read_cells_header
+
+Reader = Callable[[Iterable[str], Optional[Tuple[int, int]]], Pattern]
+HeaderReader = Callable[[Iterable[str]], Tuple[str, int, int]]
+
+READERS: Dict[str, Tuple[Reader, HeaderReader]] = {
+    ".rle": (read_rle, read_rle_header),
+    ".cells": (read_cells, read_cells_header),
+}
+
+
+class PatternEntry(NamedTuple):
+    """
+    A pattern of a `PatternLibrary`, known from its file without reading its cells.
+
+    Attributes:
+    -----------
+    key: str
+        The name of the pattern file without its extension.
+    name: str
+        The name of the pattern, or its key if the file does not name it.
+    path: str
+        The path of the pattern file.
+    width: int
+        The width of the bounding box of the pattern.
+    height: int
+        The height of the bounding box of the pattern.
+    """
+
+    key: str
+    name: str
+    path: str
+    width: int
+    height: int
+
+
+def parse_pattern(
+    file: IO[str], filename: str, max_size: Optional[Tuple[int, int]] = None
+) -> Pattern:
+    """
+    Reads a pattern in the RLE (`.rle`) or plaintext (`.cells`) format, chosen by
+    the extension of its file name, line by line. Cells past the largest size are
+    rejected as soon as they are read.
+
+    Parameters:
+    -----------
+        file: IO[str]
+            The open pattern file, such as an upload.
+        filename: str
+            The name of the pattern file.
+        max_size: Optional[Tuple[int, int]]
+            The largest `(width, height)` of the pattern (Default: None, any size).
+    """
+    extension = os.path.splitext(filename)[1].lower()
+    if extension not in READERS:
+        raise ValueError(f"unknown pattern format: {filename}")
+    return READERS[extension][0](file, max_size)
+
+
+def read_pattern(path: str) -> Pattern:
+    """
+    Reads a pattern file in the RLE (`.rle`) or plaintext (`.cells`) format, line
+    by line.
+
+    Parameters:
+    -----------
+        path: str
+            The path of the pattern file.
+    """
+    with open(path, encoding="utf-8") as file:
+        return parse_pattern(file, path)
+
+
+class PatternLibrary:
+    """
+    A catalogue of the pattern files in a directory. The catalogue is indexed once
+    from the names and sizes of the files, without reading their cells, and every
+    pattern is read on first use only and kept, so that worlds are seeded from it
+    without reading the file again.
+
+    Attributes:
+    -----------
+    _directory: str
+        The directory of the pattern files.
+    _entries: Dict[str, PatternEntry]
+        The catalogue of patterns by key.
+    _patterns: Dict[str, Pattern]
+        The patterns read so far by key.
+    _lock: Lock
+        The lock held while a pattern is read.
+
+    Properties:
+    -----------
+        directory: str
+            The directory of the pattern files.
+    """
+
+    def __init__(self, directory: str) -> None:
+        """
+        Indexes the pattern files of a directory. Files that cannot be read are
+        left out of the catalogue.
+
+        Parameters:
+        -----------
+            directory: str
+                The directory of the pattern files.
+        """
+        self._directory = directory
+        self._entries: Dict[str, PatternEntry] = {}
+        self._patterns: Dict[str, Pattern] = {}
+        self._lock = Lock()
+
+        files = sorted(os.listdir(directory)) if os.path.isdir(directory) else []
+        for filename in files:
+            key, extension = os.path.splitext(filename)
+            if extension.lower() not in READERS:
+                continue
+            path = os.path.join(directory, filename)
+            try:
+                with open(path, encoding="utf-8") as file:
+                    name, width, height = READERS[extension.lower()][1](file)
+            except (OSError, ValueError) as error:
+                logger.error("could not index pattern '%s': %s", path, error)
+                continue
+            self._entries[key] = PatternEntry(key, name or key, path, width, height)
+        logger.debug("%d patterns indexed in '%s'", len(self._entries), directory)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> Iterator[PatternEntry]:
+        return iter(self._entries.values())
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._entries
+
+    @property
+    def directory(self) -> str:
+        """
+        The directory of the pattern files.
+        """
+        return self._directory
+
+    def entry(self, key: str) -> Optional[PatternEntry]:
+        """
+        Returns the catalogue entry of a pattern, or `None` if there is no such
+        pattern.
+
+        Parameters:
+        -----------
+            key: str
+                The name of the pattern file without its extension.
+        """
+        return self._entries.get(key)
+
+    def load(self, key: str) -> Pattern:
+        """
+        Returns a pattern of the catalogue, reading its file on first use. Raises
+        `KeyError` if there is no such pattern.
+
+        Parameters:
+        -----------
+            key: str
+                The name of the pattern file without its extension.
+        """
+        pattern = self._patterns.get(key)
+        if pattern is not None:
+            return pattern
+        entry = self._entries[key]
+        with self._lock:
+            pattern = self._patterns.get(key)
+            if pattern is None:
+                pattern = read_pattern(entry.path)._replace(name=entry.name)
+                self._patterns[key] = pattern
+        return pattern
+
+    def choices(self) -> List[Tuple[str, str]]:
+        """
+        Returns the `(key, name)` pairs of all patterns, sorted by name.
+        """
+        choices = [(entry.key, entry.name) for entry in self]
+        return sorted(choices, key=lambda choice: choice[1].lower())
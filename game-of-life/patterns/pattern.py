@@ -0,0 +1,108 @@
+from typing import Tuple, NamedTuple
+
+import numpy as np
+import numpy.typing as npt
+
+from game import Frame
+
+
+class Pattern(NamedTuple):
+    """
+    A pattern of alive cells, read from or written to a pattern file.
+
+    Attributes:
+    -----------
+    name: str
+        The name of the pattern, empty if it has none.
+    width: int
+        The width of the bounding box of the pattern.
+    height: int
+        The height of the bounding box of the pattern.
+    cells: npt.NDArray[np.int64]
+        The `(row, column)` positions of the alive cells as an `n x 2` array, sorted
+        by row and column.
+    rule: str
+        The rule of the pattern in B/S notation.
+    """
+
+    name: str
+    width: int
+    height: int
+    cells: npt.NDArray[np.int64]
+    rule: str = "B3/S23"
+
+    def centered(self, width: int, height: int) -> npt.NDArray[np.int64]:
+        """
+        Returns the positions of the alive cells moved to the center of a world.
+
+        Parameters:
+        -----------
+            width: int
+                The width of the world grid.
+            height: int
+                The height of the world grid.
+        """
+        offset = np.array([(height - self.height) // 2, (width - self.width) // 2])
+        return np.asarray(self.cells + offset, dtype=np.int64)
+
+
+def cell_runs(
+    cells: npt.NDArray[np.int64],
+) -> Tuple[npt.NDArray[np.int64], npt.NDArray[np.int64], npt.NDArray[np.int64]]:
+    """
+    Splits sorted cell positions into the rows, starting columns and lengths of
+    the runs of horizontally adjacent cells.
+
+    Parameters:
+    -----------
+        cells: npt.NDArray[np.int64]
+            The `(row, column)` positions of the cells, sorted by row and column.
+    """
+    rows, columns = cells[:, 0], cells[:, 1]
+    starts = np.ones(len(cells), dtype=bool)
+    starts[1:] = (rows[1:] != rows[:-1]) | (columns[1:] != columns[:-1] + 1)
+    first = np.flatnonzero(starts)
+    lengths = np.diff(np.append(first, len(cells)))
+    return rows[first], columns[first], lengths
+
+
+def expand_runs(
+    rows: npt.NDArray[np.int64],
+    columns: npt.NDArray[np.int64],
+    lengths: npt.NDArray[np.int64],
+) -> npt.NDArray[np.int64]:
+    """
+    Expands runs of horizontally adjacent cells into the `n x 2` array of their
+    `(row, column)` positions. The inverse of `cell_runs()`.
+
+    Parameters:
+    -----------
+        rows: npt.NDArray[np.int64]
+            The row of every run.
+        columns: npt.NDArray[np.int64]
+            The first column of every run.
+        lengths: npt.NDArray[np.int64]
+            The number of cells of every run.
+    """
+    offsets = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths)
+    return np.column_stack(
+        [np.repeat(rows, lengths), np.repeat(columns, lengths) + offsets]
+    ).astype(np.int64)
+
+
+def frame_pattern(frame: Frame, name: str = "", rule: str = "B3/S23") -> Pattern:
+    """
+    Returns the alive cells of a frame as a pattern the size of its world.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to export.
+        name: str
+            The name of the pattern (Default: "").
+        rule: str
+            The rule of the game in B/S notation (Default: "B3/S23").
+    """
+    rows, columns = np.divmod(frame.alive, frame.width)
+    cells = np.column_stack([rows, columns]).astype(np.int64)
+    return Pattern(name, frame.width, frame.height, cells, rule)
@@ -0,0 +1,118 @@
+from typing import IO, List, Tuple, Iterable, Iterator, Optional
+
+import numpy as np
+import numpy.typing as npt
+
+from .pattern import Pattern
+
+_ALIVE = np.frombuffer(b"O*", dtype=np.uint8)
+_DEAD = ord(".")
+
+
+def _row(line: str) -> str:
+    return line.rstrip("\r\n")
+
+
+def read_cells_header(lines: Iterable[str]) -> Tuple[str, int, int]:
+    """
+    Reads the name and size of a plaintext pattern. The format has no header, so
+    all lines are read, but none of them is kept.
+
+    Parameters:
+    -----------
+        lines: Iterable[str]
+            The lines of the pattern, such as an open file.
+    """
+    name = ""
+    width = height = 0
+    for line in lines:
+        if line.startswith("!"):
+            if line.startswith("!Name:"):
+                name = line[6:].strip()
+            continue
+        width = max(width, len(_row(line)))
+        height += 1
+    return name, width, height
+
+
+def read_cells(
+    lines: Iterable[str], max_size: Optional[Tuple[int, int]] = None
+) -> Pattern:
+    """
+    Reads a pattern in the plaintext `.cells` format line by line, with `O` (or `*`)
+    for alive and `.` for dead cells. Every row is scanned as an array instead of
+    character by character. A row past the largest size is rejected as soon as it
+    is read.
+
+    Parameters:
+    -----------
+        lines: Iterable[str]
+            The lines of the pattern, such as an open file.
+        max_size: Optional[Tuple[int, int]]
+            The largest `(width, height)` of the pattern (Default: None, any size).
+    """
+    name = ""
+    width = height = 0
+    rows: List[npt.NDArray[np.int64]] = []
+    for line in lines:
+        if line.startswith("!"):
+            if line.startswith("!Name:"):
+                name = line[6:].strip()
+            continue
+
+        row = _row(line)
+        if max_size is not None and (len(row) > max_size[0] or height >= max_size[1]):
+            raise ValueError(
+                f"plaintext row {height} is past the size of {max_size[0]}x{max_size[1]}"
+            )
+        cells = np.frombuffer(row.encode(), dtype=np.uint8)
+        alive = np.isin(cells, _ALIVE)
+        if not np.all(alive | (cells == _DEAD)):
+            raise ValueError(f"unexpected character in plaintext row {height}: {row!r}")
+        columns = np.flatnonzero(alive)
+        if len(columns):
+            rows.append(np.column_stack([np.full(len(columns), height), columns]))
+        width = max(width, len(row))
+        height += 1
+
+    positions = np.concatenate(rows) if rows else np.empty((0, 2))
+    return Pattern(name, width, height, positions.astype(np.int64))
+
+
+def iter_cells(pattern: Pattern) -> Iterator[str]:
+    """
+    Writes a pattern in the plaintext `.cells` format, yielding it row by row.
+    Trailing dead cells of a row are left out.
+
+    Parameters:
+    -----------
+        pattern: Pattern
+            The pattern to write.
+    """
+    if pattern.name:
+        yield f"!Name: {pattern.name}\n"
+
+    rows, columns = pattern.cells[:, 0], pattern.cells[:, 1]
+    bounds = np.searchsorted(rows, np.arange(pattern.height + 1))
+    for row in range(pattern.height):
+        alive = columns[bounds[row] : bounds[row + 1]]  # noqa: E203
+        if not len(alive):
+            yield "\n"
+            continue
+        line = np.full(alive[-1] + 1, _DEAD, dtype=np.uint8)
+        line[alive] = ord("O")
+        yield line.tobytes().decode() + "\n"
+
+
+def write_cells(file: IO[str], pattern: Pattern) -> None:
+    """
+    Writes a pattern in the plaintext `.cells` format to a file, row by row.
+
+    Parameters:
+    -----------
+        file: IO[str]
+            The file to write to.
+        pattern: Pattern
+            The pattern to write.
+    """
+    file.writelines(iter_cells(pattern))
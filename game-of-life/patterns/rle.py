@@ -0,0 +1,181 @@
+import re
+from array import array
+from typing import IO, Tuple, Iterable, Iterator, Optional
+
+import numpy as np
+
+from .pattern import Pattern, cell_runs, expand_runs
+
+LINE_LENGTH = 70
+
+_HEADER = re.compile(
+    r"x\s*=\s*(\d+)\s*,\s*y\s*=\s*(\d+)(?:\s*,\s*rule\s*=\s*([^\s,]+))?", re.IGNORECASE
+)
+_TOKEN = re.compile(r"(\d*)([^\d\s])")
+_TRAILING_COUNT = re.compile(r"\d+$")
+
+
+def read_rle_header(lines: Iterable[str]) -> Tuple[str, int, int]:
+    """
+    Reads the name and size of an RLE pattern, stopping at its header line.
+
+    Parameters:
+    -----------
+        lines: Iterable[str]
+            The lines of the pattern, such as an open file.
+    """
+    name = ""
+    for line in lines:
+        line = line.strip()
+        if line.startswith("#N"):
+            name = line[2:].strip()
+        elif not line.startswith("#") and line:
+            header = _HEADER.match(line)
+            if header is None:
+                break
+            return name, int(header[1]), int(header[2])
+    raise ValueError("RLE pattern has no header line")
+
+
+def read_rle(lines: Iterable[str], max_size: Optional[Tuple[int, int]] = None) -> Pattern:
+    """
+    Reads a pattern in the RLE format line by line. Only the runs of alive cells
+    are kept while reading, so large patterns never exist as text in memory. Any
+    state other than `b` or `.` is read as alive. A run of alive cells past the
+    size of the header, or past the largest size if the header has none, is
+    rejected as soon as it is read.
+
+    Parameters:
+    -----------
+        lines: Iterable[str]
+            The lines of the pattern, such as an open file.
+        max_size: Optional[Tuple[int, int]]
+            The largest `(width, height)` of the pattern (Default: None, any size).
+    """
+    name, rule = "", "B3/S23"
+    width = height = 0
+    max_width, max_height = max_size or (None, None)
+    rows, columns, lengths = array("q"), array("q"), array("q")
+    row = column = 0
+    # A run count may be split from its tag by a line break.
+    count = ""
+    done = header = False
+
+    for number, line in enumerate(lines, 1):
+        line = line.strip()
+        if not header:
+            if line.startswith("#N"):
+                name = line[2:].strip()
+            if line.startswith("#") or not line:
+                continue
+            header = True
+            match = _HEADER.match(line)
+            if match is not None:
+                width, height = int(match[1]), int(match[2])
+                rule = match[3] or rule
+                if max_size is not None and (width > max_size[0] or height > max_size[1]):
+                    raise ValueError(
+                        f"RLE pattern of {width}x{height} cells is larger than "
+                        f"{max_size[0]}x{max_size[1]}"
+                    )
+                max_width, max_height = width or max_width, height or max_height
+                continue
+
+        line = count + line
+        trailing = _TRAILING_COUNT.search(line)
+        count = trailing[0] if trailing else ""
+        end = trailing.start() if trailing else len(line)
+        for token in _TOKEN.finditer(line, 0, end):
+            run = int(token[1] or 1)
+            tag = token[2]
+            if tag in "b.":
+                column += run
+            elif tag == "$":
+                row += run
+                column = 0
+            elif tag == "!":
+                done = True
+                break
+            elif tag.isalpha():
+                if max_width is not None and column + run > max_width:
+                    raise ValueError(
+                        f"RLE run past the width of {max_width} cells on line {number}"
+                    )
+                if max_height is not None and row >= max_height:
+                    raise ValueError(
+                        f"RLE run past the height of {max_height} cells on line {number}"
+                    )
+                rows.append(row)
+                columns.append(column)
+                lengths.append(run)
+                column += run
+            else:
+                raise ValueError(f"unexpected {tag!r} in RLE pattern on line {number}")
+        if done:
+            break
+
+    cells = expand_runs(
+        np.frombuffer(rows, dtype=np.int64),
+        np.frombuffer(columns, dtype=np.int64),
+        np.frombuffer(lengths, dtype=np.int64),
+    )
+    if len(cells):
+        height = max(height, int(cells[:, 0].max()) + 1)
+        width = max(width, int(cells[:, 1].max()) + 1)
+    return Pattern(name, width, height, cells, rule)
+
+
+def _run(length: int, tag: str) -> str:
+    return f"{length}{tag}" if length > 1 else tag
+
+
+def iter_rle(pattern: Pattern, line_length: int = LINE_LENGTH) -> Iterator[str]:
+    """
+    Writes a pattern in the RLE format, yielding it line by line.
+
+    Parameters:
+    -----------
+        pattern: Pattern
+            The pattern to write.
+        line_length: int
+            The longest line of runs, not counting the line break (Default: 70).
+    """
+    if pattern.name:
+        yield f"#N {pattern.name}\n"
+    yield f"x = {pattern.width}, y = {pattern.height}, rule = {pattern.rule}\n"
+
+    line = ""
+    row = column = 0
+    for start_row, start, length in zip(*(a.tolist() for a in cell_runs(pattern.cells))):
+        tokens = []
+        if start_row > row:
+            tokens.append(_run(start_row - row, "$"))
+            row, column = start_row, 0
+        if start > column:
+            tokens.append(_run(start - column, "b"))
+        tokens.append(_run(length, "o"))
+        column = start + length
+
+        for token in tokens:
+            if len(line) + len(token) > line_length:
+                yield line + "\n"
+                line = ""
+            line += token
+    if len(line) + 1 > line_length:
+        yield line + "\n"
+        line = ""
+    yield line + "!\n"
+
+
+def write_rle(file: IO[str], pattern: Pattern) -> None:
+    """
+    Writes a pattern in the RLE format to a file, line by line.
+
+    Parameters:
+    -----------
+        file: IO[str]
+            The file to write to.
+        pattern: Pattern
+            The pattern to write.
+    """
+    file.writelines(iter_rle(pattern))
@@ -0,0 +1,155 @@
+"""
+Wire Protocol for Game of Life Application
+
+This module builds the payloads the `/life` endpoint sends to the client from the
+frames the game scheduler publishes. Besides the original payload with the full
+current and previous world grids, the client may send the last generation it
+knows and receive only the cells that changed since then. On mostly stable worlds
+this is orders of magnitude smaller than the full grids, both to serialize and to
+transfer. On busy worlds the client may ask for a binary snapshot instead, which
+packs every cell into a single bit. Every payload is serialized once and shared by
+all viewers through a `FrameCache`.
+
+Modules:
+--------
+- `protocol/delta.py`: Defines the builders of the full world, snapshot and delta
+    payloads.
+
+- `protocol/binary.py`: Defines the builder and decoder of the binary snapshot
+    payload.
+
+- `protocol/cache.py`: Defines the `FrameCache` of serialized payloads.
+
+Attributes:
+-----------
+MIMETYPE: str
+    The mimetype of binary payloads, `"application/octet-stream"`.
+FORMATS: Tuple[str, ...]
+    The wire formats `"world"`, `"snapshot"`, `"delta"` and `"binary"`.
+
+Classes:
+--------
+Encoded(NamedTuple):
+    A payload serialized for the wire, with its `body`, `mimetype` and `etag`.
+
+FrameCache:
+    A ring buffer of serialized payloads keyed by game ID, frame version, format
+    and the parameters of the format, such as the generation a delta starts at.
+    Besides the wire formats, it caches other encodings of frames like rendered
+    images. Every payload is serialized once, however many viewers request it,
+    and the oldest payload is overwritten when the buffer is full. Lookups never
+    lock.
+
+    Properties:
+    -----------
+        capacity: int
+            The number of payloads the cache holds.
+        hits: int
+            The number of payloads served from the cache.
+        misses: int
+            The number of payloads serialized.
+
+    Methods:
+    --------
+        __init__(capacity: int) -> None:
+            Initializes an empty cache.
+        payload(
+            game_id: str,
+            frame: Frame,
+            wire_format: str,
+            since: Optional[int] = None,
+        ) -> Encoded:
+            Returns a frame serialized in one of the `FORMATS`, serializing and
+            storing it first if it is not cached yet.
+        cached(key: Tuple[Hashable, ...], encode: Callable[[], Tuple[bytes, str]])
+        -> Encoded:
+            Returns the payload cached under a key, encoding and storing it first
+            if it is not cached yet. The entity tag is built from the key and a
+            random epoch of the cache, so that tags of another process never match.
+
+Functions:
+----------
+world_payload(frame: Frame) -> Dict[str, Any]:
+    Builds the original payload with `life_count`, `world` and `previous_world`
+    as nested lists of booleans.
+
+snapshot_payload(frame: Frame) -> Dict[str, Any]:
+    Builds a `"snapshot"` payload with `life_count`, `width`, `height`, the flat
+    indices `row * width + column` of all `alive` cells and of the cells that
+    `died` in the last generation.
+
+delta_payload(frame: Frame, since: int) -> Dict[str, Any]:
+    Builds a `"delta"` payload with `life_count`, `since` and the flat indices of
+    the cells `born` and `died` since the generation `since`. Falls back to a
+    snapshot payload if the frame no longer keeps the changes since then (see
+    `GameOfLife.CHANGES_LIMIT`).
+
+All JSON payloads also carry the `period` and `stabilized_at` of the cycle the
+game entered (`None` until one is detected) and whether the game `stopped`.
+
+binary_payload(frame: Frame, compress: bool = True) -> bytes:
+    Builds a binary snapshot: a 24 byte little-endian header (`b"GOLB"` magic,
+    version, flags, reserved, width, height and generation as `<4sBBHIIQ`)
+    followed by the bitmaps of the alive cells and of the cells that died in the
+    last generation, least significant bit first. If `compress` is set and it
+    helps, the bitmaps are zlib compressed and the `0x01` flag is set.
+
+decode_binary_payload(payload: bytes) -> Tuple[int, ndarray, ndarray]:
+    Decodes a binary snapshot into the generation and the `height x width`
+    arrays of the alive and died cells.
+
+encode_frame(frame: Frame, wire_format: str, since: Optional[int] = None) -> bytes:
+    Serializes a frame in one of the `FORMATS`, JSON without whitespace.
+
+Endpoint:
+---------
+The `/life` endpoints serve the game of the `game` argument, or else of the
+session. An unknown game gets `404 Not Found`; only opening the `GET /life` page
+creates a new default game, for a session without one.
+
+`POST /life?since=<generation>` returns a delta or snapshot payload of the last
+frame the scheduler published. Without `since`, the original payload is returned.
+With `format=binary`, or an `Accept` header preferring `application/octet-stream`,
+a binary snapshot is returned instead. With `steps=<n>`, the game first skips
+ahead by `n` generations, at most `max_steps` of the configuration unless it runs
+on the `"hashlife"` engine, which gives up with `400 Bad Request` after
+`hashlife_timeout` seconds instead. Open `/life?format=binary` to make the page use binary
+snapshots. Responses carry an `ETag`; a request whose `If-None-Match` matches
+it gets an empty `304 Not Modified` response instead.
+
+`GET /life/stream?since=<generation>` is a Server-Sent Events stream that pushes a
+delta since the last pushed generation whenever the scheduler publishes a frame
+(a snapshot first if `since` is missing). A slow client skips frames instead of
+queueing them. The stream ends with the last frame of a stopped game, and sends a
+keep-alive comment every second nothing is published. The page uses the stream
+unless binary snapshots are requested.
+
+Usage:
+------
+```python
+from game import GameOfLife
+from protocol import delta_payload
+
+game = GameOfLife()
+since = game.life_count
+game.form_new_generation()
+payload = delta_payload(game.frame, since)
+```
+"""
+
+from .cache import FORMATS, Encoded, FrameCache, encode_frame
+from .delta import delta_payload, world_payload, snapshot_payload
+from .binary import MIMETYPE, binary_payload, decode_binary_payload
+
+__all__ = [
+    "FORMATS",
+    "MIMETYPE",
+    "Encoded",
+    "FrameCache",
+    "binary_payload",
+    "decode_binary_payload",
+    "delta_payload",
+    "encode_frame",
+    "snapshot_payload",
+    "world_payload",
+]
@@ -0,0 +1,85 @@
+import zlib
+import struct
+from typing import Tuple
+
+import numpy as np
+import numpy.typing as npt
+
+from game import Frame
+
+MIMETYPE = "application/octet-stream"
+MAGIC = b"GOLB"
+VERSION = 1
+FLAG_ZLIB = 0x01
+
+# magic, version, flags, reserved, width, height, generation
+_HEADER = struct.Struct("<4sBBHIIQ")
+
+
+def binary_payload(frame: Frame, compress: bool = True) -> bytes:
+    """
+    Builds a binary snapshot of a frame of the game: a 24 byte little-endian header
+    followed by two bitmaps of `width * height` bits each, the alive cells and the
+    cells that died in the last generation. Cell `row * width + column` is bit
+    `i % 8` of byte `i // 8` of a bitmap. The bitmaps are zlib compressed if that
+    makes them smaller and `compress` is set, which is flagged in the header.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to describe.
+        compress: bool
+            Whether the bitmaps may be zlib compressed (Default: True).
+    """
+    bitmaps = np.zeros((2, frame.width * frame.height), dtype=np.uint8)
+    bitmaps[0, frame.alive] = 1
+    bitmaps[1, frame.died] = 1
+
+    body = np.packbits(bitmaps, axis=1, bitorder="little").tobytes()
+    flags = 0
+    if compress:
+        compressed = zlib.compress(body, 1)
+        if len(compressed) < len(body):
+            body, flags = compressed, flags | FLAG_ZLIB
+
+    header = _HEADER.pack(
+        MAGIC, VERSION, flags, 0, frame.width, frame.height, frame.generation
+    )
+    return header + body
+
+
+def decode_binary_payload(
+    payload: bytes,
+) -> Tuple[int, npt.NDArray[np.bool_], npt.NDArray[np.bool_]]:
+    """
+    Decodes a binary snapshot into the generation, the alive cells and the cells that
+    died in the last generation, both as `height x width` arrays. Raises
+    `ValueError` if the payload is not a binary snapshot of a known version.
+
+    Parameters:
+    -----------
+        payload: bytes
+            The payload built by `binary_payload()`.
+    """
+    if len(payload) < _HEADER.size:
+        raise ValueError("payload is shorter than the header")
+    magic, version, flags, _, width, height, generation = _HEADER.unpack_from(payload)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"unsupported payload: {magic!r} version {version}")
+
+    body = payload[_HEADER.size :]  # noqa: E203
+    if flags & FLAG_ZLIB:
+        body = zlib.decompress(body)
+
+    size = width * height
+    bitmap_size = (size + 7) // 8
+    if len(body) != 2 * bitmap_size:
+        raise ValueError("payload body does not match the world size")
+
+    bits = np.unpackbits(
+        np.frombuffer(body, dtype=np.uint8).reshape(2, bitmap_size),
+        axis=1,
+        count=size,
+        bitorder="little",
+    ).view(np.bool_)
+    return generation, bits[0].reshape(height, width), bits[1].reshape(height, width)
@@ -0,0 +1,214 @@
+import json
+import time
+import secrets
+from typing import Dict, List, Tuple, Callable, Hashable, Optional, NamedTuple
+from threading import Lock
+
+from core import metrics
+from game import Frame
+
+from .delta import delta_payload, world_payload, snapshot_payload
+from .binary import MIMETYPE, binary_payload
+
+FORMATS = ("world", "snapshot", "delta", "binary")
+
+Key = Tuple[Hashable, ...]
+
+
+class Encoded(NamedTuple):
+    """
+    A payload serialized for the wire.
+
+    Attributes:
+    -----------
+    body: bytes
+        The serialized payload.
+    mimetype: str
+        The mimetype of the payload.
+    etag: str
+        The entity tag of the payload, unique per cache, game, frame and format.
+    """
+
+    body: bytes
+    mimetype: str
+    etag: str
+
+
+def encode_frame(frame: Frame, wire_format: str, since: Optional[int] = None) -> bytes:
+    """
+    Serializes a frame in one of the `FORMATS`. The JSON formats are serialized
+    without whitespace.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to serialize.
+        wire_format: str
+            One of `"world"`, `"snapshot"`, `"delta"` and `"binary"`.
+        since: Optional[int]
+            The last generation the client knows, required by `"delta"`.
+    """
+    if wire_format == "binary":
+        return binary_payload(frame)
+    if wire_format == "world":
+        payload = world_payload(frame)
+    elif wire_format == "snapshot":
+        payload = snapshot_payload(frame)
+    elif wire_format == "delta" and since is not None:
+        payload = delta_payload(frame, since)
+    else:
+        raise ValueError(f"unknown wire format: {wire_format} (since {since})")
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+class FrameCache:
+    """
+    A ring buffer of serialized payloads keyed by game ID, frame version, format and
+    the parameters of the format, such as the generation a delta starts at. Besides
+    the wire formats, it caches other encodings of frames like rendered images
+    through `cached()`. Every payload is serialized once, however many viewers
+    request it, and the oldest payload is overwritten when the buffer is full.
+    Lookups never lock.
+
+    Attributes:
+    -----------
+    _slots: List[Optional[Tuple[Key, Encoded]]]
+        The ring buffer of cached payloads.
+    _next: int
+        The slot the next payload is stored in.
+    _index: Dict[Key, Encoded]
+        The cached payloads by key.
+    _lock: Lock
+        The lock held while a payload is stored.
+    _epoch: str
+        A random token that starts every entity tag, since frame versions start
+        over when the process restarts or games are restored from checkpoints.
+    _hits: int
+        The number of payloads served from the cache.
+    _misses: int
+        The number of payloads serialized.
+
+    Properties:
+    -----------
+        capacity: int
+            The number of payloads the cache holds.
+        hits: int
+            The number of payloads served from the cache.
+        misses: int
+            The number of payloads serialized.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        """
+        Initializes an empty cache.
+
+        Parameters:
+        -----------
+            capacity: int
+                The number of payloads the cache holds.
+        """
+        if capacity <= 0:
+            raise ValueError(f"cache capacity must be positive, got {capacity}")
+        self._slots: List[Optional[Tuple[Key, Encoded]]] = [None] * capacity
+        self._next = 0
+        self._index: Dict[Key, Encoded] = {}
+        self._lock = Lock()
+        self._epoch = secrets.token_urlsafe(6)
+        self._hits = 0
+        self._misses = 0
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    @property
+    def capacity(self) -> int:
+        """
+        The number of payloads the cache holds.
+        """
+        return len(self._slots)
+
+    @property
+    def hits(self) -> int:
+        """
+        The number of payloads served from the cache.
+        """
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """
+        The number of payloads serialized.
+        """
+        return self._misses
+
+    def payload(
+        self,
+        game_id: str,
+        frame: Frame,
+        wire_format: str,
+        since: Optional[int] = None,
+    ) -> Encoded:
+        """
+        Returns a frame serialized in one of the `FORMATS`, serializing and storing
+        it first if it is not cached yet.
+
+        Parameters:
+        -----------
+            game_id: str
+                The ID of the game the frame belongs to.
+            frame: Frame
+                The frame of the game to serialize.
+            wire_format: str
+                One of `"world"`, `"snapshot"`, `"delta"` and `"binary"`.
+            since: Optional[int]
+                The last generation the client knows, required by `"delta"`.
+        """
+        key: Key = (game_id, frame.version, wire_format)
+        if wire_format == "delta":
+            key += (since,)
+        mimetype = MIMETYPE if wire_format == "binary" else "application/json"
+        return self.cached(
+            key, lambda: (encode_frame(frame, wire_format, since), mimetype)
+        )
+
+    def cached(self, key: Key, encode: Callable[[], Tuple[bytes, str]]) -> Encoded:
+        """
+        Returns the payload cached under a key, encoding and storing it first if it
+        is not cached yet. The entity tag of the payload is built from the key and
+        the epoch of the cache, so that tags of another process never match.
+
+        Parameters:
+        -----------
+            key: Tuple[Hashable, ...]
+                The key of the payload, starting with the game ID, the frame version
+                and the kind of payload, such as a wire format, that labels the
+                time to encode it in the metrics.
+            encode: Callable[[], Tuple[bytes, str]]
+                Returns the payload and its mimetype.
+        """
+        encoded = self._index.get(key)
+        if encoded is not None:
+            self._hits += 1
+            return encoded
+
+        # Viewers racing for the same new payload may both encode it; only the
+        # first one is stored.
+        self._misses += 1
+        started = time.perf_counter()
+        encoded = Encoded(*encode(), "-".join(map(str, (self._epoch, *key))))
+        metrics.histogram(
+            "life_serialize_seconds",
+            "Time to encode a payload, by its kind.",
+            {"kind": str(key[2]) if len(key) > 2 else ""},
+        ).observe(time.perf_counter() - started)
+        with self._lock:
+            cached = self._index.get(key)
+            if cached is not None:
+                return cached
+            evicted = self._slots[self._next]
+            if evicted is not None:
+                del self._index[evicted[0]]
+            self._slots[self._next] = (key, encoded)
+            self._index[key] = encoded
+            self._next = (self._next + 1) % len(self._slots)
+        return encoded
@@ -0,0 +1,80 @@
+from typing import Any, Dict
+
+from game import Frame
+
+
+def _cycle(frame: Frame) -> Dict[str, Any]:
+    return {
+        "period": frame.period,
+        "stabilized_at": frame.stabilized_at,
+        "stopped": frame.stopped,
+    }
+
+
+def world_payload(frame: Frame) -> Dict[str, Any]:
+    """
+    Builds the original `/life` payload holding the full current and previous game
+    world grids as nested lists of booleans, and the cycle the game entered.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to describe.
+    """
+    return {
+        "life_count": frame.generation,
+        "world": frame.world,
+        "previous_world": frame.previous_world,
+        **_cycle(frame),
+    }
+
+
+def snapshot_payload(frame: Frame) -> Dict[str, Any]:
+    """
+    Builds a payload holding the whole current world as the flat indices
+    `row * width + column` of its alive cells, together with the cells that died
+    in the last generation.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to describe.
+    """
+    return {
+        "type": "snapshot",
+        "life_count": frame.generation,
+        "width": frame.width,
+        "height": frame.height,
+        "alive": frame.alive.tolist(),
+        "died": frame.died.tolist(),
+        **_cycle(frame),
+    }
+
+
+def delta_payload(frame: Frame, since: int) -> Dict[str, Any]:
+    """
+    Builds a payload holding only the cells that were born or died since the given
+    generation, as flat indices `row * width + column`. Falls back to a snapshot
+    payload if the changes since that generation are no longer known, e.g. when
+    the client is too far behind.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to describe.
+        since: int
+            The last generation (life count) the client knows.
+    """
+    changes = frame.changes_since(since)
+    if changes is None:
+        return snapshot_payload(frame)
+
+    born, died = changes
+    return {
+        "type": "delta",
+        "life_count": frame.generation,
+        "since": since,
+        "born": born.tolist(),
+        "died": died.tolist(),
+        **_cycle(frame),
+    }
@@ -0,0 +1,98 @@
+"""
+Image Rendering for Game of Life Application
+
+This module renders frames of a game into images, for thumbnails and exports of
+large boards. A frame is first turned into an image of palette indices with array
+operations only, every cell a square of `scale x scale` pixels in the colors of
+the page, and then encoded as an indexed PNG image or a GIF animation. Neither
+step loops over pixels in Python.
+
+Modules:
+--------
+- `render/image.py`: Defines the palette and the rendering of a frame into an
+    image of palette indices.
+
+- `render/png.py`: Defines the PNG encoder.
+
+- `render/gif.py`: Defines the GIF animation encoder.
+
+Attributes:
+-----------
+PALETTE: Sequence[Tuple[int, int, int]]
+    The RGB colors of dead, alive and just died cells.
+MAX_PIXELS: int
+    The largest number of pixels of a rendered image.
+MAX_ANIMATION_PIXELS: int
+    The largest number of pixels of all images of a rendered animation.
+PNG_MIMETYPE: str
+    The mimetype of PNG images, `"image/png"`.
+GIF_MIMETYPE: str
+    The mimetype of GIF animations, `"image/gif"`.
+
+Functions:
+----------
+frame_image(frame: Frame, scale: int = 1) -> ndarray:
+    Renders a frame into a `height * scale x width * scale` image of indices into
+    the `PALETTE`. Raises `ValueError` if the image would have more than
+    `MAX_PIXELS` pixels.
+
+encode_png(image: ndarray, palette: Sequence[Tuple[int, int, int]] = PALETTE)
+    -> bytes:
+    Encodes an image of palette indices as a 2-bit indexed PNG.
+
+render_png(frame: Frame, scale: int = 1) -> bytes:
+    Renders a frame as a PNG image.
+
+encode_gif(
+    images: Sequence[ndarray],
+    delay: float,
+    palette: Sequence[Tuple[int, int, int]] = PALETTE,
+) -> bytes:
+    Encodes images of palette indices as a looping GIF animation, showing every
+    image for `delay` seconds. The images are LZW encoded with fixed-width codes,
+    which trades compression for encoding whole images with array operations.
+
+render_gif(frames: Sequence[Frame], delay: float, scale: int = 1) -> bytes:
+    Renders frames as a looping GIF animation. Raises `ValueError` if all images
+    together would have more than `MAX_ANIMATION_PIXELS` pixels.
+
+Endpoint:
+---------
+`GET /life/frame.png?scale=<pixels>` renders the last frame of the game with every
+cell a square of `scale` pixels (Default: 4), and
+`GET /life/animation.gif?from=<generation>&to=<generation>&scale=<pixels>` renders
+the generations between `from` and `to` that the history of the game still keeps
+(see `GameOfLife.HISTORY_LIMIT`). `from` defaults to the oldest generation whose
+changes the last frame keeps. Rendered images are cached per frame and carry an
+`ETag`.
+
+Usage:
+------
+```python
+from game import GameOfLife
+from render import render_png
+
+game = GameOfLife(100, 100)
+with open("frame.png", "wb") as file:
+    file.write(render_png(game.frame, scale=4))
+```
+"""
+
+from .gif import MIMETYPE as GIF_MIMETYPE
+from .gif import encode_gif, render_gif
+from .png import MIMETYPE as PNG_MIMETYPE
+from .png import encode_png, render_png
+from .image import PALETTE, MAX_PIXELS, MAX_ANIMATION_PIXELS, frame_image
+
+__all__ = [
+    "GIF_MIMETYPE",
+    "MAX_PIXELS",
+    "MAX_ANIMATION_PIXELS",
+    "PALETTE",
+    "PNG_MIMETYPE",
+    "encode_gif",
+    "encode_png",
+    "frame_image",
+    "render_gif",
+    "render_png",
+]
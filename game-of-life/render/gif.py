@@ -0,0 +1,101 @@
+import struct
+from typing import List, Tuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from game import Frame
+
+from .image import PALETTE, MAX_ANIMATION_PIXELS, frame_image
+
+MIMETYPE = "image/gif"
+
+# With 3 bit literals, the codes are 4 bits wide. Clearing the code table before
+# it can outgrow 4 bits keeps every code 4 bits wide, so that the codes of a whole
+# image are built and packed at once instead of looking up pixel by pixel.
+_MIN_CODE_SIZE = 3
+_CLEAR = 1 << _MIN_CODE_SIZE
+_END = _CLEAR + 1
+_RUN = _CLEAR - 3
+
+
+def _lzw(pixels: npt.NDArray[np.uint8]) -> bytes:
+    runs = -(-len(pixels) // _RUN)
+    table = np.full((runs, _RUN + 1), 0xFF, dtype=np.uint8)
+    table[:, 0] = _CLEAR
+    table[:, 1:].flat[: len(pixels)] = pixels
+    codes = np.append(table[table != 0xFF], np.uint8(_END))
+    if len(codes) % 2:
+        codes = np.append(codes, np.uint8(0))
+
+    # Codes are packed least significant bits first, two to a byte.
+    data = codes[0::2] | (codes[1::2] << 4)
+
+    # The data is split into sub-blocks of at most 255 bytes, each after its size.
+    blocks = np.zeros((-(-len(data) // 255), 256), dtype=np.uint8)
+    blocks[:, 0] = 255
+    blocks[:, 1:].flat[: len(data)] = data
+    blocks[-1, 0] = len(data) - 255 * (len(blocks) - 1)
+    return bytes(blocks.ravel()[: len(data) + len(blocks)]) + b"\x00"
+
+
+def encode_gif(
+    images: Sequence[npt.NDArray[np.uint8]],
+    delay: float,
+    palette: Sequence[Tuple[int, int, int]] = PALETTE,
+) -> bytes:
+    """
+    Encodes images of palette indices as a looping GIF animation. The images are
+    LZW encoded with fixed-width codes, which trades compression for encoding
+    whole images with array operations.
+
+    Parameters:
+    -----------
+        images: Sequence[npt.NDArray[np.uint8]]
+            The `height x width` images of indices into the palette, all of the
+            same size.
+        delay: float
+            The time every image is shown, in seconds.
+        palette: Sequence[Tuple[int, int, int]]
+            At most four RGB colors (Default: `PALETTE`).
+    """
+    height, width = images[0].shape
+    colors = np.zeros((4, 3), dtype=np.uint8)
+    colors[: len(palette)] = palette
+    centiseconds = max(1, min(0xFFFF, round(delay * 100)))
+
+    parts: List[bytes] = [
+        b"GIF89a",
+        # Screen size and a global color table of 2^(1 + 1) colors.
+        struct.pack("<HHBBB", width, height, 0x91, 0, 0),
+        bytes(colors.ravel()),
+        # Loop forever.
+        b"\x21\xff\x0bNETSCAPE2.0\x03\x01\x00\x00\x00",
+    ]
+    for image in images:
+        parts.append(struct.pack("<BBBBHBB", 0x21, 0xF9, 4, 0, centiseconds, 0, 0))
+        parts.append(struct.pack("<BHHHHB", 0x2C, 0, 0, width, height, 0))
+        parts.append(bytes([_MIN_CODE_SIZE]) + _lzw(image.ravel()))
+    parts.append(b"\x3b")
+    return b"".join(parts)
+
+
+def render_gif(frames: Sequence[Frame], delay: float, scale: int = 1) -> bytes:
+    """
+    Renders frames as a looping GIF animation, with every cell a square of
+    `scale x scale` pixels. Raises `ValueError` if the images would be too large,
+    or all of them together would have more than `MAX_ANIMATION_PIXELS` pixels.
+
+    Parameters:
+    -----------
+        frames: Sequence[Frame]
+            The frames of the game to render, in order.
+        delay: float
+            The time every frame is shown, in seconds.
+        scale: int
+            The width and height of a cell in pixels (Default: 1).
+    """
+    pixels = sum(frame.width * frame.height for frame in frames) * scale * scale
+    if pixels > MAX_ANIMATION_PIXELS:
+        raise ValueError(f"animation of {len(frames)} frames at {scale}x is too large")
+    return encode_gif([frame_image(frame, scale) for frame in frames], delay)
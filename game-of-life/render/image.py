@@ -0,0 +1,49 @@
+from typing import Tuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from game import Frame
+
+# The colors of the page: dead, alive and just died cells, and the unused fourth.
+PALETTE: Sequence[Tuple[int, int, int]] = (
+    (0x7A, 0x7F, 0xE1),
+    (0x6C, 0xDB, 0x75),
+    (0xDD, 0x57, 0x57),
+    (0x00, 0x00, 0x00),
+)
+DEAD, ALIVE, DIED = 0, 1, 2
+
+MAX_PIXELS = 1 << 22
+MAX_ANIMATION_PIXELS = 1 << 26
+
+
+def frame_image(frame: Frame, scale: int = 1) -> npt.NDArray[np.uint8]:
+    """
+    Renders a frame into a `height * scale x width * scale` image of indices into
+    the `PALETTE`: `ALIVE` for alive cells, `DIED` for the cells that died in the
+    last generation and `DEAD` for all others. Every cell becomes a square of
+    `scale x scale` pixels. Raises `ValueError` if the image would have more than
+    `MAX_PIXELS` pixels.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to render.
+        scale: int
+            The width and height of a cell in pixels (Default: 1).
+    """
+    if scale < 1:
+        raise ValueError(f"scale must be positive, got {scale}")
+    if frame.width * frame.height * scale * scale > MAX_PIXELS:
+        raise ValueError(
+            f"image of {frame.width}x{frame.height} cells at {scale}x is too large"
+        )
+
+    cells = np.full(frame.width * frame.height, DEAD, dtype=np.uint8)
+    cells[frame.died] = DIED
+    cells[frame.alive] = ALIVE
+    image = cells.reshape(frame.height, frame.width)
+    if scale > 1:
+        image = image.repeat(scale, axis=0).repeat(scale, axis=1)
+    return image
@@ -0,0 +1,74 @@
+import zlib
+import struct
+from typing import Tuple, Sequence
+
+import numpy as np
+import numpy.typing as npt
+
+from game import Frame
+
+from .image import PALETTE, frame_image
+
+MIMETYPE = "image/png"
+
+_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+_BIT_DEPTH = 2
+
+
+def _chunk(tag: bytes, data: bytes) -> bytes:
+    return (
+        struct.pack(">I", len(data))
+        + tag
+        + data
+        + struct.pack(">I", zlib.crc32(tag + data))
+    )
+
+
+def encode_png(
+    image: npt.NDArray[np.uint8], palette: Sequence[Tuple[int, int, int]] = PALETTE
+) -> bytes:
+    """
+    Encodes an image of palette indices as a 2-bit indexed PNG. Four pixels are
+    packed into every byte at once and the rows are zlib compressed without
+    filtering.
+
+    Parameters:
+    -----------
+        image: npt.NDArray[np.uint8]
+            The `height x width` image of indices into the palette.
+        palette: Sequence[Tuple[int, int, int]]
+            At most four RGB colors (Default: `PALETTE`).
+    """
+    height, width = image.shape
+    per_byte = 8 // _BIT_DEPTH
+    padded = np.zeros((height, -(-width // per_byte) * per_byte), dtype=np.uint8)
+    padded[:, :width] = image
+
+    shifts = np.arange(8 - _BIT_DEPTH, -1, -_BIT_DEPTH, dtype=np.uint8)
+    packed = np.bitwise_or.reduce(padded.reshape(height, -1, per_byte) << shifts, axis=2)
+    # Every row starts with its filter type, 0 for none.
+    rows = np.hstack([np.zeros((height, 1), dtype=np.uint8), packed])
+
+    header = struct.pack(">IIBBBBB", width, height, _BIT_DEPTH, 3, 0, 0, 0)
+    return (
+        _SIGNATURE
+        + _chunk(b"IHDR", header)
+        + _chunk(b"PLTE", bytes(np.array(palette, dtype=np.uint8).ravel()))
+        + _chunk(b"IDAT", zlib.compress(rows.tobytes(), 6))
+        + _chunk(b"IEND", b"")
+    )
+
+
+def render_png(frame: Frame, scale: int = 1) -> bytes:
+    """
+    Renders a frame as a PNG image, with every cell a square of `scale x scale`
+    pixels. Raises `ValueError` if the image would be too large.
+
+    Parameters:
+    -----------
+        frame: Frame
+            The frame of the game to render.
+        scale: int
+            The width and height of a cell in pixels (Default: 1).
+    """
+    return encode_png(frame_image(frame, scale))
@@ -1,37 +1,254 @@
-function updateWorld(world, previousWorld) {
-    const gameTable = document.getElementById("game-table");
-    gameTable.innerHTML = '';
-
-    for (let i = 0; i < world.length; i++) {
-        const tr = document.createElement("tr");
-        for (let j = 0; j < world[i].length; j++) {
-            const cell = document.createElement('td');
-            cell.classList.add('cell');
-            if (world[i][j]) {
-                cell.classList.add('alive');
-            } else if (!world[i][j] && previousWorld[i][j]) {
-                cell.classList.add('dead');
+const CELL_SIZE = 20;
+const CELL_CLASSES = ['cell', 'cell alive', 'cell dead'];
+
+let states = null;
+let dying = [];
+let renderer = null;
+
+// The cells changed since the last paint, or all of them.
+let dirty = [];
+let marked = null;
+let repaintAll = false;
+let paintRequested = false;
+
+function tableRenderer(table) {
+    let cells = [];
+    return {
+        resize(width, height) {
+            table.innerHTML = '';
+            for (let i = 0; i < height; i++) {
+                const tr = document.createElement("tr");
+                for (let j = 0; j < width; j++) {
+                    const cell = document.createElement('td');
+                    cell.classList.add('cell');
+                    tr.appendChild(cell);
+                }
+                table.appendChild(tr);
+            }
+            cells = Array.from(table.querySelectorAll("td"));
+        },
+        paint(indices, cellStates) {
+            for (let k = 0; k < cellStates.length; k++) {
+                cells[indices === null ? k : indices[k]].className = CELL_CLASSES[cellStates[k]];
             }
-            tr.appendChild(cell);
+        },
+    };
+}
+
+function workerRenderer(canvas) {
+    // The canvas is painted by the worker; the main thread only sends it changes.
+    const offscreen = canvas.transferControlToOffscreen();
+    const worker = new Worker(workerUrl);
+    worker.postMessage({type: 'init', canvas: offscreen}, [offscreen]);
+    return {
+        resize(width, height, cellSize) {
+            worker.postMessage({type: 'resize', width, height, cellSize});
+        },
+        paint(indices, cellStates) {
+            const transfer = [cellStates.buffer];
+            if (indices !== null) transfer.push(indices.buffer);
+            worker.postMessage({type: 'paint', indices, states: cellStates}, transfer);
+        },
+    };
+}
+
+function createRenderer() {
+    const canvas = document.getElementById("game-canvas");
+    const table = document.getElementById("game-table");
+    if (canvas.getContext) {
+        if (canvas.transferControlToOffscreen && window.Worker) {
+            return workerRenderer(canvas);
         }
-        gameTable.appendChild(tr)
+        return new CanvasPainter(canvas);
+    }
+    canvas.hidden = true;
+    table.hidden = false;
+    return tableRenderer(table);
+}
+
+function resizeWorld(width, height) {
+    if (renderer === null) renderer = createRenderer();
+    const available = document.documentElement.clientWidth - 60;
+    const cellSize = Math.max(1, Math.min(CELL_SIZE, Math.floor(available / width)));
+    renderer.resize(width, height, cellSize);
+
+    states = new Uint8Array(width * height);
+    marked = new Uint8Array(width * height);
+    dirty = [];
+    dying = [];
+    repaintAll = true;
+}
+
+function markDirty(i) {
+    if (repaintAll || marked[i]) return;
+    marked[i] = 1;
+    dirty.push(i);
+    // Beyond a quarter of the cells, repainting all of them is cheaper, and the
+    // changes of a hidden page no longer pile up.
+    if (dirty.length > states.length / 4) repaintAll = true;
+}
+
+function paint() {
+    paintRequested = false;
+    if (repaintAll) {
+        renderer.paint(null, states.slice());
+        marked = new Uint8Array(states.length);
+    } else {
+        const indices = Int32Array.from(dirty);
+        const cellStates = new Uint8Array(indices.length);
+        for (let k = 0; k < indices.length; k++) {
+            cellStates[k] = states[indices[k]];
+            marked[indices[k]] = 0;
+        }
+        renderer.paint(indices, cellStates);
+    }
+    dirty = [];
+    repaintAll = false;
+}
+
+function applyChanges(born, gone, died) {
+    for (const i of dying) {
+        if (states[i] === DIED) {
+            states[i] = DEAD;
+            markDirty(i);
+        }
+    }
+    for (const i of born) {
+        states[i] = ALIVE;
+        markDirty(i);
+    }
+    for (const i of gone) {
+        states[i] = DEAD;
+        markDirty(i);
+    }
+    for (const i of died) {
+        states[i] = DIED;
+        markDirty(i);
+    }
+    dying = died;
+
+    // Payloads arriving between two display frames are painted together.
+    if (!paintRequested) {
+        paintRequested = true;
+        requestAnimationFrame(paint);
+    }
+}
+
+function applySnapshot(data) {
+    if (states === null || states.length !== data.width * data.height) {
+        resizeWorld(data.width, data.height);
+    }
+
+    // Only touch the cells that differ from the shown ones.
+    const next = new Uint8Array(states.length);
+    for (const i of data.alive) {
+        next[i] = 1;
     }
+    const born = [];
+    const gone = [];
+    for (let i = 0; i < next.length; i++) {
+        if (next[i] && states[i] !== ALIVE) born.push(i);
+        else if (!next[i] && states[i] === ALIVE) gone.push(i);
+    }
+    applyChanges(born, gone, data.died);
+}
+
+function lifeUrl(path, params) {
+    return `${apiUrl}${path}?` + new URLSearchParams({game: gameId, ...params});
 }
 
+const BINARY_MAGIC = 0x424c4f47; // "GOLB"
+const BINARY_HEADER_SIZE = 24;
+const FLAG_ZLIB = 0x01;
+
+async function decodeBinary(buffer) {
+    const view = new DataView(buffer);
+    if (view.getUint32(0, true) !== BINARY_MAGIC || view.getUint8(4) !== 1) {
+        throw new Error("Unsupported binary payload");
+    }
+    const flags = view.getUint8(5);
+    const width = view.getUint32(8, true);
+    const height = view.getUint32(12, true);
+    const lifeCount = Number(view.getBigUint64(16, true));
+
+    let body = buffer.slice(BINARY_HEADER_SIZE);
+    if (flags & FLAG_ZLIB) {
+        const stream = new Blob([body]).stream().pipeThrough(new DecompressionStream('deflate'));
+        body = await new Response(stream).arrayBuffer();
+    }
+
+    const size = width * height;
+    const bytes = Math.ceil(size / 8);
+    const bits = new Uint8Array(body);
+    const alive = [];
+    const died = [];
+    for (let i = 0; i < size; i++) {
+        const shift = i & 7;
+        if ((bits[i >> 3] >> shift) & 1) alive.push(i);
+        if ((bits[bytes + (i >> 3)] >> shift) & 1) died.push(i);
+    }
+    return {type: "snapshot", life_count: lifeCount, width, height, alive, died};
+}
+
+let etag = null;
+
 async function fetchGameState() {
     try {
-        const response = await fetch(apiUrl, {
-            method: 'POST',
-            headers: {
-                'Content-Type': 'application/json'
-            }
-        });
+        const binary = wireFormat === "binary";
+        // An unknown generation gets a snapshot of the whole world.
+        const url = lifeUrl('', binary ? {format: "binary"} : {since: lifeCount ?? -1});
+        const headers = {'Content-Type': 'application/json'};
+        if (etag !== null) headers['If-None-Match'] = etag;
+        const response = await fetch(url, {method: 'POST', headers});
+        // The frame did not change since the last request.
+        if (response.status === 304) return;
         if (!response.ok) throw new Error("API request error");
-        const data = await response.json();
+        etag = response.headers.get('ETag');
+        const data = binary ? await decodeBinary(await response.arrayBuffer()) : await response.json();
 
-        updateWorld(data.world, data.previous_world);
-        document.getElementById("counter").innerText = data.life_count;
+        applyPayload(data);
     } catch (error) {
         console.error("Error: ", error);
     }
 }
+
+function applyPayload(data) {
+    if (data.type === "delta") {
+        // A late response to an overlapping request is already outdated.
+        if (data.since !== lifeCount) return;
+        applyChanges(data.born, data.died, data.died);
+    } else {
+        applySnapshot(data);
+    }
+    lifeCount = data.life_count;
+    const counter = document.getElementById("counter");
+    counter.innerText = data.period ? `${lifeCount} (period ${data.period} since ${data.stabilized_at})` : lifeCount;
+    // A stopped game forms no more generations, so there is nothing to wait for.
+    if (data.stopped) stopGame();
+}
+
+let pollTimer = null;
+let eventSource = null;
+
+function stopGame() {
+    clearInterval(pollTimer);
+    if (eventSource !== null) eventSource.close();
+    pollTimer = eventSource = null;
+}
+
+function startGame(velocity) {
+    if (wireFormat === "binary" || !window.EventSource) {
+        pollTimer = setInterval(fetchGameState, 1000 * velocity);
+        return;
+    }
+
+    // The server pushes every generation, starting with a snapshot; reconnect with
+    // the last known one.
+    const source = new EventSource(lifeUrl('/stream', lifeCount === null ? {} : {since: lifeCount}));
+    eventSource = source;
+    source.onmessage = (event) => applyPayload(JSON.parse(event.data));
+    source.onerror = () => {
+        source.close();
+        if (eventSource === source) setTimeout(() => startGame(velocity), 1000);
+    };
+}
@@ -0,0 +1,58 @@
+// Paints the world on a canvas, in the worker or on the main thread.
+
+const DEAD = 0;
+const ALIVE = 1;
+const DIED = 2;
+
+// The colors of the table cells: the background, alive cells and the just died
+// cells, blended with the background.
+const COLORS = ['#7a7fe1', '#6cdb75', '#b5678e'];
+
+class CanvasPainter {
+    constructor(canvas) {
+        this.canvas = canvas;
+        this.context = canvas.getContext('2d');
+        this.width = 0;
+        this.height = 0;
+        this.cellSize = 1;
+    }
+
+    resize(width, height, cellSize) {
+        this.width = width;
+        this.height = height;
+        this.cellSize = cellSize;
+        this.canvas.width = width * cellSize;
+        this.canvas.height = height * cellSize;
+    }
+
+    // Paints the given cells only, or every cell if `indices` is null. Cells are
+    // grouped by color so that every color is filled with a single path.
+    paint(indices, states) {
+        const context = this.context;
+        const size = this.cellSize;
+        // Large cells keep the 1px gap of the table between them.
+        const inset = size >= 4 ? 1 : 0;
+        const count = indices === null ? states.length : indices.length;
+
+        if (indices === null) {
+            context.fillStyle = COLORS[DEAD];
+            context.fillRect(0, 0, this.canvas.width, this.canvas.height);
+        }
+        for (let color = indices === null ? ALIVE : DEAD; color < COLORS.length; color++) {
+            context.beginPath();
+            for (let k = 0; k < count; k++) {
+                if (states[k] !== color) continue;
+                const i = indices === null ? k : indices[k];
+                const x = (i % this.width) * size;
+                const y = Math.floor(i / this.width) * size;
+                if (color === DEAD) {
+                    context.rect(x, y, size, size);
+                } else {
+                    context.rect(x + inset, y + inset, size - inset, size - inset);
+                }
+            }
+            context.fillStyle = COLORS[color];
+            context.fill();
+        }
+    }
+}
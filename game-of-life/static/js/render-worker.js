@@ -0,0 +1,16 @@
+// Paints the world on an OffscreenCanvas off the main thread.
+
+importScripts('painter.js');
+
+let painter = null;
+
+onmessage = (event) => {
+    const message = event.data;
+    if (message.type === 'init') {
+        painter = new CanvasPainter(message.canvas);
+    } else if (message.type === 'resize') {
+        painter.resize(message.width, message.height, message.cellSize);
+    } else if (message.type === 'paint') {
+        painter.paint(message.indices, message.states);
+    }
+};
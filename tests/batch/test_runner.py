@@ -0,0 +1,70 @@
+import io
+import csv
+import json
+
+import pytest
+
+from batch import Simulation, simulate, run_batch, write_results
+
+
+class TestRunner:
+    def test_stops_once_stable(self) -> None:
+        """
+        Test that a run that stops once stable ends with the population it would
+        have after all generations.
+        """
+        stable = Simulation(24, 24, 0.3, 500)
+        full = stable._replace(until_stable=False)
+        for run in range(4):
+            early, late = simulate(stable, 7, run), simulate(full, 7, run)
+            assert late.generations == 500, "Full runs form all generations"
+            assert early.population == late.population, f"Mismatch of run {run}"
+            assert early.period == late.period
+            if early.period is not None:
+                assert early.stabilized_at == late.stabilized_at
+                assert early.generations < 500, "Stable runs should stop early"
+
+    def test_reproducible_in_a_pool(self) -> None:
+        """
+        Test that a pool of workers yields every run once, with the statistics the
+        run has in this process.
+        """
+        simulation = Simulation(16, 16, 0.4, 100, engine="bitpacked")
+        local = [result._replace(seconds=0) for result in run_batch(simulation, 6, 3)]
+        pooled = [
+            result._replace(seconds=0)
+            for result in run_batch(simulation, 6, 3, workers=2)
+        ]
+        assert sorted(pooled) == local
+        assert [result.run for result in local] == list(range(6))
+
+    def test_invalid_batches(self) -> None:
+        """
+        Test that negative runs and the parallel engine in a pool are rejected.
+        """
+        with pytest.raises(ValueError):
+            list(run_batch(Simulation(8, 8, 0.5, 10), -1))
+        with pytest.raises(ValueError):
+            list(run_batch(Simulation(8, 8, 0.5, 10, engine="parallel"), 2, workers=2))
+
+
+class TestOutput:
+    def test_formats(self) -> None:
+        """
+        Test that results are written as CSV rows with a header, empty for unknown
+        cycles, or as JSON lines.
+        """
+        simulation = Simulation(8, 8, 0.0, 10)
+        output = io.StringIO()
+        assert write_results(run_batch(simulation, 2), output, "csv") == 2
+        rows = list(csv.DictReader(io.StringIO(output.getvalue())))
+        assert [row["run"] for row in rows] == ["0", "1"]
+        assert rows[0]["population"] == "0" and rows[0]["period"] == "1"
+
+        output = io.StringIO()
+        assert write_results(run_batch(simulation, 2), output, "jsonl") == 2
+        lines = [json.loads(line) for line in output.getvalue().splitlines()]
+        assert lines[1]["run"] == 1 and lines[1]["stabilized_at"] == 0
+
+        with pytest.raises(ValueError):
+            write_results([], io.StringIO(), "xml")
@@ -0,0 +1,58 @@
+import pytest
+
+from core.metrics import Metrics
+
+
+class TestMetrics:
+    def test_render(self) -> None:
+        """
+        Test that metrics are rendered in the Prometheus text format, grouped by
+        name, with cumulative histogram buckets.
+        """
+        metrics = Metrics()
+        histogram = metrics.histogram("ticks", "Tick time.", {"kind": "a"}, [0.1, 1])
+        for value in (0.05, 0.1, 0.5, 3):
+            histogram.observe(value)
+        metrics.histogram("ticks", "Ignored.", {"kind": 'b"'}, [0.1, 1]).observe(1)
+        metrics.counter("hits_total", "Hits.").inc(2)
+        metrics.gauge("games", "Games.", function=lambda: 7)
+
+        assert metrics.render().splitlines() == [
+            "# HELP games Games.",
+            "# TYPE games gauge",
+            "games 7",
+            "# HELP hits_total Hits.",
+            "# TYPE hits_total counter",
+            "hits_total 2",
+            "# HELP ticks Tick time.",
+            "# TYPE ticks histogram",
+            'ticks_bucket{kind="a",le="0.1"} 2',
+            'ticks_bucket{kind="a",le="1"} 3',
+            'ticks_bucket{kind="a",le="+Inf"} 4',
+            'ticks_sum{kind="a"} 3.65',
+            'ticks_count{kind="a"} 4',
+            'ticks_bucket{kind="b\\"",le="0.1"} 0',
+            'ticks_bucket{kind="b\\"",le="1"} 1',
+            'ticks_bucket{kind="b\\"",le="+Inf"} 1',
+            'ticks_sum{kind="b\\""} 1',
+            'ticks_count{kind="b\\""} 1',
+        ]
+
+    def test_created_once(self) -> None:
+        """
+        Test that a metric is created once by name and labels, and that a name
+        keeps its kind.
+        """
+        metrics = Metrics()
+        counter = metrics.counter("hits_total", "Hits.")
+        assert metrics.counter("hits_total", "Hits.") is counter
+        assert metrics.counter("hits_total", "Hits.", {"kind": "a"}) is not counter
+        with pytest.raises(ValueError):
+            metrics.gauge("hits_total", "Hits.")
+        with pytest.raises(ValueError):
+            counter.inc(-1)
+
+        gauge = metrics.gauge("games", "Games.")
+        gauge.inc(3)
+        gauge.inc(-1)
+        assert gauge.value == 2, "Gauges should go up and down"
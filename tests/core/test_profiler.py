@@ -0,0 +1,52 @@
+import os
+import pstats
+from pathlib import Path
+
+from core import Profiler
+from game import GameOfLife
+
+
+class TestProfiler:
+    def test_profiles_calls(self, tmp_path: Path) -> None:
+        """
+        Test that the given number of calls is profiled and written as statistics
+        and collapsed stacks once, and that later calls are not profiled.
+        """
+        game = GameOfLife(32, 32, engine="numpy")
+        profiler = Profiler("generation", 3, str(tmp_path))
+        assert profiler.active
+
+        for _ in range(2):
+            profiler.run(game.form_new_generation)
+        assert os.listdir(tmp_path) == [], "Nothing is written before the last call"
+        assert profiler.run(lambda value: value * 2, 21) == 42
+        assert not profiler.active and profiler.remaining == 0
+        assert profiler.run(lambda: 7) == 7, "Inactive profilers only call"
+
+        files = sorted(os.listdir(tmp_path))
+        assert [os.path.splitext(name)[1] for name in files] == [".collapsed", ".pstats"]
+        stats = pstats.Stats(os.path.join(tmp_path, files[1]))
+        names = {name for _, _, name in stats.stats}
+        assert "form_new_generation" in names and "step" in names
+
+        with open(os.path.join(tmp_path, files[0]), encoding="utf-8") as file:
+            stacks = [line.rsplit(" ", 1) for line in file.read().splitlines()]
+        assert stacks and all(int(time) > 0 for _, time in stacks)
+        assert any(
+            stack.startswith("form_new_generation") and ";step (" in stack
+            for stack, _ in stacks
+        ), "Stacks should lead from the profiled call to the engine"
+
+    def test_nested_calls(self, tmp_path: Path) -> None:
+        """
+        Test that calls within a profiled call are recorded by the outer profile
+        only, and that a disabled profiler profiles nothing.
+        """
+        outer = Profiler("outer", 1, str(tmp_path))
+        inner = Profiler("inner", 1, str(tmp_path))
+        assert outer.run(inner.run, sum, [1, 2]) == 3
+        assert inner.active, "Nested calls should not be profiled"
+        assert all(name.startswith("outer") for name in os.listdir(tmp_path))
+
+        disabled = Profiler("disabled", 0, str(tmp_path))
+        assert not disabled.active and disabled.run(len, "abc") == 3
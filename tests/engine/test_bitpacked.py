@@ -0,0 +1,73 @@
+import sys
+import random
+
+import numpy as np
+import pytest
+
+from engine import PythonEngine, BitPackedEngine
+
+
+class TestBitPackedEngine:
+    @pytest.mark.parametrize("width, height", [(20, 20), (1, 4), (2, 7), (65, 9)])
+    def test_parity_with_python_engine(self, width: int, height: int) -> None:
+        """
+        Test that the bit-packed engine forms the same generations as the reference
+        pure Python engine, including the toroidal wrap-around at the edges.
+        """
+        rng = random.Random(width * 1000 + height)
+        world = [[rng.random() < 0.4 for _ in range(width)] for _ in range(height)]
+
+        reference = PythonEngine(width, height)
+        engine = BitPackedEngine(width, height)
+        reference.load(world)
+        engine.load(world)
+
+        for generation in range(30):
+            reference.step()
+            engine.step()
+            assert engine.world == reference.world, f"Mismatch at {generation=}"
+            assert (
+                engine.previous_world == reference.previous_world
+            ), f"Previous world mismatch at {generation=}"
+            assert engine.population == reference.population
+
+    def test_packed_rows_are_compact(self) -> None:
+        """
+        Test that a packed row takes far less memory than a list of booleans.
+        """
+        width = 4096
+        engine = BitPackedEngine(width, 1)
+        engine.load([[True] * width])
+
+        packed = sys.getsizeof(engine._rows[0])
+        unpacked = sys.getsizeof(engine.world[0])
+        assert packed * 32 < unpacked, "Packed row should be much smaller than a list"
+
+    def test_load_array(self) -> None:
+        """
+        Test that loading an array packs the same rows as loading a grid.
+        """
+        rng = random.Random(7)
+        world = [[rng.random() < 0.4 for _ in range(70)] for _ in range(5)]
+
+        reference = BitPackedEngine(70, 5)
+        engine = BitPackedEngine(70, 5)
+        reference.load(world)
+        engine.load_array(np.array(world, dtype=np.uint8))
+        assert engine._rows == reference._rows, "Packed rows should match"
+
+        with pytest.raises(ValueError):
+            engine.load_array(np.zeros((70, 5), dtype=np.uint8))
+
+    def test_cells(self) -> None:
+        """
+        Test that the cells array matches the unpacked world.
+        """
+        rng = random.Random(11)
+        world = [[rng.random() < 0.4 for _ in range(13)] for _ in range(6)]
+        engine = BitPackedEngine(13, 6)
+        engine.load(world)
+
+        cells = engine.cells
+        assert cells.tolist() == [[int(cell) for cell in row] for row in world]
+        assert not cells.flags.writeable, "Cells should be read-only"
@@ -0,0 +1,111 @@
+import random
+
+import numpy as np
+import pytest
+
+from engine import NumpyEngine, HashLifeEngine
+
+
+class TestHashLifeEngine:
+    @pytest.mark.parametrize(
+        "width, height, generations",
+        [(16, 16, 1000), (20, 13, 200), (5, 3, 100), (8, 8, 65), (12, 12, 30)],
+    )
+    def test_parity_with_numpy_engine(
+        self, width: int, height: int, generations: int
+    ) -> None:
+        """
+        Test that advancing through the quadtree forms the same world as stepping
+        one generation at a time, including the toroidal wrap-around at the edges.
+        """
+        rng = random.Random(width * 1000 + height)
+        world = [[rng.random() < 0.4 for _ in range(width)] for _ in range(height)]
+
+        reference = NumpyEngine(width, height)
+        engine = HashLifeEngine(width, height)
+        reference.load(world)
+        engine.load(world)
+
+        reference.advance(generations)
+        engine.advance(generations)
+
+        assert engine.world == reference.world, "Advanced world should match"
+        assert (
+            engine.previous_world == reference.previous_world
+        ), "Previous world should be the generation before the last one"
+
+    def test_glider_after_million_generations(self) -> None:
+        """
+        Test that a glider on a 10x10 world is back at its initial position after
+        a multiple of 40 generations.
+        """
+        world = [[False] * 10 for _ in range(10)]
+        for i, j in ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2)):
+            world[i][j] = True
+
+        engine = HashLifeEngine(10, 10)
+        engine.load(world)
+        engine.advance(1_000_000)
+
+        assert engine.world == world, "Glider should return to its initial position"
+
+    def test_bounded_node_cache(self) -> None:
+        """
+        Test that the node cache never outgrows its bound and that evicted nodes
+        do not change the result.
+        """
+        rng = random.Random(1)
+        world = [[rng.random() < 0.4 for _ in range(24)] for _ in range(24)]
+
+        reference = NumpyEngine(24, 24)
+        engine = HashLifeEngine(24, 24, max_nodes=2000)
+        reference.load(world)
+        engine.load(world)
+
+        reference.advance(300)
+        engine.advance(300)
+
+        assert engine.cached_nodes <= 2000, "Node cache should stay bounded"
+        assert engine.evictions > 0, "Node cache should have been evicted"
+        assert engine.world == reference.world, "Eviction should not change the result"
+
+    def test_node_cache_bounded_while_jumping(self) -> None:
+        """
+        Test that a jump that does not fit into the node cache is split instead of
+        growing the cache past its bound.
+        """
+        rng = random.Random(2)
+        world = [[rng.random() < 0.4 for _ in range(24)] for _ in range(24)]
+
+        reference = NumpyEngine(24, 24)
+        engine = HashLifeEngine(24, 24, max_nodes=300)
+        peak = 0
+        join = engine._join
+
+        def counting_join(*children: object) -> object:
+            nonlocal peak
+            peak = max(peak, engine.cached_nodes)
+            return join(*children)  # type: ignore[arg-type]
+
+        engine._join = counting_join  # type: ignore[assignment, method-assign]
+        reference.load(world)
+        engine.load(world)
+        reference.advance(300)
+        engine.advance(300)
+
+        assert peak <= 300, "Node cache should stay bounded within a jump"
+        assert engine.world == reference.world, "Split jumps should match"
+
+    def test_timeout(self) -> None:
+        """
+        Test that advancing gives up after its timeout and leaves the world as it
+        was.
+        """
+        world = np.random.default_rng(3).random((100, 100)) < 0.4
+        engine = HashLifeEngine(100, 100)
+        engine.load(world.tolist())
+
+        with pytest.raises(TimeoutError):
+            engine.advance(1 << 20, timeout=1e-6)
+        assert np.array_equal(engine.cells, world), "World should be unchanged"
+        assert np.array_equal(engine.previous_cells, world)
@@ -0,0 +1,45 @@
+import random
+
+import pytest
+
+from engine import NumpyEngine, ParallelEngine
+
+
+class TestParallelEngine:
+    @pytest.mark.parametrize(
+        "width, height, workers",
+        [(30, 17, 4), (5, 3, 8), (64, 64, 3), (1, 1, 2)],
+    )
+    def test_parity_with_numpy_engine(
+        self, width: int, height: int, workers: int
+    ) -> None:
+        """
+        Test that forming the world in stripes, including the halo rows that wrap
+        around the edges, forms the same generations as the NumPy engine.
+        """
+        rng = random.Random(width * 1000 + height)
+        world = [[rng.random() < 0.35 for _ in range(width)] for _ in range(height)]
+
+        reference = NumpyEngine(width, height)
+        engine = ParallelEngine(width, height, workers)
+        reference.load(world)
+        engine.load(world)
+
+        try:
+            for generation in range(30):
+                reference.step()
+                engine.step()
+                assert engine.world == reference.world, f"Mismatch at {generation=}"
+                assert (
+                    engine.previous_world == reference.previous_world
+                ), f"Previous world mismatch at {generation=}"
+        finally:
+            engine.close()
+
+    def test_workers(self) -> None:
+        """
+        Test that there are never more workers than rows.
+        """
+        engine = ParallelEngine(10, 3, workers=8)
+        assert engine.workers == 3, "Workers should be limited to the number of rows"
+        engine.close()
@@ -0,0 +1,51 @@
+import pytest
+
+from engine import PythonEngine
+
+
+class TestPythonEngine:
+    def test_get_near(self) -> None:
+        """
+        Test that get_near method counts the neighbors correctly.
+        """
+        test_world = [
+            [True, False, False],
+            [False, True, True],
+            [False, False, True],
+        ]
+
+        # Test neighbor counting for the cell at (1, 1)
+        neighbors = PythonEngine.get_near(test_world, (1, 1))
+        assert neighbors == 3, "Should have 3 neighbors for cell (1, 1)"
+
+        # Test neighbor counting for the cell at (0, 0)
+        neighbors = PythonEngine.get_near(test_world, (0, 0))
+        assert neighbors == 3, "Should have 3 neighbors for cell (0, 0)"
+
+    def test_load(self) -> None:
+        """
+        Test that loading a world replaces both the current and previous world.
+        """
+        engine = PythonEngine(3, 2)
+        world = [[True, False, True], [False, True, False]]
+        engine.load(world)
+
+        assert engine.world == world, "Loaded world should become the current world"
+        assert engine.previous_world == world, "Previous world should match loaded"
+        assert engine.population == 3, "Population should count alive cells"
+
+        with pytest.raises(ValueError):
+            engine.load([[True, False]])
+
+    def test_double_buffering(self) -> None:
+        """
+        Test that stepping writes the new generation into the previous world's lists
+        instead of allocating new ones.
+        """
+        engine = PythonEngine(4, 4)
+        engine.randomize()
+        world, previous_world = engine.world, engine.previous_world
+
+        engine.step()
+        assert engine.previous_world is world, "The world should become previous"
+        assert engine.world is previous_world, "The previous lists should be reused"
@@ -0,0 +1,132 @@
+import random
+
+import numpy as np
+import pytest
+
+from engine import CONWAY, ENGINES, Rule, PythonEngine, parse_rule, create_engine
+
+
+class TestRule:
+    def test_parse(self) -> None:
+        """
+        Test that a rule is compiled into a table indexed by state and neighbor
+        count, and that every notation is compiled once.
+        """
+        rule = parse_rule("b36/s23")
+        assert rule.birth == {3, 6} and rule.survival == {2, 3}
+        assert rule.table.tolist() == [
+            [0, 0, 0, 1, 0, 0, 1, 0, 0],
+            [0, 0, 1, 1, 0, 0, 0, 0, 0],
+        ]
+        assert not rule.table.flags.writeable, "The table should be read-only"
+        assert rule.bits == (1 << 3) | (1 << 6) | (1 << 11) | (1 << 12)
+        assert rule.notation == "B36/S23" and rule.neighborhood == "moore"
+        assert parse_rule("B36/S23") is parse_rule("B36/S23"), "Compiled once"
+        assert parse_rule("B3/S23") == CONWAY
+
+    @pytest.mark.parametrize(
+        "notation, neighborhood, expected, offsets",
+        [
+            ("B2/S3V", None, "B2/S3V", ((-1, 0), (0, -1), (0, 1), (1, 0))),
+            ("B2/S3", "vonneumann", "B2/S3V", ((-1, 0), (0, -1), (0, 1), (1, 0))),
+            ("B2/S34H", None, "B2/S34H", ((-1, -1), (-1, 0), (0, -1), (0, 1))),
+            ("B1/S/N111000000", None, "B1/S/N111000000", ((-1, -1), (-1, 0), (-1, 1))),
+            ("B1/S", "001000100", "B1/S/N001000100", ((-1, 1), (1, -1))),
+        ],
+    )
+    def test_neighborhoods(
+        self, notation: str, neighborhood: str, expected: str, offsets: tuple
+    ) -> None:
+        """
+        Test that the neighborhood is read from the suffix of the notation or given
+        separately, and written back in the notation.
+        """
+        rule = parse_rule(notation, neighborhood)
+        assert rule.notation == expected
+        assert rule.offsets[: len(offsets)] == offsets
+        assert rule.table.shape == (2, len(rule.offsets) + 1)
+
+    @pytest.mark.parametrize(
+        "notation, neighborhood",
+        [
+            ("23/3", None),
+            ("B9/S23", None),
+            ("B3/S23X", None),
+            ("B0/S23", None),
+            ("B5/S23V", None),
+            ("B1/S1", "111111111"),
+            ("B1/S1", "000000000"),
+            ("B1/S1", "11110111"),
+        ],
+    )
+    def test_invalid(self, notation: str, neighborhood: str) -> None:
+        """
+        Test that malformed and unsupported rules are rejected.
+        """
+        with pytest.raises(ValueError):
+            parse_rule(notation, neighborhood)
+
+    def test_equality(self) -> None:
+        """
+        Test that rules compare and hash by their counts and neighborhood.
+        """
+        assert Rule([3], [2, 3]) == CONWAY and hash(Rule([3], [2, 3])) == hash(CONWAY)
+        assert Rule([3], [2, 3], "010101010") != CONWAY
+        assert str(Rule([3, 6], [2, 3])) == "B36/S23"
+
+    @pytest.mark.parametrize(
+        "notation",
+        ["B36/S23", "B3678/S34678", "B2/S3V", "B2/S34H", "B12/S0/N100000011"],
+    )
+    def test_parity_across_engines(self, notation: str) -> None:
+        """
+        Test that every engine forms the same generations as the reference pure
+        Python engine under the same compiled rule, including asymmetric custom
+        neighborhoods and survival without neighbors.
+        """
+        rule = parse_rule(notation)
+        rng = random.Random(notation)
+        world = [[rng.random() < 0.4 for _ in range(23)] for _ in range(17)]
+
+        reference = PythonEngine(23, 17, rule)
+        reference.load(world)
+        reference.advance(12)
+        for name in ENGINES:
+            if name == "unbounded":
+                continue
+            engine = create_engine(name, 23, 17, rule)
+            assert engine.rule is rule, "Engines should share the compiled rule"
+            engine.load(world)
+            engine.advance(12)
+            assert engine.world == reference.world, f"Mismatch of the {name} engine"
+            engine.close()
+
+    def test_hashlife_jump(self) -> None:
+        """
+        Test that the HashLife engine jumps by powers of two under other rules.
+        """
+        rule = parse_rule("B36/S23")
+        cells = (np.random.default_rng(36).random((30, 30)) < 0.3).astype(np.uint8)
+        reference = create_engine("numpy", 30, 30, rule)
+        engine = create_engine("hashlife", 30, 30, rule)
+        reference.load_array(cells)
+        engine.load_array(cells)
+        reference.advance(300)
+        engine.advance(300)
+        assert np.array_equal(engine.cells, reference.cells)
+
+    def test_highlife_replicator(self) -> None:
+        """
+        Test that the HighLife replicator copies itself, which it does not under
+        Conway's rule.
+        """
+        replicator = [(0, 2), (0, 3), (0, 4), (1, 1), (1, 4), (2, 0), (2, 4)]
+        replicator += [(3, 0), (3, 3), (4, 0), (4, 1), (4, 2)]
+        populations = {}
+        for notation in ("B3/S23", "B36/S23"):
+            engine = create_engine("numpy", 64, 64, parse_rule(notation))
+            engine.load_cells((30 + i, 30 + j) for i, j in replicator)
+            engine.advance(12)
+            populations[notation] = engine.population
+        assert populations["B36/S23"] == 24, "HighLife should make two replicators"
+        assert populations["B3/S23"] != 24
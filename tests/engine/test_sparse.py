@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from engine import PythonEngine, SparseEngine, UnboundedSparseEngine
+
+GLIDER = ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2))
+
+
+class TestSparseEngine:
+    @pytest.mark.parametrize("width, height", [(20, 20), (37, 11), (1, 5), (3, 3)])
+    def test_parity_with_python_engine(self, width: int, height: int) -> None:
+        """
+        Test that the sparse engine forms the same generations as the reference
+        pure Python engine, including the toroidal wrap-around at the edges.
+        """
+        rng = random.Random(width * 1000 + height)
+        world = [[rng.random() < 0.4 for _ in range(width)] for _ in range(height)]
+
+        reference = PythonEngine(width, height)
+        engine = SparseEngine(width, height)
+        reference.load(world)
+        engine.load(world)
+
+        for generation in range(30):
+            reference.step()
+            engine.step()
+            assert engine.world == reference.world, f"Mismatch at {generation=}"
+            assert (
+                engine.previous_world == reference.previous_world
+            ), f"Previous world mismatch at {generation=}"
+            assert engine.population == reference.population
+
+    def test_huge_world(self) -> None:
+        """
+        Test that a 100,000 x 100,000 world only costs its alive cells.
+        """
+        engine = SparseEngine(100_000, 100_000)
+        engine.randomize()
+        assert 0 < engine.population <= SparseEngine.SOUP_SIZE**2
+
+        engine.load_cells((99_998 + i, 99_998 + j) for i, j in GLIDER)
+        engine.advance(400)
+        assert engine.population == 5, "Glider should keep its five cells"
+        assert sorted(engine.live_cells) == sorted(
+            ((98 + i) % 100_000, (98 + j) % 100_000) for i, j in GLIDER
+        ), "Glider should have wrapped around the edges"
+
+    def test_changes(self) -> None:
+        """
+        Test that the born and died cells match those of the reference engine.
+        """
+        rng = random.Random(7)
+        world = [[rng.random() < 0.3 for _ in range(19)] for _ in range(13)]
+
+        reference = PythonEngine(19, 13)
+        engine = SparseEngine(19, 13)
+        reference.load(world)
+        engine.load(world)
+
+        for generation in range(10):
+            reference.step()
+            engine.step()
+            for actual, expected in zip(engine.changes(), reference.changes()):
+                assert actual.tolist() == expected.tolist(), f"Mismatch at {generation=}"
+
+
+class TestUnboundedSparseEngine:
+    def test_glider_leaves_the_window(self) -> None:
+        """
+        Test that a glider keeps flying on the plane instead of wrapping around.
+        """
+        engine = UnboundedSparseEngine(8, 8)
+        engine.load_cells(GLIDER)
+        engine.advance(40)
+
+        assert engine.population == 5, "Glider should keep its five cells"
+        assert not any(map(any, engine.world)), "Glider should have left the window"
+        assert sorted(engine.live_cells) == sorted((i + 10, j + 10) for i, j in GLIDER)
+
+    def test_no_wrap_around(self) -> None:
+        """
+        Test that cells on opposite edges of the window are not neighbors.
+        """
+        engine = UnboundedSparseEngine(4, 4)
+        engine.load_cells([(0, 0), (0, 3), (3, 0)])
+        engine.step()
+
+        assert engine.population == 0, "Isolated cells should die on the plane"
@@ -0,0 +1,69 @@
+import random
+
+import pytest
+
+from engine import NumpyEngine, TiledEngine
+
+
+class TestTiledEngine:
+    @pytest.mark.parametrize(
+        "width, height, tile_size",
+        [(20, 20, 4), (37, 11, 8), (5, 3, 16), (40, 40, 16), (7, 9, 2)],
+    )
+    def test_parity_with_python_engine(
+        self, width: int, height: int, tile_size: int
+    ) -> None:
+        """
+        Test that recomputing only the active tiles forms the same generations as
+        the NumPy engine.
+        """
+        rng = random.Random(width * 1000 + height)
+        world = [[rng.random() < 0.3 for _ in range(width)] for _ in range(height)]
+
+        reference = NumpyEngine(width, height)
+        engine = TiledEngine(width, height, tile_size)
+        reference.load(world)
+        engine.load(world)
+
+        for generation in range(60):
+            reference.step()
+            engine.step()
+            assert engine.world == reference.world, f"Mismatch at {generation=}"
+            assert (
+                engine.previous_world == reference.previous_world
+            ), f"Previous world mismatch at {generation=}"
+
+    def test_stable_tiles_are_skipped(self) -> None:
+        """
+        Test that still lifes and period-2 oscillators stop being recomputed, while
+        the neighborhood of a moving glider stays active.
+        """
+        world = [[False] * 64 for _ in range(64)]
+        for i, j in ((1, 1), (1, 2), (2, 1), (2, 2)):  # block
+            world[i][j] = True
+        for j in (20, 21, 22):  # blinker
+            world[20][j] = True
+
+        engine = TiledEngine(64, 64, tile_size=8)
+        reference = NumpyEngine(64, 64)
+        engine.load(world)
+        reference.load(world)
+        assert engine.active_ratio == 1.0, "All tiles should be active after load"
+
+        engine.advance(3)
+        reference.advance(3)
+        assert engine.active_tiles == 0, "Block and blinker should not be recomputed"
+        assert engine.world == reference.world, "Blinker should keep oscillating"
+
+        engine.step()
+        reference.step()
+        assert engine.world == reference.world, "Blinker should keep oscillating"
+
+        for i, j in ((9, 10), (10, 11), (11, 9), (11, 10), (11, 11)):  # glider
+            world[i][j] = True
+        engine.load(world)
+        reference.load(world)
+        engine.advance(10)
+        reference.advance(10)
+        assert 0 < engine.active_ratio <= 0.25, "Only the glider should stay active"
+        assert engine.world == reference.world, "Glider should keep moving"
@@ -0,0 +1,109 @@
+import random
+
+import numpy as np
+import pytest
+
+from engine import CONWAY, NumpyEngine, PythonEngine
+
+
+class TestNumpyEngine:
+    @pytest.mark.parametrize("width, height", [(20, 20), (37, 11), (1, 5), (3, 3)])
+    def test_parity_with_python_engine(self, width: int, height: int) -> None:
+        """
+        Test that the NumPy engine forms the same generations as the reference
+        pure Python engine, including the toroidal wrap-around at the edges.
+        """
+        rng = random.Random(width * 1000 + height)
+        world = [[rng.random() < 0.4 for _ in range(width)] for _ in range(height)]
+
+        reference = PythonEngine(width, height)
+        engine = NumpyEngine(width, height)
+        reference.load(world)
+        engine.load(world)
+
+        for generation in range(30):
+            reference.step()
+            engine.step()
+            assert engine.world == reference.world, f"Mismatch at {generation=}"
+            assert (
+                engine.previous_world == reference.previous_world
+            ), f"Previous world mismatch at {generation=}"
+            assert engine.population == reference.population
+
+    def test_neighbors(self) -> None:
+        """
+        Test that the neighbors of every cell are counted like the reference engine
+        counts them, including across the edges.
+        """
+        test_world = [
+            [True, False, False],
+            [False, True, True],
+            [False, False, True],
+        ]
+        engine = NumpyEngine(3, 3)
+        engine.load(test_world)
+        neighbors = engine.neighbors()
+
+        assert neighbors[1, 1] == 3, "Should have 3 neighbors for cell (1, 1)"
+        assert neighbors[0, 0] == 3, "Should have 3 neighbors for cell (0, 0)"
+        for i in range(3):
+            for j in range(3):
+                assert neighbors[i, j] == PythonEngine.get_near(test_world, (i, j))
+
+    def test_chunked_rule(self) -> None:
+        """
+        Test that large worlds are formed a chunk of rows at a time with a small
+        scratch buffer, alike the neighbor counts looked up in the rule's table.
+        """
+        cells = (np.random.default_rng(5).random((3000, 300)) < 0.4).astype(np.uint8)
+        engine = NumpyEngine(300, 3000)
+        engine.load_array(cells)
+        index = cells * 9 + engine.neighbors()
+        engine.step()
+
+        assert np.array_equal(engine.cells, CONWAY.table.ravel()[index])
+        assert engine.nbytes < 6 * 300 * 3000, "Scratch buffers should stay small"
+
+    def test_world_is_list(self) -> None:
+        """
+        Test that the world is exposed as nested lists of booleans.
+        """
+        engine = NumpyEngine(2, 2)
+        engine.load([[True, False], [False, True]])
+
+        assert engine.world == [[True, False], [False, True]]
+        assert type(engine.world[0][0]) is bool, "Cells should be plain booleans"
+
+    def test_glider_wraps_around(self) -> None:
+        """
+        Test that a glider crosses the edges and returns to its initial position
+        after four generations per cell of the world size.
+        """
+        world = [[False] * 6 for _ in range(6)]
+        for i, j in ((0, 1), (1, 2), (2, 0), (2, 1), (2, 2)):
+            world[i][j] = True
+
+        engine = NumpyEngine(6, 6)
+        engine.load(world)
+        engine.advance(24)
+
+        assert engine.world == world, "Glider should return to its initial position"
+
+    def test_double_buffering(self) -> None:
+        """
+        Test that stepping swaps two preallocated buffers and exposes them as
+        read-only views.
+        """
+        engine = NumpyEngine(8, 8)
+        engine.randomize()
+        buffers = {id(engine.cells.base), id(engine.previous_cells.base)}
+
+        for _ in range(3):
+            engine.step()
+            assert {
+                id(engine.cells.base),
+                id(engine.previous_cells.base),
+            } == buffers, "Stepping should reuse the same two buffers"
+
+        with pytest.raises(ValueError):
+            engine.previous_cells[0, 0] = 1
@@ -0,0 +1,160 @@
+import os
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from game import (
+    Scheduler,
+    GameOfLife,
+    GameRegistry,
+    restore_games,
+    load_checkpoint,
+    save_checkpoint,
+)
+
+
+class TestCheckpoint:
+    @pytest.mark.parametrize("engine", ["numpy", "sparse", "bitpacked"])
+    def test_round_trip(self, tmp_path: Path, engine: str) -> None:
+        """
+        Test that a restored game has the world, generation, velocity and engine of
+        the checkpointed one and goes on forming the same generations.
+        """
+        game = GameOfLife(37, 11, velocity=0.25, engine=engine)
+        for _ in range(3):
+            game.form_new_generation()
+        path = os.path.join(tmp_path, "game.ckpt")
+        save_checkpoint(game, path)
+        assert os.path.getsize(path) == 64 + (37 * 11 + 7) // 8, "Header and bitmap"
+
+        restored = load_checkpoint(path)
+        assert restored.world == game.world, "World should be restored"
+        assert restored.life_count == game.life_count == 3
+        assert restored.velocity == 0.25, "Velocity should be restored"
+        assert restored.engine.name == engine, "Engine should be restored"
+        assert np.array_equal(restored.frame.alive, game.frame.alive)
+
+        game.form_new_generation()
+        restored.form_new_generation()
+        assert restored.world == game.world, "Restored game should go on alike"
+
+    def test_auto_stop(self, tmp_path: Path) -> None:
+        """
+        Test that a restored game stops once stable if the checkpointed one did.
+        """
+        path = os.path.join(tmp_path, "game.ckpt")
+        save_checkpoint(GameOfLife(8, 8, auto_stop=True), path)
+        assert load_checkpoint(path).auto_stop, "Auto-stop should be restored"
+        save_checkpoint(GameOfLife(8, 8), path)
+        assert not load_checkpoint(path).auto_stop
+
+    @pytest.mark.parametrize("rule", ["B36/S23", "B2/S3V", "B12/S0/N100000011"])
+    def test_rule(self, tmp_path: Path, rule: str) -> None:
+        """
+        Test that a restored game follows the rule of the checkpointed one.
+        """
+        game = GameOfLife(16, 16, rule=rule)
+        path = os.path.join(tmp_path, "game.ckpt")
+        save_checkpoint(game, path)
+
+        restored = load_checkpoint(path)
+        assert restored.rule is game.rule, "The compiled rule should be shared"
+        game.form_new_generation()
+        restored.form_new_generation()
+        assert restored.world == game.world, "Restored game should go on alike"
+
+    def test_unbounded(self, tmp_path: Path) -> None:
+        """
+        Test that the alive cells of an unbounded world outside the world grid are
+        restored too.
+        """
+        game = GameOfLife(8, 8, engine="unbounded")
+        game.load_cells([(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)])
+        for _ in range(30):
+            game.form_new_generation()
+        path = os.path.join(tmp_path, "game.ckpt")
+        save_checkpoint(game, path)
+        assert os.path.getsize(path) == 64 + 8 + 5 * 16, "Cells outside the window"
+
+        restored = load_checkpoint(path)
+        assert sorted(restored.engine.live_cells) == sorted(game.engine.live_cells)
+        assert restored.life_count == 30 and restored.world == game.world
+        for _ in range(10):
+            game.form_new_generation()
+            restored.form_new_generation()
+        assert sorted(restored.engine.live_cells) == sorted(game.engine.live_cells)
+
+    def test_cycle_window(self, tmp_path: Path) -> None:
+        """
+        Test that restored games look for cycles in the given window.
+        """
+        path = os.path.join(tmp_path, "game.ckpt")
+        game = GameOfLife(8, 8)
+        game.load_cells([(3, 2), (3, 3), (3, 4)])
+        save_checkpoint(game, path)
+
+        for window, period in [(1, None), (2, 2)]:
+            restored = load_checkpoint(path, cycle_window=window)
+            for _ in range(2):
+                restored.form_new_generation()
+            assert restored.frame.period == period, f"Window of {window}"
+
+    def test_invalid_files(self, tmp_path: Path) -> None:
+        """
+        Test that files that are not checkpoints are rejected.
+        """
+        path = os.path.join(tmp_path, "game.ckpt")
+        save_checkpoint(GameOfLife(8, 8), path)
+        with open(path, "rb") as file:
+            data = file.read()
+
+        for broken in [b"", b"GIF89a" + data[6:], data[:-1]]:
+            with open(path, "wb") as file:
+                file.write(broken)
+            with pytest.raises(ValueError):
+                load_checkpoint(path)
+
+    def test_scheduler_checkpoints(self, tmp_path: Path) -> None:
+        """
+        Test that the scheduler checkpoints changed games only, removes the
+        checkpoints of games that left the registry, and that the games are
+        restored under their IDs.
+        """
+        directory = os.path.join(tmp_path, "checkpoints")
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        kept = registry.add(GameOfLife(8, 8))
+        removed = registry.add(GameOfLife(8, 8))
+        scheduler = Scheduler(registry, checkpoints=directory)
+
+        assert scheduler.checkpoint() == 2, "New games should be checkpointed"
+        assert scheduler.checkpoint() == 0, "Unchanged games should be skipped"
+        assert sorted(os.listdir(directory)) == sorted(
+            [f"{kept}.ckpt", f"{removed}.ckpt"]
+        )
+
+        game = registry.get(kept)
+        assert game is not None
+        game.form_new_generation()
+        registry.remove(removed)
+        assert scheduler.checkpoint() == 1, "Changed games should be checkpointed"
+        assert os.listdir(directory) == [f"{kept}.ckpt"], "Stale checkpoint is kept"
+
+        restored = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        assert restore_games(restored, directory) == [kept]
+        game_restored = restored.get(kept)
+        assert game_restored is not None and game_restored.world == game.world
+        assert game_restored.life_count == 1, "Generation should be restored"
+
+    def test_restore_skips_broken_files(self, tmp_path: Path) -> None:
+        """
+        Test that broken checkpoints are skipped and a missing directory restores
+        nothing.
+        """
+        save_checkpoint(GameOfLife(8, 8), os.path.join(tmp_path, "good.ckpt"))
+        with open(os.path.join(tmp_path, "bad.ckpt"), "wb") as file:
+            file.write(b"not a checkpoint")
+
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        assert restore_games(registry, str(tmp_path)) == ["good"]
+        assert restore_games(registry, os.path.join(tmp_path, "missing")) == []
@@ -0,0 +1,89 @@
+import numpy as np
+
+from game import GameOfLife, CycleDetector, zobrist_hash
+
+BLINKER = [(3, 2), (3, 3), (3, 4)]
+BLOCK = [(1, 1), (1, 2), (2, 1), (2, 2)]
+GLIDER = [(0, 1), (1, 2), (2, 0), (2, 1), (2, 2)]
+
+
+class TestCycles:
+    def test_incremental_hash(self) -> None:
+        """
+        Test that updating the hash with the changed cells gives the hash of the
+        whole generation.
+        """
+        game = GameOfLife(16, 16)
+        value = zobrist_hash(game.frame.alive)
+        for _ in range(5):
+            game.form_new_generation()
+            born, died = game.frame.changes[-1]
+            value ^= zobrist_hash(born) ^ zobrist_hash(died)
+            assert value == zobrist_hash(game.frame.alive), "Hashes should match"
+        assert zobrist_hash(np.empty(0, dtype=np.int64)) == 0
+
+    def test_oscillator_and_still_life(self) -> None:
+        """
+        Test that the period and first generation of a cycle are detected.
+        """
+        game = GameOfLife(8, 8)
+        game.load_cells(BLINKER)
+        for _ in range(3):
+            game.form_new_generation()
+        assert (game.period, game.stabilized_at) == (2, 0), "Blinker has period 2"
+        assert game.frame.period == 2 and not game.frame.stopped
+
+        game.load_cells(BLOCK)
+        assert game.period is None, "A new world should restart the detection"
+        game.form_new_generation()
+        assert (game.period, game.stabilized_at) == (1, 3), "Block is a still life"
+
+    def test_unbounded(self) -> None:
+        """
+        Test that a glider that left the window of an unbounded world is not taken
+        for a still life, since the cells outside the window are hashed too.
+        """
+        game = GameOfLife(8, 8, engine="unbounded", auto_stop=True)
+        game.load_cells(GLIDER)
+        for _ in range(40):
+            game.form_new_generation()
+        assert not len(game.frame.alive), "The glider should have left the window"
+        assert game.frame.period is None and not game.stopped, "No cycle expected"
+
+        game.load_cells(BLOCK)
+        game.form_new_generation()
+        assert game.frame.period == 1, "Still lifes should still be detected"
+
+    def test_window(self) -> None:
+        """
+        Test that cycles longer than the window are not detected.
+        """
+        one, two = np.array([1], dtype=np.int64), np.array([2], dtype=np.int64)
+        for window, period in [(1, None), (2, 2)]:
+            detector = CycleDetector(window)
+            detector.start(one, 0)
+            assert detector.update(two, one, 1) is None
+            assert detector.update(one, two, 2) == period, f"Window of {window}"
+
+        detector.clear()
+        assert not detector.tracking and detector.period is None
+        assert detector.update(two, one, 3) is None, "Cleared detectors do nothing"
+
+    def test_auto_stop(self) -> None:
+        """
+        Test that a stopped game forms no generations at its velocity until the
+        world is replaced, while explicit steps still form them.
+        """
+        game = GameOfLife(8, 8, velocity=0.1, auto_stop=True)
+        game.load_cells(BLOCK)
+        game.catch_up(now=0.0)
+        assert game.catch_up(now=0.15) == 1 and game.stopped, "Block should stop"
+        assert game.frame.stopped, "The frame should report the stop"
+        assert game.catch_up(now=10.0) == 0, "A stopped game forms nothing"
+        assert game.next_due is None, "A stopped game is never due"
+
+        game.form_new_generation()
+        assert game.life_count == 2, "Explicit steps still form generations"
+
+        game.load_cells(BLINKER)
+        assert not game.stopped and game.catch_up(now=10.25) == 1, "Restarted"
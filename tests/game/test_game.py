@@ -1,4 +1,6 @@
-import pytest  # noqa: F401
+import threading
+
+import pytest
 
 from game import GameOfLife
 
@@ -34,7 +36,7 @@ class TestGameOfLife:
         game = GameOfLife(4, 4)
 
         # Set up a simple world with known state
-        game._GameOfLife__world = [  # type: ignore[attr-defined]
+        game.world = [
             [False, True, False, True],
             [True, True, True, False],
             [False, True, False, False],
@@ -58,38 +60,18 @@ class TestGameOfLife:
         print(game.world)
         assert game.world == expected_next_world, "The world did not update correctly"
 
-    def test_get_near(self) -> None:
-        """
-        Test that __get_near method counts the neighbors correctly.
-        """
-        game = GameOfLife(3, 3)
-        test_world = [
-            [True, False, False],
-            [False, True, True],
-            [False, False, True],
-        ]
-
-        # Test neighbor counting for the cell at (1, 1)
-        neighbors = game._GameOfLife__get_near(  # type: ignore[attr-defined]
-            test_world,
-            (1, 1),
-        )
-        assert neighbors == 3, "Should have 3 neighbors for cell (1, 1)"
-
-        # Test neighbor counting for the cell at (0, 0)
-        neighbors = game._GameOfLife__get_near(  # type: ignore[attr-defined]
-            test_world,
-            (0, 0),
-        )
-        assert neighbors == 3, "Should have 3 neighbors for cell (0, 0)"
-
-    def test_singleton_behavior(self) -> None:
+    def test_independent_games(self) -> None:
         """
-        Test that multiple instances of GameOfLife return the same object.
+        Test that multiple instances of GameOfLife are independent games.
         """
         game1 = GameOfLife()
-        game2 = GameOfLife()
-        assert game1 is game2, "GameOfLife should be a singleton"
+        game2 = GameOfLife(30, 10)
+        assert game1 is not game2, "GameOfLife should not be a singleton"
+
+        game1.form_new_generation()
+        assert game1.life_count == 1
+        assert game2.life_count == 0, "Other games should not advance"
+        assert len(game1.world) == 20, "Other games should keep their size"
 
     def test_previous_world(self) -> None:
         """
@@ -101,10 +83,210 @@ class TestGameOfLife:
             [True, False],
             [False, True],
         ]
-        game._GameOfLife__world = initial_world  # type: ignore[attr-defined]
+        game.world = initial_world
         game.form_new_generation()  # Advance to the next generation
 
         # The previous world should hold the initial state
         assert (
             game.previous_world == initial_world
         ), "Previous world should match the initial state"
+
+    def test_engine_selection(self) -> None:
+        """
+        Test that the engine forming new generations can be selected by name.
+        """
+        game = GameOfLife(4, 4, engine="python")
+        assert game.engine.name == "python", "Selected engine should be used"
+
+        with pytest.raises(ValueError):
+            GameOfLife(4, 4, engine="unknown")
+
+    def test_advance(self) -> None:
+        """
+        Test that advance skips the given number of generations in a single call.
+        """
+        game = GameOfLife(16, 16, engine="hashlife")
+        reference = GameOfLife(16, 16, engine="numpy")
+        reference.world = game.world
+
+        game.advance(1000)
+        for _ in range(1000):
+            reference.form_new_generation()
+
+        assert game.life_count == 1000, "Life count should include skipped generations"
+        assert game.world == reference.world, "The world did not advance correctly"
+
+        with pytest.raises(ValueError):
+            game.advance(-1)
+
+    def test_simulate(self) -> None:
+        """
+        Test that simulate forms every generation, publishing a frame for every
+        `CHANGES_LIMIT` of them, and stops a stable game at the world of the last
+        generation.
+        """
+        game = GameOfLife(16, 16)
+        reference = GameOfLife(16, 16)
+        reference.world = game.world
+        versions = game.frame.version
+
+        assert game.simulate(100) == 100
+        for _ in range(100):
+            reference.form_new_generation()
+        assert game.world == reference.world, "Every generation should be formed"
+        assert game.frame.version == versions + 2, "Frames are published in batches"
+
+        blinker = GameOfLife(8, 8)
+        blinker.load_cells([(3, 2), (3, 3), (3, 4)])
+        assert blinker.simulate(1001, until_stable=True) == 3, "Stops in its cycle"
+        assert blinker.period == 2 and blinker.frame.alive.tolist() == [19, 27, 35]
+        with pytest.raises(ValueError):
+            game.simulate(-1)
+
+    def test_huge_sparse_world(self) -> None:
+        """
+        Test that a huge world with a sparse engine is cheap to create and step.
+        """
+        game = GameOfLife(100_000, 100_000, engine="sparse")
+        population = game.engine.population
+        assert 0 < population <= 128 * 128, "Only a small soup should be seeded"
+
+        game.advance(10)
+        assert game.life_count == 10, "Life count should include skipped generations"
+
+    def test_changes_since(self) -> None:
+        """
+        Test that the changes since an earlier generation turn that generation's
+        world into the current one, and that unknown generations return None.
+        """
+        game = GameOfLife(12, 12)
+        since = game.life_count
+        initial = [cell for row in game.world for cell in row]
+        for _ in range(5):
+            game.form_new_generation()
+
+        changes = game.changes_since(since)
+        assert changes is not None, "Recent changes should be known"
+        born, died = changes
+        for i in born.tolist():
+            assert not initial[i], "Born cells should have been dead"
+            initial[i] = True
+        for i in died.tolist():
+            assert initial[i], "Died cells should have been alive"
+            initial[i] = False
+        assert initial == [cell for row in game.world for cell in row]
+
+        assert game.changes_since(game.life_count + 1) is None
+        for _ in range(GameOfLife.CHANGES_LIMIT):
+            game.form_new_generation()
+        assert game.changes_since(since) is None, "Old changes should be dropped"
+
+    def test_frame(self) -> None:
+        """
+        Test that a frame is a snapshot of the game that later generations do not
+        change.
+        """
+        game = GameOfLife(9, 7)
+        game.form_new_generation()
+        world, previous_world = game.world, game.previous_world
+
+        frame = game.frame
+        game.form_new_generation()
+        assert frame.generation == 1, "Frame should keep its generation"
+        assert frame.world == world, "Frame should keep its world"
+        assert frame.previous_world == previous_world
+        assert frame.changes_since(0) is not None, "Frame should keep its changes"
+        assert not frame.cells.flags.writeable, "Frame cells should be read-only"
+        assert game.frame.version > frame.version, "New frames get new versions"
+
+    def test_rewind(self) -> None:
+        """
+        Test that a frame rewinds to the frames of the generations it keeps the
+        changes of.
+        """
+        game = GameOfLife(10, 10)
+        frames = [game.frame]
+        for _ in range(4):
+            game.form_new_generation()
+            frames.append(game.frame)
+
+        frame = frames[-1]
+        for earlier in frames[:-1]:
+            rewound = frame.rewind(earlier.generation)
+            assert rewound is not None, "Kept generations should be rebuilt"
+            assert rewound.generation == earlier.generation
+            assert rewound.world == earlier.world, "Rewound world should match"
+            assert rewound.previous_world == earlier.previous_world
+        assert frame.rewind(frame.generation + 1) is None
+        assert frames[0].rewind(-1) is None, "Unknown generations return None"
+
+    def test_concurrent_readers(self) -> None:
+        """
+        Test that readers never see a half-formed generation while another thread
+        forms generations.
+        """
+        game = GameOfLife(5, 5, engine="python")
+        world = [[False] * 5 for _ in range(5)]
+        world[2][1:4] = [True, True, True]  # blinker
+        game.world = world
+        horizontal = [2 * 5 + 1, 2 * 5 + 2, 2 * 5 + 3]
+        vertical = [1 * 5 + 2, 2 * 5 + 2, 3 * 5 + 2]
+
+        stop = threading.Event()
+
+        def writer() -> None:
+            while not stop.is_set():
+                game.form_new_generation()
+
+        thread = threading.Thread(target=writer)
+        thread.start()
+        try:
+            for _ in range(2000):
+                frame = game.frame
+                expected = vertical if frame.generation % 2 else horizontal
+                assert frame.alive.tolist() == expected, "Frame should not be torn"
+        finally:
+            stop.set()
+            thread.join()
+
+    def test_catch_up(self) -> None:
+        """
+        Test that catching up forms the generations due at the game's velocity,
+        including the ones a late caller missed, and drops the backlog of a game
+        that cannot keep up.
+        """
+        game = GameOfLife(8, 8, velocity=0.5)
+        assert game.catch_up(now=100.0) == 0, "The first call should start the clock"
+        assert game.catch_up(now=100.4) == 0, "No generation should be due yet"
+        assert game.catch_up(now=101.6) == 3, "Missed generations should be formed"
+        assert game.catch_up(now=101.9) == 0, "Generations should not be formed twice"
+        assert game.life_count == 3
+
+        assert game.catch_up(now=200.0) == GameOfLife.CHANGES_LIMIT
+        assert game.catch_up(now=200.5) == 1, "The clock should restart after a backlog"
+
+    def test_snapshot_and_rewind(self) -> None:
+        """
+        Test that earlier generations are read from the history without changing
+        the game, and that rewinding goes on from an earlier generation.
+        """
+        game = GameOfLife(12, 12)
+        worlds = [game.world]
+        for _ in range(6):
+            game.form_new_generation()
+            worlds.append(game.world)
+
+        snapshot = game.snapshot(2)
+        assert snapshot is not None and snapshot.world == worlds[2]
+        assert snapshot.previous_world == worlds[1], "Snapshot keeps its changes"
+        assert game.life_count == 6, "Snapshots should not change the game"
+
+        assert game.rewind(3), "Kept generations can be rewound to"
+        assert game.life_count == 3 and game.world == worlds[3]
+        assert game.snapshot(4) is None, "Later generations should be forgotten"
+        game.form_new_generation()
+        assert game.world == worlds[4], "The game should go on from the rewind"
+        assert not game.rewind(10), "Unknown generations cannot be rewound to"
+
+        game.generate_world()
+        assert game.snapshot(2) is None, "A new world should restart the history"
@@ -0,0 +1,103 @@
+import numpy as np
+
+from game import History, GameOfLife
+
+
+class TestHistory:
+    def test_rebuilds_every_generation(self) -> None:
+        """
+        Test that every kept generation is rebuilt from keyframes and deltas, with
+        the cells born and died in it.
+        """
+        game = GameOfLife(16, 16)
+        history = History(16, 16, keyframe_interval=4)
+        history.record(game.frame)
+        frames = [game.frame]
+        for _ in range(20):
+            game.form_new_generation()
+            history.record(game.frame)
+            frames.append(game.frame)
+
+        assert (history.oldest, history.newest) == (0, 20)
+        for expected in frames:
+            frame = history.frame(expected.generation)
+            assert frame is not None, f"Generation {expected.generation} is kept"
+            assert np.array_equal(frame.alive, expected.alive), "Alive cells differ"
+            if expected.generation > 0:
+                assert frame.previous_world == expected.previous_world
+        assert history.frame(21) is None, "Future generations are unknown"
+
+    def test_coalesced_frames(self) -> None:
+        """
+        Test that a frame publishing several generations at once records all of
+        them.
+        """
+        game = GameOfLife(16, 16, velocity=0.1)
+        history = History(16, 16)
+        history.record(game.frame)
+        game.catch_up(now=0.0)
+        game.catch_up(now=0.55)
+        history.record(game.frame)
+
+        assert len(history) == 6, "Every generation of the frame should be kept"
+        rebuilt = history.alive(5)
+        assert rebuilt is not None and np.array_equal(rebuilt, game.frame.alive)
+
+    def test_limits(self) -> None:
+        """
+        Test that the oldest generations are dropped past the generation limit or
+        the memory budget.
+        """
+        game = GameOfLife(16, 16)
+        history = History(16, 16, limit=5, keyframe_interval=2)
+        history.record(game.frame)
+        alive = []
+        for _ in range(12):
+            game.form_new_generation()
+            history.record(game.frame)
+            alive.append(game.frame.alive)
+
+        assert (history.oldest, history.newest) == (8, 12), "Only 5 generations kept"
+        rebuilt = history.alive(8)
+        assert rebuilt is not None and np.array_equal(rebuilt, alive[7])
+        assert history.alive(7) is None, "Dropped generations are unknown"
+
+        small = History(16, 16, memory_budget=0)
+        small.record(game.frame)
+        game.form_new_generation()
+        small.record(game.frame)
+        assert len(small) == 1 and small.newest == 13, "Budget keeps the newest only"
+
+    def test_restarts(self) -> None:
+        """
+        Test that the history restarts at a frame that does not continue it.
+        """
+        game = GameOfLife(16, 16, engine="hashlife")
+        history = History(16, 16)
+        history.record(game.frame)
+        game.advance(10)
+        history.record(game.frame)
+        assert (history.oldest, history.newest) == (10, 10), "Skipped generations"
+
+        history.clear()
+        assert len(history) == 0 and history.alive(10) is None
+
+    def test_truncate(self) -> None:
+        """
+        Test that truncating forgets the newer generations and keeps the older ones.
+        """
+        game = GameOfLife(16, 16)
+        history = History(16, 16, keyframe_interval=3)
+        history.record(game.frame)
+        alive = [game.frame.alive]
+        for _ in range(10):
+            game.form_new_generation()
+            history.record(game.frame)
+            alive.append(game.frame.alive)
+
+        truncated = history.truncate(4)
+        assert truncated is not None and np.array_equal(truncated, alive[4])
+        assert history.newest == 4 and history.truncate(5) is None
+        for generation in range(5):
+            rebuilt = history.alive(generation)
+            assert rebuilt is not None and np.array_equal(rebuilt, alive[generation])
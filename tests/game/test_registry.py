@@ -0,0 +1,123 @@
+import threading
+from typing import List
+
+import numpy as np
+import pytest
+
+from game import GameOfLife, GameRegistry
+
+
+class TestGameRegistry:
+    def test_add_and_get(self) -> None:
+        """
+        Test that games are kept under distinct IDs.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        first, second = GameOfLife(), GameOfLife()
+        first_id, second_id = registry.add(first), registry.add(second)
+
+        assert first_id != second_id, "Every game should get its own ID"
+        assert registry.get(first_id) is first
+        assert registry.get(second_id) is second
+        assert registry.get("unknown") is None
+        assert len(registry) == 2
+
+        registry.remove(first_id)
+        assert first_id not in registry, "Removed games should be gone"
+
+    def test_lookup_does_not_lock(self) -> None:
+        """
+        Test that looking up a game does not wait for the registry's lock.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        game = GameOfLife()
+        game_id = registry.add(game)
+
+        found = []
+        with registry._lock:
+            thread = threading.Thread(target=lambda: found.append(registry.get(game_id)))
+            thread.start()
+            thread.join(timeout=5)
+        assert found == [game], "Lookups should not wait for adding or removing games"
+
+    def test_lru_eviction(self) -> None:
+        """
+        Test that the least recently used game is evicted when the registry is full.
+        """
+        registry = GameRegistry(max_games=2, ttl=60, memory_budget=1 << 20)
+        first_id = registry.add(GameOfLife(), now=0)
+        second_id = registry.add(GameOfLife(), now=1)
+        registry.get(first_id, now=2)
+        third_id = registry.add(GameOfLife(), now=3)
+
+        assert second_id not in registry, "The least recently used game is evicted"
+        assert first_id in registry and third_id in registry
+
+    def test_ttl_expiry(self) -> None:
+        """
+        Test that games not looked up for longer than the TTL expire.
+        """
+        registry = GameRegistry(max_games=4, ttl=10, memory_budget=1 << 20)
+        game_id = registry.add(GameOfLife(), now=0)
+
+        assert game_id in registry and registry._games[game_id].used == 0, "Not used"
+        assert registry.get(game_id, now=9) is not None, "Game should not expire yet"
+        assert registry.get(game_id, now=25) is None, "Game should have expired"
+
+    def test_memory_budget(self) -> None:
+        """
+        Test that games are evicted to keep the estimated memory within the budget,
+        and that a game larger than the budget is rejected.
+        """
+        # Empty worlds, so that every game has the same size.
+        cells = np.zeros((100, 100), dtype=np.uint8)
+        budget = 2 * GameOfLife(100, 100, cells=cells).nbytes
+        registry = GameRegistry(max_games=10, ttl=60, memory_budget=budget)
+        for _ in range(3):
+            registry.add(GameOfLife(100, 100, cells=cells))
+
+        assert len(registry) == 2, "Only two games should fit into the budget"
+        assert registry.memory <= budget
+
+        with pytest.raises(MemoryError):
+            registry.add(GameOfLife(300, 300))
+
+    def test_memory_estimate(self) -> None:
+        """
+        Test that the memory of a game counts its history and frame besides its
+        engine.
+        """
+        game = GameOfLife(100, 100)
+        for _ in range(10):
+            game.form_new_generation()
+        frame = game.frame
+        assert frame.nbytes >= frame.alive.nbytes + sum(
+            born.nbytes + died.nbytes for born, died in frame.changes
+        )
+        assert game.nbytes == game.engine.nbytes + game.history.nbytes + frame.nbytes
+        frame.cells  # Builds the grid of the frame.
+        assert game.nbytes > game.engine.nbytes + game.history.nbytes + frame.alive.nbytes
+
+    def test_held_games(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that the engine of an evicted game is closed only once the last thread
+        holding the game released it.
+        """
+        registry = GameRegistry(max_games=1, ttl=60, memory_budget=1 << 20)
+        game = GameOfLife(8, 8)
+        closed: List[GameOfLife] = []
+        monkeypatch.setattr(game.engine, "close", lambda: closed.append(game))
+        game_id = registry.add(game)
+
+        assert registry.acquire(game_id) is game and registry.hold(game_id) is game
+        registry.add(GameOfLife(8, 8))
+        assert game_id not in registry and registry.hold(game_id) is None
+        registry.release(game)
+        assert not closed, "A held game should not be closed"
+        registry.release(game)
+        assert closed == [game], "The last release should close the game"
+
+        other = GameOfLife(8, 8)
+        monkeypatch.setattr(other.engine, "close", lambda: closed.append(other))
+        registry.remove(registry.add(other))
+        assert closed[-1] is other, "Games nobody holds should be closed right away"
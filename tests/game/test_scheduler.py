@@ -0,0 +1,101 @@
+from threading import Event, Thread
+
+from game import Scheduler, GameOfLife, GameRegistry
+
+
+class TestScheduler:
+    def test_tick(self) -> None:
+        """
+        Test that a tick forms the generations due at each game's velocity and
+        publishes a frame of every game that changed.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        fast, slow = GameOfLife(8, 8, velocity=0.1), GameOfLife(8, 8, velocity=1.0)
+        fast_id = registry.add(fast)
+        registry.add(slow)
+        scheduler = Scheduler(registry)
+
+        assert scheduler.tick(now=10.0) == 10.1, "Next due should be the fast game's"
+        assert scheduler.frame(fast_id) is not None, "New games should be published"
+
+        scheduler.tick(now=10.55)
+        frame = scheduler.frame(fast_id)
+        assert frame is not None and frame.generation == fast.life_count == 5
+        assert slow.life_count == 0, "Slow game should not be due yet"
+
+    def test_coalescing(self) -> None:
+        """
+        Test that a game that fell behind forms the missed generations at once and
+        publishes a single frame for them.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        game_id = registry.add(GameOfLife(8, 8, velocity=0.1))
+        scheduler = Scheduler(registry)
+        scheduler.tick(now=0.0)
+        scheduler.tick(now=1.05)
+
+        frame = scheduler.frame(game_id)
+        assert frame is not None and frame.generation == 10
+        assert scheduler.coalesced == 9, "Missed generations should be coalesced"
+        assert frame.changes_since(0) is not None, "Frame should keep every change"
+
+    def test_busy_games(self) -> None:
+        """
+        Test that a tick skips a game held by another thread instead of waiting for
+        it, and forms its generations once it is released.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        busy, idle = GameOfLife(8, 8, velocity=0.1), GameOfLife(8, 8, velocity=0.1)
+        registry.add(busy)
+        registry.add(idle)
+        scheduler = Scheduler(registry)
+        scheduler.tick(now=0.0)
+
+        held, released = Event(), Event()
+
+        def hold() -> None:
+            with busy.lock:
+                held.set()
+                released.wait()
+
+        holder = Thread(target=hold)
+        holder.start()
+        held.wait()
+        scheduler.tick(now=0.55)
+        assert busy.life_count == 0, "A held game should be skipped"
+        assert idle.life_count == 5, "Other games should not wait for it"
+
+        released.set()
+        holder.join()
+        scheduler.tick(now=0.55)
+        assert busy.life_count == 5, "A released game should catch up"
+
+    def test_removed_games(self) -> None:
+        """
+        Test that the frames of games that left the registry are forgotten.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        game_id = registry.add(GameOfLife(8, 8))
+        scheduler = Scheduler(registry)
+        scheduler.tick(now=0.0)
+
+        registry.remove(game_id)
+        scheduler.tick(now=0.1)
+        assert scheduler.frame(game_id) is None, "Removed games should be forgotten"
+
+    def test_background_thread(self) -> None:
+        """
+        Test that the background thread advances games and wakes up waiting readers.
+        """
+        registry = GameRegistry(max_games=4, ttl=60, memory_budget=1 << 20)
+        game_id = registry.add(GameOfLife(8, 8, velocity=0.01))
+        scheduler = Scheduler(registry)
+        scheduler.start()
+        try:
+            frame = scheduler.wait(game_id, None, timeout=5.0)
+            assert frame is not None, "A first frame should be published"
+            later = scheduler.wait(game_id, frame.generation, timeout=5.0)
+            assert later is not None and later.generation > frame.generation
+        finally:
+            scheduler.stop(timeout=5.0)
+        assert not scheduler.running, "Scheduler should stop"
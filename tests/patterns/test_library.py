@@ -0,0 +1,55 @@
+import os
+from pathlib import Path
+
+import numpy as np
+
+from core import config
+from game import GameOfLife
+from patterns import PatternLibrary, read_pattern, frame_pattern
+
+
+class TestPatternLibrary:
+    def test_index(self, tmp_path: Path) -> None:
+        """
+        Test that the catalogue is indexed from the pattern files of a directory,
+        leaving out other and unreadable files.
+        """
+        with open(os.path.join(tmp_path, "glider.rle"), "w") as file:
+            file.write("#N Glider\nx = 3, y = 3\nbo$2bo$3o!\n")
+        with open(os.path.join(tmp_path, "block.cells"), "w") as file:
+            file.write("OO\nOO\n")
+        with open(os.path.join(tmp_path, "broken.rle"), "w") as file:
+            file.write("#C no header\n")
+        with open(os.path.join(tmp_path, "notes.txt"), "w") as file:
+            file.write("not a pattern\n")
+
+        library = PatternLibrary(str(tmp_path))
+        assert len(library) == 2, "Only readable pattern files should be indexed"
+        assert library.choices() == [("block", "block"), ("glider", "Glider")]
+        entry = library.entry("glider")
+        assert entry is not None and (entry.width, entry.height) == (3, 3)
+        assert "broken" not in library and library.entry("broken") is None
+
+        pattern = library.load("glider")
+        assert pattern.name == "Glider" and len(pattern.cells) == 5
+        assert library.load("glider") is pattern, "Patterns should be read once"
+
+    def test_bundled(self) -> None:
+        """
+        Test that the bundled patterns can be read and seeded into a game.
+        """
+        library = PatternLibrary(config.patterns)
+        assert "glider" in library and "gosper-glider-gun" in library
+
+        game = GameOfLife(50, 50)
+        game.load_cells(library.load("pulsar").centered(50, 50).tolist())
+        start = game.frame.alive
+        for _ in range(3):
+            game.form_new_generation()
+        assert np.array_equal(game.frame.alive, start), "A pulsar has period 3"
+
+        pattern = frame_pattern(game.frame)
+        assert (pattern.width, pattern.height) == (50, 50)
+        entry = library.entry("pulsar")
+        assert entry is not None
+        assert len(pattern.cells) == len(read_pattern(entry.path).cells)
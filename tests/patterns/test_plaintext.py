@@ -0,0 +1,61 @@
+import io
+
+import numpy as np
+import pytest
+
+from patterns import Pattern, iter_cells, read_cells, write_cells, read_cells_header
+
+BLINKER = """!Name: Blinker
+!A comment
+.O
+.O
+.O
+"""
+
+
+class TestPlaintext:
+    def test_read(self) -> None:
+        """
+        Test that the name, size and cells of a plaintext pattern are read.
+        """
+        pattern = read_cells(io.StringIO(BLINKER))
+        assert pattern.name == "Blinker"
+        assert (pattern.width, pattern.height) == (2, 3)
+        assert pattern.cells.tolist() == [[0, 1], [1, 1], [2, 1]]
+        assert read_cells_header(io.StringIO(BLINKER)) == ("Blinker", 2, 3)
+
+    def test_read_invalid(self) -> None:
+        """
+        Test that unexpected characters are rejected.
+        """
+        with pytest.raises(ValueError):
+            read_cells(io.StringIO(".O\nx.\n"))
+
+    def test_read_bounded(self) -> None:
+        """
+        Test that rows past the largest size are rejected.
+        """
+        with pytest.raises(ValueError):
+            read_cells(io.StringIO(BLINKER), max_size=(2, 2))
+        with pytest.raises(ValueError):
+            read_cells(io.StringIO(BLINKER), max_size=(1, 3))
+        assert read_cells(io.StringIO(BLINKER), max_size=(2, 3)).height == 3
+
+    def test_write(self) -> None:
+        """
+        Test that written patterns are read back unchanged, empty rows included.
+        """
+        rng = np.random.default_rng(4)
+        grid = rng.random((30, 20)) < 0.3
+        grid[-1] = False
+        pattern = Pattern("Random", 20, 30, np.argwhere(grid).astype(np.int64))
+
+        file = io.StringIO()
+        write_cells(file, pattern)
+        assert file.getvalue().splitlines()[0] == "!Name: Random"
+        assert file.getvalue().endswith("\n\n"), "The empty last row should be kept"
+
+        read = read_cells(io.StringIO(file.getvalue()))
+        assert np.array_equal(read.cells, pattern.cells), "Cells should round-trip"
+        assert read.height == 30
+        assert sum(1 for _ in iter_cells(pattern)) == 31
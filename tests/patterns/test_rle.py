@@ -0,0 +1,78 @@
+import io
+
+import numpy as np
+import pytest
+
+from patterns import Pattern, iter_rle, read_rle, write_rle, read_rle_header
+
+GLIDER = """#N Glider
+#C A comment
+x = 3, y = 3, rule = B3/S23
+bo$2bo$3o!
+"""
+
+
+class TestRle:
+    def test_read(self) -> None:
+        """
+        Test that the name, size, rule and cells of an RLE pattern are read.
+        """
+        pattern = read_rle(io.StringIO(GLIDER))
+        assert pattern.name == "Glider" and pattern.rule == "B3/S23"
+        assert (pattern.width, pattern.height) == (3, 3)
+        assert pattern.cells.tolist() == [[0, 1], [1, 2], [2, 0], [2, 1], [2, 2]]
+        assert read_rle_header(io.StringIO(GLIDER)) == ("Glider", 3, 3)
+
+    def test_read_split_runs(self) -> None:
+        """
+        Test that run counts split by line breaks, empty rows and text after the end
+        are handled.
+        """
+        pattern = read_rle(io.StringIO("x = 0, y = 0\n1\n2o3$\no!\n3o"))
+        assert pattern.cells.tolist() == [[0, i] for i in range(12)] + [[3, 0]]
+        assert (pattern.width, pattern.height) == (12, 4), "Size grows to the cells"
+
+    def test_read_invalid(self) -> None:
+        """
+        Test that unexpected characters are rejected.
+        """
+        with pytest.raises(ValueError):
+            read_rle(io.StringIO("x = 2, y = 1\no%!"))
+        with pytest.raises(ValueError):
+            read_rle_header(io.StringIO("#C no header\n"))
+
+    def test_read_bounded(self) -> None:
+        """
+        Test that runs of alive cells past the size of the header, or past the
+        largest size, are rejected.
+        """
+        with pytest.raises(ValueError, match="width"):
+            read_rle(io.StringIO("x = 3, y = 3\n999999999o!"))
+        with pytest.raises(ValueError, match="height"):
+            read_rle(io.StringIO("x = 3, y = 1\no$o!"))
+        with pytest.raises(ValueError, match="larger"):
+            read_rle(io.StringIO(GLIDER), max_size=(2, 2))
+        with pytest.raises(ValueError, match="width"):
+            read_rle(io.StringIO("x = 0, y = 0\n4o!"), max_size=(3, 3))
+
+        pattern = read_rle(io.StringIO(GLIDER), max_size=(3, 3))
+        assert (pattern.width, pattern.height) == (3, 3)
+
+    def test_write(self) -> None:
+        """
+        Test that written patterns are read back unchanged and lines are wrapped.
+        """
+        rng = np.random.default_rng(3)
+        cells = np.argwhere(rng.random((40, 90)) < 0.3).astype(np.int64)
+        pattern = Pattern("Random", 90, 40, cells)
+
+        file = io.StringIO()
+        write_rle(file, pattern)
+        lines = file.getvalue().splitlines()
+        assert lines[0] == "#N Random" and lines[1].startswith("x = 90, y = 40")
+        assert max(map(len, lines[2:])) <= 70, "Lines should be wrapped"
+
+        read = read_rle(io.StringIO(file.getvalue()))
+        assert np.array_equal(read.cells, cells), "Cells should round-trip"
+        assert (read.width, read.height) == (90, 40)
+        assert "".join(iter_rle(read._replace(name=""))).endswith("!\n")
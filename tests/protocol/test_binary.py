@@ -0,0 +1,45 @@
+import pytest
+
+from game import GameOfLife
+from protocol import binary_payload, decode_binary_payload
+
+
+class TestBinaryPayload:
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_round_trip(self, compress: bool) -> None:
+        """
+        Test that decoding a binary snapshot gives back the game's world, the cells
+        that died in the last generation and the generation.
+        """
+        game = GameOfLife(37, 23)
+        game.advance(5)
+
+        generation, world, died = decode_binary_payload(
+            binary_payload(game.frame, compress)
+        )
+        assert generation == 5, "Generation should be the life count"
+        assert world.tolist() == game.world, "Alive cells should match the world"
+        assert died.ravel().nonzero()[0].tolist() == game.engine.changes()[1].tolist()
+
+    def test_size(self) -> None:
+        """
+        Test that an uncompressed snapshot takes one bit per cell for each bitmap
+        after the 24 byte header, and that compression shrinks a stable world.
+        """
+        game = GameOfLife(40, 40)
+        assert len(binary_payload(game.frame, compress=False)) == 24 + 2 * 200
+
+        game.world = [[False] * 40 for _ in range(40)]
+        assert (
+            len(binary_payload(game.frame)) < 24 + 2 * 200
+        ), "Empty world should compress"
+
+    def test_invalid_payload(self) -> None:
+        """
+        Test that payloads that are not binary snapshots are rejected.
+        """
+        payload = binary_payload(GameOfLife(8, 8).frame)
+        with pytest.raises(ValueError):
+            decode_binary_payload(b"JSON" + payload[4:])
+        with pytest.raises(ValueError):
+            decode_binary_payload(payload[:10])
@@ -0,0 +1,71 @@
+import json
+
+import pytest
+
+from game import GameOfLife
+from protocol import FrameCache, encode_frame, decode_binary_payload
+
+
+class TestFrameCache:
+    def test_serialized_once(self) -> None:
+        """
+        Test that a payload is serialized once and served from the cache afterwards.
+        """
+        cache = FrameCache(8)
+        frame = GameOfLife(8, 8).frame
+
+        first = cache.payload("game", frame, "world")
+        second = cache.payload("game", frame, "world")
+        assert first is second, "Repeated requests should share the payload"
+        assert (cache.hits, cache.misses) == (1, 1)
+        assert json.loads(first.body)["world"] == frame.world
+
+    def test_keys(self) -> None:
+        """
+        Test that payloads are kept apart by game, frame, format and delta start.
+        """
+        cache = FrameCache(8)
+        game = GameOfLife(8, 8)
+        frame = game.frame
+        game.form_new_generation()
+
+        etags = {
+            cache.payload("game", frame, "world").etag,
+            cache.payload("other", frame, "world").etag,
+            cache.payload("game", game.frame, "world").etag,
+            cache.payload("game", game.frame, "binary").etag,
+            cache.payload("game", game.frame, "delta", 0).etag,
+            cache.payload("game", game.frame, "delta", 1).etag,
+        }
+        assert len(etags) == len(cache) == 6, "Every payload should have its own tag"
+        restarted = FrameCache(8).payload("game", frame, "world").etag
+        assert restarted not in etags, "Tags should not match after a restart"
+
+        generation, _, _ = decode_binary_payload(
+            cache.payload("game", game.frame, "binary").body
+        )
+        assert generation == 1
+
+    def test_ring_buffer(self) -> None:
+        """
+        Test that the oldest payload is overwritten when the cache is full.
+        """
+        cache = FrameCache(2)
+        frame = GameOfLife(8, 8).frame
+        first = cache.payload("first", frame, "snapshot")
+        cache.payload("second", frame, "snapshot")
+        cache.payload("third", frame, "snapshot")
+
+        assert len(cache) == 2, "Cache should not grow beyond its capacity"
+        assert cache.payload("first", frame, "snapshot") is not first
+        assert cache.misses == 4, "Overwritten payloads should be serialized again"
+
+    def test_unknown_format(self) -> None:
+        """
+        Test that unknown formats and deltas without a start are rejected.
+        """
+        frame = GameOfLife(8, 8).frame
+        with pytest.raises(ValueError):
+            encode_frame(frame, "xml")
+        with pytest.raises(ValueError):
+            encode_frame(frame, "delta")
@@ -0,0 +1,50 @@
+from game import GameOfLife
+from protocol import delta_payload, world_payload
+
+
+class TestDeltaPayload:
+    def test_delta(self) -> None:
+        """
+        Test that a delta payload only holds the changes since the given generation.
+        """
+        game = GameOfLife(6, 6)
+        world = [[False] * 6 for _ in range(6)]
+        world[2][1:4] = [True, True, True]  # blinker
+        game.world = world
+        game.form_new_generation()
+
+        payload = delta_payload(game.frame, 0)
+        assert payload["type"] == "delta", "Recent changes should be sent as delta"
+        assert payload["life_count"] == 1
+        assert payload["born"] == [1 * 6 + 2, 3 * 6 + 2]
+        assert payload["died"] == [2 * 6 + 1, 2 * 6 + 3]
+
+        game.form_new_generation()
+        payload = delta_payload(game.frame, 0)
+        assert payload["born"] == payload["died"] == [], "Blinker should be back"
+        assert payload["period"] == 2 and payload["stabilized_at"] == 0
+        assert payload["stopped"] is False, "Games do not stop by default"
+
+    def test_snapshot_fallback(self) -> None:
+        """
+        Test that a client too far behind receives a snapshot of the whole world.
+        """
+        game = GameOfLife(6, 6)
+        game.advance(GameOfLife.CHANGES_LIMIT + 1)
+
+        payload = delta_payload(game.frame, 0)
+        assert payload["type"] == "snapshot", "Old changes should fall back to snapshot"
+        assert (payload["width"], payload["height"]) == (6, 6)
+        world = [cell for row in game.world for cell in row]
+        assert payload["alive"] == [i for i, cell in enumerate(world) if cell]
+
+    def test_world_payload(self) -> None:
+        """
+        Test that the original payload holds the full current and previous worlds.
+        """
+        game = GameOfLife(4, 4)
+        game.form_new_generation()
+
+        payload = world_payload(game.frame)
+        assert payload["world"] == game.world
+        assert payload["previous_world"] == game.previous_world
@@ -0,0 +1,103 @@
+import struct
+from typing import List, Tuple
+
+import numpy as np
+import pytest
+import numpy.typing as npt
+
+from game import GameOfLife
+from render import MAX_ANIMATION_PIXELS, encode_gif, render_gif, frame_image
+
+
+def _lzw_decode(data: bytes, min_code_size: int) -> List[int]:
+    # A plain GIF LZW decoder, with variable code widths.
+    clear, end = 1 << min_code_size, (1 << min_code_size) + 1
+    bits = int.from_bytes(data, "little")
+    offset, width, table = 0, min_code_size + 1, []
+    pixels: List[int] = []
+    previous: List[int] = []
+    while True:
+        code = (bits >> offset) & ((1 << width) - 1)
+        offset += width
+        if code == clear:
+            table = [[i] for i in range(clear)] + [[], []]
+            width, previous = min_code_size + 1, []
+            continue
+        if code == end:
+            return pixels
+        if code < len(table):
+            entry = table[code]
+            if previous:
+                table.append(previous + entry[:1])
+        else:
+            entry = previous + previous[:1]
+            table.append(entry)
+        pixels += entry
+        previous = entry
+        if len(table) == 1 << width and width < 12:
+            width += 1
+
+
+def _decode(gif: bytes) -> Tuple[int, List[npt.NDArray[np.uint8]]]:
+    assert gif[:6] == b"GIF89a" and gif[-1:] == b"\x3b"
+    width, height, packed = struct.unpack("<HHB", gif[6:11])
+    offset = 13 + 3 * (2 << (packed & 7))
+    images, delay = [], 0
+    while gif[offset] != 0x3B:
+        if gif[offset] == 0x21:
+            if gif[offset + 1] == 0xF9:
+                (delay,) = struct.unpack("<H", gif[offset + 4 : offset + 6])  # noqa: E203
+            offset += 2
+            while gif[offset]:
+                offset += gif[offset] + 1
+            offset += 1
+            continue
+        assert gif[offset] == 0x2C, "Expected an image descriptor"
+        min_code_size = gif[offset + 10]
+        offset += 11
+        data = b""
+        while gif[offset]:
+            data += gif[offset + 1 : offset + 1 + gif[offset]]  # noqa: E203
+            offset += gif[offset] + 1
+        offset += 1
+        pixels = _lzw_decode(data, min_code_size)
+        images.append(np.array(pixels, dtype=np.uint8).reshape(height, width))
+    return delay, images
+
+
+class TestGif:
+    def test_encode(self) -> None:
+        """
+        Test that every image round-trips through a standard LZW decoder, including
+        images spanning several sub-blocks.
+        """
+        rng = np.random.default_rng(1)
+        images = [rng.integers(0, 4, (37, 29), dtype=np.uint8) for _ in range(3)]
+        delay, decoded = _decode(encode_gif(images, 0.25))
+        assert delay == 25, "Delay should be in centiseconds"
+        assert len(decoded) == len(images), "Every image should be a frame"
+        for image, pixels in zip(images, decoded):
+            assert np.array_equal(image, pixels), "Pixels should round-trip"
+
+    def test_render(self) -> None:
+        """
+        Test that frames are rendered in order.
+        """
+        game = GameOfLife(9, 5)
+        frames = [game.frame]
+        for _ in range(3):
+            game.form_new_generation()
+            frames.append(game.frame)
+
+        _, images = _decode(render_gif(frames, 0.1, 2))
+        for frame, image in zip(frames, images):
+            assert np.array_equal(image, frame_image(frame, 2))
+
+    def test_too_large(self) -> None:
+        """
+        Test that animations larger than the limit are rejected.
+        """
+        frame = GameOfLife(64, 64).frame
+        frames = [frame] * (MAX_ANIMATION_PIXELS // (64 * 64) + 1)
+        with pytest.raises(ValueError):
+            render_gif(frames, 0.1)
@@ -0,0 +1,73 @@
+import zlib
+import struct
+from typing import Dict
+
+import numpy as np
+import pytest
+import numpy.typing as npt
+
+from game import GameOfLife
+from render import PALETTE, MAX_PIXELS, encode_png, render_png, frame_image
+
+
+def _decode(png: bytes) -> Dict[bytes, bytes]:
+    assert png[:8] == b"\x89PNG\r\n\x1a\n", "PNG should start with its signature"
+    chunks, offset = {}, 8
+    while offset < len(png):
+        (length,) = struct.unpack_from(">I", png, offset)
+        tag = png[offset + 4 : offset + 8]  # noqa: E203
+        data = png[offset + 8 : offset + 8 + length]  # noqa: E203
+        (crc,) = struct.unpack_from(">I", png, offset + 8 + length)
+        assert crc == zlib.crc32(tag + data), f"{tag!r} chunk should have a valid CRC"
+        chunks[tag] = data
+        offset += 12 + length
+    return chunks
+
+
+def _pixels(png: bytes) -> npt.NDArray[np.uint8]:
+    chunks = _decode(png)
+    width, height, depth, color_type = struct.unpack(">IIBB", chunks[b"IHDR"][:10])
+    assert depth == 2 and color_type == 3, "PNG should be 2-bit indexed"
+    rows = np.frombuffer(zlib.decompress(chunks[b"IDAT"]), dtype=np.uint8)
+    rows = rows.reshape(height, -1)
+    assert not rows[:, 0].any(), "Rows should not be filtered"
+    pixels = np.stack([(rows[:, 1:] >> shift) & 3 for shift in (6, 4, 2, 0)], axis=2)
+    return pixels.reshape(height, -1)[:, :width]
+
+
+class TestPng:
+    def test_encode(self) -> None:
+        """
+        Test that every pixel is packed, including rows whose width is not a
+        multiple of four.
+        """
+        image = np.random.default_rng(0).integers(0, 4, (7, 13), dtype=np.uint8)
+        png = encode_png(image)
+        assert np.array_equal(_pixels(png), image), "Pixels should round-trip"
+        assert _decode(png)[b"PLTE"] == bytes(np.array(PALETTE, dtype=np.uint8).ravel())
+
+    def test_render(self) -> None:
+        """
+        Test that alive, just died and dead cells are rendered as scaled squares.
+        """
+        game = GameOfLife(11, 6)
+        game.form_new_generation()
+        frame = game.frame
+        image = frame_image(frame, 3)
+        assert image.shape == (18, 33), "Every cell should be a 3x3 square"
+        assert np.array_equal(image[::3, ::3], image[2::3, 2::3])
+
+        cells = image[::3, ::3]
+        assert np.array_equal(cells == 1, frame.cells.astype(bool)), "Alive cells"
+        assert np.array_equal(cells == 2, frame.previous_cells > frame.cells)
+        assert np.array_equal(_pixels(render_png(frame, 3)), image)
+
+    def test_too_large(self) -> None:
+        """
+        Test that images larger than the limit and invalid scales are rejected.
+        """
+        frame = GameOfLife(64, 64).frame
+        with pytest.raises(ValueError):
+            frame_image(frame, int((MAX_PIXELS / 64 / 64) ** 0.5) + 1)
+        with pytest.raises(ValueError):
+            frame_image(frame, 0)
@@ -0,0 +1,345 @@
+import io
+import json
+
+import pytest
+
+import main
+from core import config
+from game import GameOfLife
+from main import app, games, scheduler
+
+
+class TestLifeStream:
+    def test_stream(self) -> None:
+        """
+        Test that the stream starts with a snapshot and pushes deltas since the last
+        pushed generation.
+        """
+        game_id = games.add(GameOfLife(8, 8, velocity=0.01))
+        response = app.test_client().get(f"/life/stream?game={game_id}")
+        assert response.mimetype == "text/event-stream"
+
+        events = response.iter_encoded()
+        snapshot = json.loads(next(events).decode().removeprefix("data: "))
+        delta = json.loads(next(events).decode().removeprefix("data: "))
+        response.close()
+
+        assert snapshot["type"] == "snapshot", "The first event should be a snapshot"
+        assert delta["type"] == "delta", "Later events should be deltas"
+        assert delta["since"] == snapshot["life_count"] < delta["life_count"]
+
+    def test_stream_ends_when_stopped(self) -> None:
+        """
+        Test that the stream of a stopped game ends with its last frame.
+        """
+        game = GameOfLife(8, 8, velocity=3600, auto_stop=True)
+        game.load_cells([(3, 3), (3, 4), (4, 3), (4, 4)])
+        game_id = games.add(game)
+        game.simulate(2)
+        scheduler.publish(game_id, game)
+        assert game.stopped
+
+        response = app.test_client().get(f"/life/stream?game={game_id}&since=2")
+        events = list(response.iter_encoded())
+        assert len(events) == 1, "The stream should end with the last frame"
+        delta = json.loads(events[0].decode().removeprefix("data: "))
+        assert delta["stopped"] and delta["born"] == delta["died"] == []
+
+
+class TestLife:
+    def test_games_are_independent(self) -> None:
+        """
+        Test that every session gets its own game.
+        """
+        first, second = app.test_client(), app.test_client()
+        first.get("/life")
+        second.get("/life")
+
+        with first.session_transaction() as session:
+            first_id = session["game"]
+        with second.session_transaction() as session:
+            second_id = session["game"]
+        assert first_id != second_id, "Every session should get its own game"
+
+    def test_unknown_games(self) -> None:
+        """
+        Test that unknown games are not found instead of replaced by new games.
+        """
+        client = app.test_client()
+        count = len(games)
+        assert client.get("/life?game=unknown").status_code == 404
+        assert client.post("/life?game=unknown").status_code == 404
+        assert client.post("/life").status_code == 404, "The session has no game"
+        assert len(games) == count, "No game should be created"
+
+        assert client.get("/life").status_code == 200, "The page creates a game"
+        assert len(games) == count + 1
+        assert client.post("/life").status_code == 200
+
+    def test_reads_do_not_advance(self) -> None:
+        """
+        Test that requests read the published frame instead of forming generations,
+        unless they skip ahead explicitly.
+        """
+        game = GameOfLife(8, 8, velocity=3600)
+        game_id = games.add(game)
+        client = app.test_client()
+
+        for _ in range(3):
+            payload = client.post(f"/life?game={game_id}&since=0").get_json()
+            assert payload["life_count"] == game.life_count == 0
+
+        payload = client.post(f"/life?game={game_id}&since=0&steps=5").get_json()
+        assert game.life_count == payload["life_count"] == 5, "Steps should skip ahead"
+        frame = scheduler.frame(game_id)
+        assert frame is not None and frame.generation == 5, "New frame is published"
+
+    def test_steps_limit(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that a game is skipped ahead by at most `max_steps` generations, unless
+        it runs on the HashLife engine, which gives up after its timeout instead.
+        """
+        game = GameOfLife(8, 8, velocity=3600)
+        game_id = games.add(game)
+        client = app.test_client()
+
+        for steps in (0, config.max_steps + 1):
+            response = client.post(f"/life?game={game_id}&steps={steps}")
+            assert response.status_code == 400, f"{steps} steps should be rejected"
+        assert game.life_count == 0
+
+        game = GameOfLife(8, 8, velocity=3600, engine="hashlife")
+        game_id = games.add(game)
+        response = client.post(f"/life?game={game_id}&steps={config.max_steps + 1}")
+        assert response.status_code == 200, "HashLife should jump any distance"
+        assert game.life_count == config.max_steps + 1
+
+        monkeypatch.setattr(config, "hashlife_timeout", 1e-6)
+        response = client.post(f"/life?game={game_id}&steps={1 << 40}")
+        assert response.status_code == 400, "Jumps should give up after the timeout"
+        assert game.life_count == config.max_steps + 1, "The game should be unchanged"
+
+    def test_not_modified(self) -> None:
+        """
+        Test that a viewer that already has the payload of the current frame gets an
+        empty 304 response.
+        """
+        game_id = games.add(GameOfLife(8, 8, velocity=3600))
+        client = app.test_client()
+        url = f"/life?game={game_id}&since=0"
+
+        response = client.post(url)
+        assert response.status_code == 200 and response.headers["ETag"]
+        response = client.post(url, headers={"If-None-Match": response.headers["ETag"]})
+        assert response.status_code == 304, "Unchanged payloads should not be resent"
+        assert response.data == b""
+
+        response = client.post(f"{url}&steps=1", headers={"If-None-Match": "stale"})
+        assert response.status_code == 200, "A new frame should be sent"
+
+
+class TestRender:
+    def test_frame_png(self) -> None:
+        """
+        Test that the last frame is rendered as a cached PNG image.
+        """
+        game_id = games.add(GameOfLife(8, 8, velocity=3600))
+        client = app.test_client()
+
+        response = client.get(f"/life/frame.png?game={game_id}&scale=2")
+        assert response.status_code == 200 and response.mimetype == "image/png"
+        etag = response.headers["ETag"]
+        response = client.get(
+            f"/life/frame.png?game={game_id}&scale=2", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 304, "Rendered images should be cached"
+
+        response = client.get(f"/life/frame.png?game={game_id}&scale=0")
+        assert response.status_code == 400, "Invalid scales should be rejected"
+
+    def test_animation_gif(self) -> None:
+        """
+        Test that only the generations the history keeps can be animated.
+        """
+        game = GameOfLife(8, 8, velocity=3600)
+        game_id = games.add(game)
+        for _ in range(5):
+            game.form_new_generation()
+        scheduler.publish(game_id, game)
+        client = app.test_client()
+
+        response = client.get(f"/life/animation.gif?game={game_id}&from=1&to=4")
+        assert response.status_code == 200 and response.mimetype == "image/gif"
+        assert response.data.count(b"\x21\xf9") == 4, "Every generation is a frame"
+
+        response = client.get(f"/life/animation.gif?game={game_id}&to=6")
+        assert response.status_code == 400, "Future generations are unknown"
+
+    def test_animation_too_large(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """
+        Test that animations with too many pixels are rejected before any generation
+        is rebuilt from the history.
+        """
+        game = GameOfLife(8, 8, velocity=3600)
+        game_id = games.add(game)
+        for _ in range(5):
+            game.form_new_generation()
+        scheduler.publish(game_id, game)
+        monkeypatch.setattr(main, "MAX_ANIMATION_PIXELS", 4 * 8 * 8)
+        monkeypatch.setattr(game, "snapshot", lambda generation: pytest.fail())
+        client = app.test_client()
+
+        response = client.get(f"/life/animation.gif?game={game_id}&from=1&to=5&scale=1")
+        assert response.status_code == 400, "Five frames are too many pixels"
+
+
+class TestHistory:
+    def test_scrub_and_rewind(self) -> None:
+        """
+        Test that earlier generations are served from the history and that the game
+        can be rewound to them.
+        """
+        game = GameOfLife(8, 8, velocity=3600)
+        game_id = games.add(game)
+        worlds = [game.frame.alive.tolist()]
+        for _ in range(3):
+            game.form_new_generation()
+            worlds.append(game.frame.alive.tolist())
+        client = app.test_client()
+
+        response = client.get(f"/life/history?game={game_id}")
+        assert response.get_json() == {"oldest": 0, "newest": 3}
+
+        response = client.get(f"/life/history?game={game_id}&generation=1")
+        payload = response.get_json()
+        assert payload["life_count"] == 1 and payload["alive"] == worlds[1]
+        assert game.life_count == 3, "Scrubbing should not change the game"
+        response = client.get(f"/life/history?game={game_id}&generation=7")
+        assert response.status_code == 404, "Future generations are unknown"
+
+        response = client.post(f"/life/rewind?game={game_id}&generation=2")
+        payload = response.get_json()
+        assert payload["life_count"] == 2 and payload["alive"] == worlds[2]
+        assert game.life_count == 2, "The game should be rewound"
+        assert client.post(f"/life/rewind?game={game_id}").status_code == 400
+
+
+class TestPatterns:
+    def test_seed_from_library(self) -> None:
+        """
+        Test that the form seeds the new world with a centered library pattern.
+        """
+        app.config["WTF_CSRF_ENABLED"] = False
+        client = app.test_client()
+        data = {"width": 40, "height": 40, "velocity": 1.0, "engine": "numpy"}
+
+        response = client.post("/", data={**data, "pattern": "glider"})
+        assert response.status_code == 302, "The game should be created"
+        with client.session_transaction() as session:
+            game = games.get(session["game"])
+        assert game is not None and game.frame.alive.tolist() == [
+            18 * 40 + 19,
+            19 * 40 + 20,
+            20 * 40 + 18,
+            20 * 40 + 19,
+            20 * 40 + 20,
+        ]
+
+        response = client.post("/", data={**data, "pattern": "missing"})
+        assert response.status_code == 200, "Unknown patterns should be rejected"
+
+    def test_upload_and_export(self) -> None:
+        """
+        Test that an uploaded pattern seeds the world and that the world is exported
+        in both formats.
+        """
+        app.config["WTF_CSRF_ENABLED"] = False
+        client = app.test_client()
+        data = {"width": 40, "height": 40, "velocity": 1.0, "engine": "numpy"}
+
+        upload = (io.BytesIO(b"OO\nOO\n"), "block.cells")
+        response = client.post("/", data={**data, "upload": upload})
+        assert response.status_code == 302, "The game should be created"
+
+        response = client.get("/life/pattern.rle")
+        assert response.status_code == 200
+        assert response.data.decode().splitlines()[1:] == [
+            "x = 40, y = 40, rule = B3/S23",
+            "19$19b2o$19b2o!",
+        ]
+        response = client.get("/life/pattern.cells")
+        assert response.data.decode().splitlines()[20:22] == ["." * 19 + "OO"] * 2
+
+        upload = (io.BytesIO(b"x = 50, y = 1\n50o!\n"), "line.rle")
+        response = client.post("/", data={**data, "upload": upload})
+        assert response.status_code == 200, "Patterns larger than the world fail"
+        assert client.get("/life/pattern.txt").status_code == 404
+
+        upload = (io.BytesIO(b"x = 2, y = 1\n999999999o!\n"), "line.rle")
+        response = client.post("/", data={**data, "upload": upload})
+        assert response.status_code == 200, "Runs past the header should fail"
+
+        upload = (io.BytesIO(b"O" * (app.config["MAX_CONTENT_LENGTH"] + 1)), "a.cells")
+        response = client.post("/", data={**data, "upload": upload})
+        assert response.status_code == 413, "Large uploads should not be read"
+
+    def test_engines(self) -> None:
+        """
+        Test that the form does not offer the parallel engine.
+        """
+        app.config["WTF_CSRF_ENABLED"] = False
+        client = app.test_client()
+        data = {"width": 40, "height": 40, "velocity": 1.0, "engine": "parallel"}
+
+        response = client.post("/", data=data)
+        assert response.status_code == 200, "The parallel engine should be rejected"
+        response = client.post("/", data={**data, "engine": "sparse"})
+        assert response.status_code == 302, "Other engines should be accepted"
+
+    def test_rule(self) -> None:
+        """
+        Test that the form creates games of a Life-like rule, which the exported
+        pattern names, and rejects rules the neighborhood cannot follow.
+        """
+        app.config["WTF_CSRF_ENABLED"] = False
+        client = app.test_client()
+        data = {"width": 40, "height": 40, "velocity": 1.0, "engine": "numpy"}
+
+        rule = {"rule": "B2/S3", "neighborhood": "vonneumann"}
+        upload = (io.BytesIO(b"OO\nOO\n"), "block.cells")
+        response = client.post("/", data={**data, "upload": upload, **rule})
+        assert response.status_code == 302, "The game should follow the rule"
+        assert client.get("/life/pattern.rle").data.decode().splitlines()[1] == (
+            "x = 40, y = 40, rule = B2/S3V"
+        )
+        rule = {"rule": "B36/S23", "neighborhood": "vonneumann"}
+        upload = (io.BytesIO(b"OO\nOO\n"), "block.cells")
+        response = client.post("/", data={**data, "upload": upload, **rule})
+        assert response.status_code == 200, "Unreachable counts should be rejected"
+
+
+class TestMetrics:
+    def test_metrics(self) -> None:
+        """
+        Test that the metrics of the generations, payloads and games are exposed in
+        the Prometheus text format.
+        """
+        game = GameOfLife(8, 8, velocity=3600)
+        game_id = games.add(game)
+        client = app.test_client()
+        client.post(f"/life?game={game_id}&steps=1")
+        client.post(f"/life?game={game_id}&format=binary")
+
+        response = client.get("/metrics")
+        assert response.status_code == 200 and response.mimetype == "text/plain"
+        lines = response.data.decode().splitlines()
+        assert f"life_games {len(games)}" in lines, "Games in memory are read on scrape"
+        for sample in (
+            "life_generation_seconds_count",
+            "life_alive_cells_count",
+            'life_serialize_seconds_count{kind="binary"}',
+            'life_response_bytes_count{endpoint="life"}',
+            "life_frame_cache_misses_total",
+            "life_scheduler_lag_seconds",
+        ):
+            assert any(line.startswith(sample + " ") for line in lines), sample